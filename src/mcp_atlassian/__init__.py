@@ -29,7 +29,9 @@ if is_env_truthy("MCP_VERBOSE"):
 logging_stream = sys.stdout if is_env_truthy("MCP_LOGGING_STDOUT") else sys.stderr
 
 # Set up logging using the utility function
-logger = setup_logging(logging_level, logging_stream)
+logger = setup_logging(
+    logging_level, logging_stream, use_queue=is_env_truthy("MCP_LOGGING_QUEUE")
+)
 
 
 @click.version_option(__version__, prog_name="mcp-atlassian")
@@ -202,7 +204,11 @@ def main(
     logging_stream = sys.stdout if is_env_truthy("MCP_LOGGING_STDOUT") else sys.stderr
 
     global logger
-    logger = setup_logging(current_logging_level, logging_stream)
+    logger = setup_logging(
+        current_logging_level,
+        logging_stream,
+        use_queue=is_env_truthy("MCP_LOGGING_QUEUE"),
+    )
     logger.debug(f"Logging level set to: {logging.getLevelName(current_logging_level)}")
     logger.debug(
         f"Logging stream set to: {'stdout' if logging_stream is sys.stdout else 'stderr'}"
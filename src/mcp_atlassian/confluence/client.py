@@ -8,7 +8,7 @@ from requests import Session
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..utils.auth import configure_server_pat_auth
-from ..utils.logging import get_masked_session_headers, log_config_param, mask_sensitive
+from ..utils.logging import LazyMask, get_masked_session_headers, log_config_param
 from ..utils.oauth import configure_oauth_session
 from ..utils.ssl import configure_ssl_verification
 from .config import ConfluenceConfig
@@ -59,10 +59,11 @@ class ConfluenceClient:
             )
         elif self.config.auth_type == "pat":
             logger.debug(
-                f"Initializing Confluence client with Token (PAT) auth. "
-                f"URL: {self.config.url}, "
-                f"Token (masked): {mask_sensitive(str(self.config.personal_token))}, "
-                f"Is Cloud: {self.config.is_cloud}"
+                "Initializing Confluence client with Token (PAT) auth. "
+                "URL: %s, Token (masked): %s, Is Cloud: %s",
+                self.config.url,
+                LazyMask(str(self.config.personal_token)),
+                self.config.is_cloud,
             )
             
             if self.config.is_cloud:
@@ -86,17 +87,22 @@ class ConfluenceClient:
                     verify_ssl=self.config.ssl_verify,
                 )
                 
-                logger.debug(
-                    f"Confluence Server/DC client initialized with Bearer auth. "
-                    f"Session headers (Authorization masked): "
-                    f"{get_masked_session_headers(dict(self.confluence._session.headers))}"
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Confluence Server/DC client initialized with Bearer auth. "
+                        "Session headers (Authorization masked): %s",
+                        get_masked_session_headers(
+                            dict(self.confluence._session.headers)
+                        ),
+                    )
         else:  # basic auth
             logger.debug(
-                f"Initializing Confluence client with Basic auth. "
-                f"URL: {self.config.url}, Username: {self.config.username}, "
-                f"API Token present: {bool(self.config.api_token)}, "
-                f"Is Cloud: {self.config.is_cloud}"
+                "Initializing Confluence client with Basic auth. "
+                "URL: %s, Username: %s, API Token present: %s, Is Cloud: %s",
+                self.config.url,
+                self.config.username,
+                bool(self.config.api_token),
+                self.config.is_cloud,
             )
             self.confluence = Confluence(
                 url=self.config.url,
@@ -105,11 +111,12 @@ class ConfluenceClient:
                 cloud=self.config.is_cloud,
                 verify_ssl=self.config.ssl_verify,
             )
-            logger.debug(
-                f"Confluence client initialized. "
-                f"Session headers (Authorization masked): "
-                f"{get_masked_session_headers(dict(self.confluence._session.headers))}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Confluence client initialized. "
+                    "Session headers (Authorization masked): %s",
+                    get_masked_session_headers(dict(self.confluence._session.headers)),
+                )
 
         # Configure SSL verification using the shared utility
         configure_ssl_verification(
@@ -180,10 +187,11 @@ class ConfluenceClient:
         except Exception as e:
             error_msg = f"Confluence authentication validation failed: {e}"
             logger.error(error_msg)
-            logger.debug(
-                f"Authentication headers during failure: "
-                f"{get_masked_session_headers(dict(self.confluence._session.headers))}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Authentication headers during failure: %s",
+                    get_masked_session_headers(dict(self.confluence._session.headers)),
+                )
             raise MCPAtlassianAuthenticationError(error_msg) from e
 
     def _apply_custom_headers(self) -> None:
@@ -2,18 +2,20 @@
 
 import logging
 import os
+import threading
 from typing import Any, Literal
 
 from atlassian import Jira
+from cachetools import TTLCache
 from requests import Session
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.preprocessing import JiraPreprocessor
 from mcp_atlassian.utils.auth import configure_server_pat_auth
 from mcp_atlassian.utils.logging import (
+    LazyMask,
     get_masked_session_headers,
     log_config_param,
-    mask_sensitive,
 )
 from mcp_atlassian.utils.oauth import configure_oauth_session
 from mcp_atlassian.utils.ssl import configure_ssl_verification
@@ -29,6 +31,10 @@ class JiraClient(DevelopmentMixin):
     """Base client for Jira API interactions with development information support."""
 
     _field_ids_cache: list[dict[str, Any]] | None
+    _project_issue_types_cache: TTLCache[str, list[dict[str, Any]]]
+    _required_fields_cache: TTLCache[tuple[str, str], dict[str, Any]]
+    _field_metadata_cache: TTLCache[tuple[str | int, ...], Any]
+    _metadata_cache_lock: threading.Lock
     _current_user_account_id: str | None
 
     config: JiraConfig
@@ -75,10 +81,11 @@ class JiraClient(DevelopmentMixin):
             )
         elif self.config.auth_type == "pat":
             logger.debug(
-                f"Initializing Jira client with Token (PAT) auth. "
-                f"URL: {self.config.url}, "
-                f"Token (masked): {mask_sensitive(str(self.config.personal_token))}, "
-                f"Is Cloud: {self.config.is_cloud}"
+                "Initializing Jira client with Token (PAT) auth. "
+                "URL: %s, Token (masked): %s, Is Cloud: %s",
+                self.config.url,
+                LazyMask(str(self.config.personal_token)),
+                self.config.is_cloud,
             )
             
             if self.config.is_cloud:
@@ -102,17 +109,20 @@ class JiraClient(DevelopmentMixin):
                     verify_ssl=self.config.ssl_verify,
                 )
                 
-                logger.debug(
-                    f"Jira Server/DC client initialized with Bearer auth. "
-                    f"Session headers (Authorization masked): "
-                    f"{get_masked_session_headers(dict(self.jira._session.headers))}"
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Jira Server/DC client initialized with Bearer auth. "
+                        "Session headers (Authorization masked): %s",
+                        get_masked_session_headers(dict(self.jira._session.headers)),
+                    )
         else:  # basic auth
             logger.debug(
-                f"Initializing Jira client with Basic auth. "
-                f"URL: {self.config.url}, Username: {self.config.username}, "
-                f"API Token present: {bool(self.config.api_token)}, "
-                f"Is Cloud: {self.config.is_cloud}"
+                "Initializing Jira client with Basic auth. "
+                "URL: %s, Username: %s, API Token present: %s, Is Cloud: %s",
+                self.config.url,
+                self.config.username,
+                bool(self.config.api_token),
+                self.config.is_cloud,
             )
             self.jira = Jira(
                 url=self.config.url,
@@ -121,10 +131,12 @@ class JiraClient(DevelopmentMixin):
                 cloud=self.config.is_cloud,
                 verify_ssl=self.config.ssl_verify,
             )
-            logger.debug(
-                f"Jira client initialized. Session headers (Authorization masked): "
-                f"{get_masked_session_headers(dict(self.jira._session.headers))}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Jira client initialized. "
+                    "Session headers (Authorization masked): %s",
+                    get_masked_session_headers(dict(self.jira._session.headers)),
+                )
 
         # Configure SSL verification using the shared utility
         configure_ssl_verification(
@@ -165,6 +177,13 @@ class JiraClient(DevelopmentMixin):
             disable_translation=self.config.disable_jira_markup_translation,
         )
         self._field_ids_cache = None
+        # Project metadata rarely changes; cache it per fetcher (and thus per user)
+        self._project_issue_types_cache = TTLCache(maxsize=256, ttl=300)
+        self._required_fields_cache = TTLCache(maxsize=256, ttl=300)
+        self._field_metadata_cache = TTLCache(maxsize=128, ttl=300)
+        # cachetools caches are not thread-safe, and batch tools call one
+        # fetcher from several worker threads at once
+        self._metadata_cache_lock = threading.Lock()
         self._current_user_account_id = None
 
         # Test authentication during initialization (in debug mode only)
@@ -198,10 +217,11 @@ class JiraClient(DevelopmentMixin):
         except Exception as e:
             error_msg = f"Jira authentication validation failed: {e}"
             logger.error(error_msg)
-            logger.debug(
-                f"Authentication headers during failure: "
-                f"{get_masked_session_headers(dict(self.jira._session.headers))}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Authentication headers during failure: %s",
+                    get_masked_session_headers(dict(self.jira._session.headers)),
+                )
             raise MCPAtlassianAuthenticationError(error_msg) from e
 
     def _apply_custom_headers(self) -> None:
@@ -342,7 +362,7 @@ class JiraClient(DevelopmentMixin):
             payload["releaseDate"] = release_date
         if description:
             payload["description"] = description
-        logger.info(f"Creating Jira version: {payload}")
+        logger.info("Creating Jira version: %s", payload)
         result = self.jira.post("/rest/api/3/version", json=payload)
         if not isinstance(result, dict):
             error_message = f"Unexpected response from Jira API: {result}"
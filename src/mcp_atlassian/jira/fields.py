@@ -194,17 +194,16 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
         Returns:
             Dictionary mapping required field names to their definitions
         """
-        # Initialize cache if it doesn't exist
-        if not hasattr(self, "_required_fields_cache"):
-            self._required_fields_cache = {}
-
-        # Check cache first
+        # Check cache first; a single lookup, as the entry may expire between
+        # a membership test and a read. Callers get a copy of the cached dict.
         cache_key = (project_key, issue_type)
-        if cache_key in self._required_fields_cache:
+        with self._metadata_cache_lock:
+            cached = self._required_fields_cache.get(cache_key)
+        if cached is not None:
             logger.debug(
                 f"Returning cached required fields for {issue_type} in {project_key}"
             )
-            return self._required_fields_cache[cache_key]
+            return dict(cached)
 
         try:
             # Step 1: Get the ID for the given issue type name within the project
@@ -231,10 +230,10 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             # Replace deprecated createmeta with field and issue type APIs
             all_fields = self.get_all_fields()
 
-            # Get issue type details to determine required fields
-            issue_types = self.jira.issue_types_for_project(project_key)
+            # Get issue type details to determine required fields, reusing the
+            # (cached) issue types fetched above instead of a second round-trip
             current_issue_type = None
-            for it in issue_types:
+            for it in all_issue_types:
                 if it.get("id") == issue_type_id or it.get("name", "").lower() == issue_type.lower():
                     current_issue_type = it
                     break
@@ -266,13 +265,14 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                 )
 
             # Cache the result before returning
-            self._required_fields_cache[cache_key] = required_fields
+            with self._metadata_cache_lock:
+                self._required_fields_cache[cache_key] = required_fields
             logger.debug(
                 f"Cached required fields for {issue_type} in {project_key}: "
                 f"{len(required_fields)} fields"
             )
 
-            return required_fields
+            return dict(required_fields)
 
         except Exception as e:
             logger.error(
@@ -625,6 +625,13 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                 "Field ID must be a custom field (starting with 'customfield_')"
             )
 
+        cache_key = ("contexts", field_id, start_at, max_results)
+        with self._metadata_cache_lock:
+            cached = self._field_metadata_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Returning cached contexts for field '{field_id}'")
+            return cached
+
         try:
             logger.debug(f"Getting contexts for field '{field_id}'")
 
@@ -661,6 +668,8 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             logger.debug(
                 f"Retrieved {len(contexts_response.values)} contexts for field '{field_id}'"
             )
+            with self._metadata_cache_lock:
+                self._field_metadata_cache[cache_key] = contexts_response
             return contexts_response
 
         except Exception as e:
@@ -695,6 +704,13 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                 "Field ID must be a custom field (starting with 'customfield_')"
             )
 
+        cache_key = ("options", field_id, start_at, max_results)
+        with self._metadata_cache_lock:
+            cached = self._field_metadata_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Returning cached options for field '{field_id}'")
+            return cached
+
         try:
             logger.debug(f"Getting global options for field '{field_id}'")
 
@@ -732,6 +748,8 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             logger.debug(
                 f"Retrieved {len(options_response.values)} options for field '{field_id}'"
             )
+            with self._metadata_cache_lock:
+                self._field_metadata_cache[cache_key] = options_response
             return options_response
 
         except Exception as e:
@@ -771,6 +789,15 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                 "Field ID must be a custom field (starting with 'customfield_')"
             )
 
+        cache_key = ("context_options", field_id, context_id, start_at, max_results)
+        with self._metadata_cache_lock:
+            cached = self._field_metadata_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(
+                f"Returning cached context options for field '{field_id}' in context '{context_id}'"
+            )
+            return cached
+
         try:
             logger.debug(
                 f"Getting context options for field '{field_id}' in context '{context_id}'"
@@ -814,6 +841,8 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             logger.debug(
                 f"Retrieved {len(context_options_response.values)} options for field '{field_id}' in context '{context_id}'"
             )
+            with self._metadata_cache_lock:
+                self._field_metadata_cache[cache_key] = context_options_response
             return context_options_response
 
         except Exception as e:
@@ -23,6 +23,9 @@ from .protocols import (
 
 logger = logging.getLogger("mcp-jira")
 
+# Fields whose values are lists of {"name": ...} / {"id": ...} objects
+_LIST_OF_OBJECTS_FIELDS = frozenset({"fixversions", "versions", "components"})
+
 
 class IssuesMixin(
     JiraClient,
@@ -942,7 +945,7 @@ class IssuesMixin(
                     f"Invalid format for labels field: {value}. Expected list of strings or comma-separated string."
                 )
                 return None
-        elif normalized_name in ["fixversions", "versions", "components"]:
+        elif normalized_name in _LIST_OF_OBJECTS_FIELDS:
             # These expect lists of objects, typically {"name": "..."} or {"id": "..."}
             if isinstance(value, list):
                 formatted_list = []
@@ -1145,11 +1148,17 @@ class IssuesMixin(
                     update_fields["description"]
                 )
 
-            # Process kwargs
+            # Process kwargs; regular fields are collected and resolved against
+            # the field map in a single _process_additional_fields call
+            additional_kwargs: dict[str, Any] = {}
             for key, value in kwargs.items():
                 if key == "status":
                     # Status changes are handled separately via transitions
                     # Add status to fields so _update_issue_with_status can find it
+                    if additional_kwargs:
+                        self._process_additional_fields(
+                            update_fields, additional_kwargs
+                        )
                     update_fields["status"] = value
                     return self._update_issue_with_status(issue_key, update_fields)
 
@@ -1175,10 +1184,10 @@ class IssuesMixin(
                     # Handle description with markdown conversion
                     update_fields["description"] = self._markdown_to_jira(value)
                 else:
-                    # Process regular fields using _process_additional_fields
-                    # Create a temporary dict with just this field
-                    field_kwargs = {key: value}
-                    self._process_additional_fields(update_fields, field_kwargs)
+                    additional_kwargs[key] = value
+
+            if additional_kwargs:
+                self._process_additional_fields(update_fields, additional_kwargs)
 
             # Update the issue fields
             if update_fields:
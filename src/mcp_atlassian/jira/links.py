@@ -56,13 +56,19 @@ class LinksMixin(JiraClient):
                 logger.error(error_msg)
                 raise MCPAtlassianAuthenticationError(error_msg) from http_err
             else:
-                logger.error(f"HTTP error during API call: {http_err}", exc_info=True)
+                logger.error(
+                    f"HTTP error during API call: {http_err}",
+                    exc_info=logger.isEnabledFor(logging.DEBUG),
+                )
                 raise Exception(
                     f"Error getting issue link types: {http_err}"
                 ) from http_err
         except Exception as e:
             error_msg = str(e)
-            logger.error(f"Error getting issue link types: {error_msg}", exc_info=True)
+            logger.error(
+                f"Error getting issue link types: {error_msg}",
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             raise Exception(f"Error getting issue link types: {error_msg}") from e
 
     def create_issue_link(self, data: dict[str, Any]) -> dict[str, Any]:
@@ -128,11 +134,17 @@ class LinksMixin(JiraClient):
                 logger.error(error_msg)
                 raise MCPAtlassianAuthenticationError(error_msg) from http_err
             else:
-                logger.error(f"HTTP error during API call: {http_err}", exc_info=True)
+                logger.error(
+                    f"HTTP error during API call: {http_err}",
+                    exc_info=logger.isEnabledFor(logging.DEBUG),
+                )
                 raise Exception(f"Error creating issue link: {http_err}") from http_err
         except Exception as e:
             error_msg = str(e)
-            logger.error(f"Error creating issue link: {error_msg}", exc_info=True)
+            logger.error(
+                f"Error creating issue link: {error_msg}",
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             raise Exception(f"Error creating issue link: {error_msg}") from e
 
     def create_remote_issue_link(
@@ -205,14 +217,18 @@ class LinksMixin(JiraClient):
                 logger.error(error_msg)
                 raise MCPAtlassianAuthenticationError(error_msg) from http_err
             else:
-                logger.error(f"HTTP error during API call: {http_err}", exc_info=True)
+                logger.error(
+                    f"HTTP error during API call: {http_err}",
+                    exc_info=logger.isEnabledFor(logging.DEBUG),
+                )
                 raise Exception(
                     f"Error creating remote issue link: {http_err}"
                 ) from http_err
         except Exception as e:
             error_msg = str(e)
             logger.error(
-                f"Error creating remote issue link: {error_msg}", exc_info=True
+                f"Error creating remote issue link: {error_msg}",
+                exc_info=logger.isEnabledFor(logging.DEBUG),
             )
             raise Exception(f"Error creating remote issue link: {error_msg}") from e
 
@@ -261,9 +277,15 @@ class LinksMixin(JiraClient):
                 logger.error(error_msg)
                 raise MCPAtlassianAuthenticationError(error_msg) from http_err
             else:
-                logger.error(f"HTTP error during API call: {http_err}", exc_info=True)
+                logger.error(
+                    f"HTTP error during API call: {http_err}",
+                    exc_info=logger.isEnabledFor(logging.DEBUG),
+                )
                 raise Exception(f"Error removing issue link: {http_err}") from http_err
         except Exception as e:
             error_msg = str(e)
-            logger.error(f"Error removing issue link: {error_msg}", exc_info=True)
+            logger.error(
+                f"Error removing issue link: {error_msg}",
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             raise Exception(f"Error removing issue link: {error_msg}") from e
@@ -30,10 +30,6 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             List of project data dictionaries
         """
         try:
-            params = {}
-            if include_archived:
-                params["includeArchived"] = "true"
-
             projects = self.jira.projects(included_archived=include_archived)
             return projects if isinstance(projects, list) else []
 
@@ -249,6 +245,12 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
         Returns:
             List of issue type data dictionaries
         """
+        with self._metadata_cache_lock:
+            cached = self._project_issue_types_cache.get(project_key)
+        if cached is not None:
+            logger.debug(f"Returning cached issue types for project {project_key}")
+            return cached
+
         try:
             # Replace deprecated createmeta endpoint with current API
             issue_types = self.jira.issue_types_for_project(project_key)
@@ -258,6 +260,10 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
                 logger.error(msg)
                 raise TypeError(msg)
 
+            # Don't cache empty results, they usually mean a missing project
+            if issue_types:
+                with self._metadata_cache_lock:
+                    self._project_issue_types_cache[project_key] = issue_types
             return issue_types
 
         except Exception as e:
@@ -141,37 +141,26 @@ class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
             # Normalize transition_id to an integer when possible, or string otherwise
             normalized_transition_id = self._normalize_transition_id(transition_id)
 
-            # Validate that this is a valid transition ID
+            # Validate the transition ID and resolve its target status in a
+            # single pass over the available transitions
             valid_transitions = self.get_transitions_models(issue_key)
-            valid_ids = [t.id for t in valid_transitions]
-
-            # Convert string IDs to integers for proper comparison if normalized_transition_id is an integer
-            if isinstance(normalized_transition_id, int):
-                valid_ids = [
-                    int(id_val)
-                    if isinstance(id_val, str) and id_val.isdigit()
-                    else id_val
-                    for id_val in valid_ids
-                ]
-
-            # Check if the normalized_transition_id is in the list of valid IDs
-            id_to_check = normalized_transition_id
-            if id_to_check not in valid_ids:
+            id_to_check = str(normalized_transition_id)
+            matched_transition = next(
+                (t for t in valid_transitions if str(t.id) == id_to_check), None
+            )
+            if matched_transition is None:
                 available_transitions = ", ".join(
                     f"{t.id} ({t.name})" for t in valid_transitions
                 )
                 logger.warning(
-                    f"Transition ID {id_to_check} not in available transitions: {available_transitions}"
+                    f"Transition ID {normalized_transition_id} not in available transitions: {available_transitions}"
                 )
                 # Continue anyway as Jira will validate
 
             # Find the target status name corresponding to the transition ID
             target_status_name = None
-            for transition in valid_transitions:
-                if str(transition.id) == str(normalized_transition_id):
-                    if transition.to_status and transition.to_status.name:
-                        target_status_name = transition.to_status.name
-                        break
+            if matched_transition is not None and matched_transition.to_status:
+                target_status_name = matched_transition.to_status.name or None
 
             # Sanitize fields if provided
             fields_for_api = None
@@ -229,10 +218,9 @@ class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
                     if update_for_api:
                         payload["update"] = update_for_api
 
-                    if payload:
-                        base_url = self.jira.resource_url("issue")
-                        url = f"{base_url}/{issue_key}/transitions"
-                        self.jira.post(url, json=payload)
+                    base_url = self.jira.resource_url("issue")
+                    url = f"{base_url}/{issue_key}/transitions"
+                    self.jira.post(url, json=payload)
 
             # Return the updated issue
             return self.get_issue(issue_key)
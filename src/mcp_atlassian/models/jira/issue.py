@@ -496,13 +496,16 @@ class JiraIssue(ApiModel, TimestampMixin):
             "key": self.key,
         }
 
+        # Resolve the field filter once; None means every field is included
+        requested_set = (
+            set(self.requested_fields)
+            if isinstance(self.requested_fields, list)
+            else None
+        )
+
         # Helper method to check if a field should be included
         def should_include_field(field_name: str) -> bool:
-            return (
-                self.requested_fields == "*all"
-                or not isinstance(self.requested_fields, list)
-                or field_name in self.requested_fields
-            )
+            return requested_set is None or field_name in requested_set
 
         # Add summary if requested
         if should_include_field("summary"):
@@ -650,10 +653,11 @@ class JiraIssue(ApiModel, TimestampMixin):
                         result[requested_key_or_name] = output_value_obj
                         found_by_id_or_name = True
                     else:
+                        requested_lower = requested_key_or_name.lower()
                         for internal_id, field_data_obj in self.custom_fields.items():
                             if (
                                 field_data_obj.get("name", "").lower()
-                                == requested_key_or_name.lower()
+                                == requested_lower
                             ):
                                 output_value_obj = {
                                     "value": self._process_custom_field_value(
@@ -2,13 +2,17 @@
 
 import json
 import logging
-from typing import Annotated
+from functools import partial
+from typing import Annotated, Any, Literal
 
+import anyio
 from fastmcp import Context, FastMCP
-from pydantic import BeforeValidator, Field
+from pydantic import BaseModel, BeforeValidator, Field, TypeAdapter, ValidationError
 
+from mcp_atlassian.confluence import ConfluenceFetcher
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.servers.dependencies import get_confluence_fetcher
+from mcp_atlassian.utils.concurrency import run_in_threads
 from mcp_atlassian.utils.decorators import (
     check_write_access,
     handle_tool_errors,
@@ -16,6 +20,86 @@ from mcp_atlassian.utils.decorators import (
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent Confluence requests issued by batch_create_pages
+BATCH_PAGE_CONCURRENCY = 8
+
+
+class _PageInput(BaseModel):
+    """One entry of the ``pages`` payload accepted by batch_create_pages."""
+
+    title: str
+    content: str
+    parent_id: Annotated[
+        str | None, BeforeValidator(lambda x: str(x) if x is not None else None)
+    ] = None
+    content_format: Literal["markdown", "wiki", "storage"] = "markdown"
+    enable_heading_anchors: bool = False
+
+
+# Parses and validates the batch payload in a single pydantic-core pass
+_PAGE_LIST_ADAPTER = TypeAdapter(list[_PageInput])
+
+
+def _parse_page_inputs(pages: str) -> list[_PageInput]:
+    """Decode and validate a JSON array of pages, mapping errors to ValueError."""
+    try:
+        return _PAGE_LIST_ADAPTER.validate_json(pages)
+    except ValidationError as e:
+        error = e.errors()[0]
+        if error["type"] == "json_invalid":
+            raise ValueError("Invalid JSON format for pages data") from None
+        if not error["loc"]:
+            raise ValueError("Pages data must be an array") from None
+        location = ".".join(str(part) for part in error["loc"])
+        raise ValueError(f"Invalid page data at {location}: {error['msg']}") from None
+
+
+def _create_page_call(
+    confluence_fetcher: ConfluenceFetcher, space_key: str, page_data: _PageInput
+) -> dict[str, Any]:
+    """Create one page of a batch and return its simplified form."""
+    is_markdown = page_data.content_format == "markdown"
+    page = confluence_fetcher.create_page(
+        space_key=space_key,
+        title=page_data.title,
+        body=page_data.content,
+        parent_id=page_data.parent_id,
+        is_markdown=is_markdown,
+        enable_heading_anchors=is_markdown and page_data.enable_heading_anchors,
+        content_representation=None if is_markdown else page_data.content_format,
+    )
+    return page.to_simplified_dict()
+
+
+async def _create_pages_concurrently(
+    confluence_fetcher: ConfluenceFetcher, space_key: str, page_items: list[_PageInput]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Create pages in worker threads, bounded by ``BATCH_PAGE_CONCURRENCY``.
+
+    Returns the created pages in input order, plus one error entry per item
+    that failed, so a partial failure still reports what was created.
+    """
+    results = await run_in_threads(
+        [
+            partial(_create_page_call, confluence_fetcher, space_key, page_data)
+            for page_data in page_items
+        ],
+        BATCH_PAGE_CONCURRENCY,
+    )
+
+    created_pages: list[dict[str, Any]] = []
+    errors: list[dict[str, Any]] = []
+    outcomes = zip(page_items, results, strict=True)
+    for index, (page_data, result) in enumerate(outcomes):
+        if isinstance(result, Exception):
+            logger.warning("Failed to create page %s: %s", page_data.title, result)
+            errors.append(
+                {"index": index, "title": page_data.title, "error": str(result)}
+            )
+        else:
+            created_pages.append(result)
+    return created_pages, errors
+
 
 def register_confluence_tools(confluence_mcp: FastMCP) -> None:
     @confluence_mcp.tool(tags={"confluence", "read"})
@@ -80,6 +164,8 @@ def register_confluence_tools(confluence_mcp: FastMCP) -> None:
             JSON string representing a list of simplified Confluence page objects.
         """
         confluence_fetcher = await get_confluence_fetcher(ctx)
+        # Searches are blocking and may wait out rate limits, so they run in a
+        # worker thread to keep the event loop free for other tool calls
         # Check if the query is a simple search term or already a CQL query
         if query and not any(
             x in query for x in ["=", "~", ">", "<", " AND ", " OR ", "currentUser()"]
@@ -90,8 +176,13 @@ def register_confluence_tools(confluence_mcp: FastMCP) -> None:
                 logger.info(
                     f"Converting simple search term to CQL using siteSearch: {query}"
                 )
-                pages = confluence_fetcher.search(
-                    query, limit=limit, spaces_filter=spaces_filter
+                pages = await anyio.to_thread.run_sync(
+                    partial(
+                        confluence_fetcher.search,
+                        query,
+                        limit=limit,
+                        spaces_filter=spaces_filter,
+                    )
                 )
             except Exception as e:
                 logger.warning(
@@ -99,12 +190,22 @@ def register_confluence_tools(confluence_mcp: FastMCP) -> None:
                 )
                 query = f'text ~ "{original_query}"'
                 logger.info(f"Falling back to text search with CQL: {query}")
-                pages = confluence_fetcher.search(
-                    query, limit=limit, spaces_filter=spaces_filter
+                pages = await anyio.to_thread.run_sync(
+                    partial(
+                        confluence_fetcher.search,
+                        query,
+                        limit=limit,
+                        spaces_filter=spaces_filter,
+                    )
                 )
         else:
-            pages = confluence_fetcher.search(
-                query, limit=limit, spaces_filter=spaces_filter
+            pages = await anyio.to_thread.run_sync(
+                partial(
+                    confluence_fetcher.search,
+                    query,
+                    limit=limit,
+                    spaces_filter=spaces_filter,
+                )
             )
         search_results = [page.to_simplified_dict() for page in pages]
         return json.dumps(search_results, indent=2, ensure_ascii=False)
@@ -491,6 +592,60 @@ def register_confluence_tools(confluence_mcp: FastMCP) -> None:
             ensure_ascii=False,
         )
 
+    @confluence_mcp.tool(tags={"confluence", "write"})
+    @check_write_access("confluence")
+    @handle_tool_errors(default_return_key="pages", service_name="Confluence")
+    async def batch_create_pages(
+        ctx: Context,
+        space_key: Annotated[
+            str,
+            Field(
+                description="The key of the space to create the pages in (usually a short uppercase code like 'DEV', 'TEAM', or 'DOC')"
+            ),
+        ],
+        pages: Annotated[
+            str,
+            Field(
+                description="JSON array of page objects. Each page should have: title, content, and optional parent_id, content_format ('markdown' (default), 'wiki', or 'storage'), enable_heading_anchors."
+            ),
+        ],
+    ) -> str:
+        """Create multiple Confluence pages in one call.
+
+        Args:
+            ctx: The FastMCP context.
+            space_key: The key of the space.
+            pages: JSON array of page objects.
+
+        Returns:
+            JSON string with the created page objects, in input order. Pages
+            that could not be created are listed under "errors" with their index.
+
+        Raises:
+            ValueError: If in read-only mode, Confluence client is unavailable, or the pages data is invalid.
+        """
+        confluence_fetcher = await get_confluence_fetcher(ctx)
+        if not pages or not pages.strip():
+            raise ValueError("Pages data is required and cannot be empty")
+
+        # Validate every item up front so a bad entry fails the batch before
+        # any page is created
+        page_items = _parse_page_inputs(pages)
+        created_pages, errors = await _create_pages_concurrently(
+            confluence_fetcher, space_key, page_items
+        )
+        response: dict[str, Any] = {
+            "success": not errors,
+            "message": "Pages created successfully"
+            if not errors
+            else f"Created {len(created_pages)} of {len(page_items)} pages",
+            "pages": created_pages,
+            "total": len(created_pages),
+        }
+        if errors:
+            response["errors"] = errors
+        return json.dumps(response, indent=2, ensure_ascii=False)
+
     @confluence_mcp.tool(tags={"confluence", "write"})
     @check_write_access("confluence")
     @handle_tool_errors(default_return_key="page", service_name="Confluence")
@@ -725,7 +880,9 @@ def register_confluence_tools(confluence_mcp: FastMCP) -> None:
             logger.info(f"Converting simple search term to user CQL: {query}")
 
         try:
-            user_results = confluence_fetcher.search_user(query, limit=limit)
+            user_results = await anyio.to_thread.run_sync(
+                partial(confluence_fetcher.search_user, query, limit=limit)
+            )
             search_results = [user.to_simplified_dict() for user in user_results]
             return json.dumps(search_results, indent=2, ensure_ascii=False)
         except MCPAtlassianAuthenticationError as e:
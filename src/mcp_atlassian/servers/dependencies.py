@@ -6,9 +6,11 @@ Provides get_jira_fetcher and get_confluence_fetcher for use in tool functions.
 from __future__ import annotations
 
 import dataclasses
+import hashlib
 import logging
 from typing import TYPE_CHECKING, Any
 
+from cachetools import TTLCache
 from fastmcp import Context
 from fastmcp.server.dependencies import get_http_request
 from starlette.requests import Request
@@ -26,6 +28,27 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("mcp-atlassian.servers.dependencies")
 
+# Validated Jira fetchers reused across tool calls, so repeat calls skip client
+# construction and the token validation round-trip and keep their metadata
+# caches. Keys hold a digest of the user token, never the token itself.
+# Entries expire after a minute so that revoked or rotated tokens stop
+# working soon after the change.
+jira_fetcher_cache: TTLCache[tuple[str | None, ...], JiraFetcher] = TTLCache(
+    maxsize=100, ttl=60
+)
+
+# Fetcher built from the server-wide config, with the config it was built from.
+# A single slot: it is replaced whenever the lifespan context's config changes.
+_global_jira_fetcher: tuple[JiraConfig, JiraFetcher] | None = None
+
+
+def _jira_fetcher_cache_key(
+    auth_type: str, token: str, url: str | None, *extra: str | None
+) -> tuple[str | None, ...]:
+    """Build a jira_fetcher_cache key without retaining the raw token."""
+    token_digest = hashlib.sha256(token.encode()).hexdigest()
+    return (auth_type, token_digest, url, *extra)
+
 
 def _create_user_config_for_fetcher(
     base_config: JiraConfig | ConfluenceConfig,
@@ -188,6 +211,16 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
             and jira_token_header
             and not hasattr(request.state, "user_atlassian_token")
         ):
+            cache_key = _jira_fetcher_cache_key(
+                "header-pat", jira_token_header, jira_url_header
+            )
+            cached_fetcher = jira_fetcher_cache.get(cache_key)
+            if cached_fetcher is not None:
+                logger.debug(
+                    "get_jira_fetcher: Reusing cached header-based JiraFetcher."
+                )
+                request.state.jira_fetcher = cached_fetcher
+                return cached_fetcher
             logger.info(
                 f"Creating header-based JiraFetcher with URL: {jira_url_header} and PAT token"
             )
@@ -210,6 +243,7 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
                     f"get_jira_fetcher: Validated header-based Jira token for user ID: {current_user_id}"
                 )
                 request.state.jira_fetcher = header_jira_fetcher
+                jira_fetcher_cache[cache_key] = header_jira_fetcher
                 return header_jira_fetcher
             except Exception as e:
                 logger.error(
@@ -245,6 +279,21 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
                     "Jira global configuration (URL, SSL) is not available from lifespan context."
                 )
 
+            cache_key = _jira_fetcher_cache_key(
+                user_auth_type,
+                user_token,
+                app_lifespan_ctx.full_jira_config.url,
+                user_email,
+                user_cloud_id,
+            )
+            cached_fetcher = jira_fetcher_cache.get(cache_key)
+            if cached_fetcher is not None:
+                logger.debug(
+                    "get_jira_fetcher: Reusing cached user-specific JiraFetcher."
+                )
+                request.state.jira_fetcher = cached_fetcher
+                return cached_fetcher
+
             cloud_id_info = f" with cloudId {user_cloud_id}" if user_cloud_id else ""
             logger.info(
                 f"Creating user-specific JiraFetcher (type: {user_auth_type}) for user {user_email or 'unknown'} (token ...{str(user_token)[-8:]}){cloud_id_info}"
@@ -262,6 +311,7 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
                     f"get_jira_fetcher: Validated Jira token for user ID: {current_user_id}"
                 )
                 request.state.jira_fetcher = user_jira_fetcher
+                jira_fetcher_cache[cache_key] = user_jira_fetcher
                 return user_jira_fetcher
             except Exception as e:
                 logger.error(
@@ -289,7 +339,14 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
             "get_jira_fetcher: Using global JiraFetcher from lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_jira_config.auth_type}"
         )
-        return JiraFetcher(config=app_lifespan_ctx_global.full_jira_config)
+        global _global_jira_fetcher
+        global_config = app_lifespan_ctx_global.full_jira_config
+        cached_global = _global_jira_fetcher
+        if cached_global is not None and cached_global[0] is global_config:
+            return cached_global[1]
+        global_fetcher = JiraFetcher(config=global_config)
+        _global_jira_fetcher = (global_config, global_fetcher)
+        return global_fetcher
     logger.error("Jira configuration could not be resolved.")
     raise ValueError(
         "Jira client (fetcher) not available. Ensure server is configured correctly."
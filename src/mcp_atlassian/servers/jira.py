@@ -2,20 +2,217 @@
 
 import json
 import logging
+import re
+from collections.abc import Callable
+from functools import partial
 from typing import Annotated, Any
 
+import pydantic_core
 from fastmcp import Context, FastMCP
-from pydantic import Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from requests.exceptions import HTTPError
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.constants import DEFAULT_READ_JIRA_FIELDS
 from mcp_atlassian.models.jira.common import JiraUser
 from mcp_atlassian.servers.dependencies import get_jira_fetcher
+from mcp_atlassian.utils.concurrency import run_in_threads
 from mcp_atlassian.utils.decorators import check_write_access, handle_tool_errors
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent Jira requests issued by batch_create_versions
+BATCH_VERSION_CONCURRENCY = 8
+
+# Field descriptions shared by the custom field and version tools
+_START_AT_DESC = "Starting index for pagination (0-based)."
+_MAX_FIELD_RESULTS_DESC = "Maximum number of results to return (1-10000)."
+_VERSIONS_DESC = (
+    "JSON array of version objects. Each version should have: project, name, "
+    "and optional description, start_date, release_date."
+)
+
+# Version dates must be YYYY-MM-DD; checked locally to avoid a failing round-trip
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Responses for an empty version batch, keyed by validate_only
+_EMPTY_BATCH_VERSIONS_JSON = {
+    validate_only: json.dumps(
+        {
+            "success": True,
+            "versions": [],
+            "total": 0,
+            "validated_only": validate_only,
+        },
+        indent=2,
+    )
+    for validate_only in (False, True)
+}
+
+
+class _VersionInput(BaseModel):
+    """One entry of the ``versions`` payload accepted by batch_create_versions."""
+
+    project: str
+    name: str
+    description: str | None = None
+    start_date: str | None = None
+    release_date: str | None = None
+
+
+# Parses and validates the batch payload in a single pydantic-core pass
+_VERSION_LIST_ADAPTER = TypeAdapter(list[_VersionInput])
+
+
+def _parse_version_inputs(versions: str) -> list[_VersionInput]:
+    """Decode and validate a JSON array of versions, mapping errors to ValueError."""
+    try:
+        return _VERSION_LIST_ADAPTER.validate_json(versions)
+    except ValidationError as e:
+        error = e.errors()[0]
+        if error["type"] == "json_invalid":
+            raise ValueError("Invalid JSON format for versions data") from None
+        if not error["loc"]:
+            raise ValueError("Versions data must be an array") from None
+        if error["type"] == "missing":
+            raise ValueError(
+                "Each version must have 'project' and 'name' fields"
+            ) from None
+        location = ".".join(str(part) for part in error["loc"])
+        raise ValueError(
+            f"Invalid version data at {location}: {error['msg']}"
+        ) from None
+
+
+def _validate_version_dates(start_date: str | None, release_date: str | None) -> None:
+    """Raise ``ValueError`` if a version date is not in YYYY-MM-DD format."""
+    for label, value in (("start_date", start_date), ("release_date", release_date)):
+        if value is not None and not _DATE_RE.match(value):
+            raise ValueError(f"{label} must be in YYYY-MM-DD format, got '{value}'")
+
+
+def _get_status_code(error: HTTPError) -> int | None:
+    """Return the HTTP status code of a failed request, if a response is attached.
+
+    ``requests.Response`` is falsy for 4xx/5xx statuses, so checks like
+    ``e.response and e.response.status_code == 404`` never match; compare
+    against ``None`` instead and read the attribute once per error.
+    """
+    response = error.response
+    return response.status_code if response is not None else None
+
+
+def _error_response(message: str, **context: Any) -> str:
+    """Render a failed tool response with any identifying context."""
+    return json.dumps({"success": False, "error": message, **context}, indent=2)
+
+
+def _field_metadata_response(
+    fetch: Callable[..., Any],
+    result_key: str,
+    label: str,
+    ids: dict[str, str],
+    start_at: int,
+    max_results: int,
+    not_found_message: str,
+    access_denied_message: str,
+) -> str:
+    """Fetch custom field metadata and render the shared tool response.
+
+    Backs the ``get_field_options``, ``get_field_contexts`` and
+    ``get_field_context_options`` tools, which differ only in the fetcher
+    method, the identifiers they take and their error messages.
+
+    Args:
+        fetch: Bound JiraFetcher method to call.
+        result_key: Response key holding the fetched data.
+        label: Human-readable name of the data, used in errors and logs.
+        ids: Identifier arguments (``field_id`` and optionally ``context_id``).
+        start_at: Starting index for pagination.
+        max_results: Maximum number of results to return.
+        not_found_message: Error message for a 404 response.
+        access_denied_message: Error message for a 403 response.
+
+    Returns:
+        JSON string with the fetched data or an error envelope.
+    """
+    target = ", context ".join(ids.values())
+    try:
+        response = fetch(
+            **{key: value.strip() for key, value in ids.items()},
+            start_at=start_at,
+            max_results=max_results,
+        )
+        result = (
+            response.to_simplified_dict()
+            if hasattr(response, "to_simplified_dict")
+            else response
+        )
+        response_data = {
+            "success": True,
+            **ids,
+            result_key: result,
+            "start_at": start_at,
+            "max_results": max_results,
+            "total": getattr(response, "total", len(result.get("values", []))),
+        }
+    except HTTPError as e:
+        logger.error(f"HTTP error getting {label} for {target}: {e}")
+        error_message = f"Failed to get {label}: {str(e)}"
+        status_code = _get_status_code(e)
+        if status_code == 404:
+            error_message = not_found_message
+        elif status_code == 403:
+            error_message = access_denied_message
+        elif status_code == 401:
+            error_message = "Authentication failed. Please check your credentials."
+        return _error_response(error_message, **ids)
+    except Exception as e:
+        logger.error(f"Unexpected error getting {label} for {target}: {e}")
+        return _error_response(f"An unexpected error occurred: {str(e)}", **ids)
+
+    # Option lists can hold thousands of entries; pydantic-core encodes them
+    # natively, whereas json.dumps falls back to pure Python when indenting
+    return pydantic_core.to_json(response_data, indent=2).decode()
+
+
+async def _create_versions_concurrently(
+    jira: JiraFetcher, version_items: list[_VersionInput]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Create versions in worker threads, bounded by ``BATCH_VERSION_CONCURRENCY``.
+
+    Returns the created versions in input order, plus one error entry per
+    item that failed, so a partial failure still reports what was created.
+    """
+    results = await run_in_threads(
+        [
+            partial(
+                jira.create_version,
+                project=version_data.project,
+                name=version_data.name,
+                description=version_data.description,
+                start_date=version_data.start_date,
+                release_date=version_data.release_date,
+            )
+            for version_data in version_items
+        ],
+        BATCH_VERSION_CONCURRENCY,
+    )
+
+    created_versions: list[dict[str, Any]] = []
+    errors: list[dict[str, Any]] = []
+    outcomes = zip(version_items, results, strict=True)
+    for index, (version_data, result) in enumerate(outcomes):
+        if isinstance(result, Exception):
+            logger.warning("Failed to create version %s: %s", version_data.name, result)
+            errors.append(
+                {"index": index, "name": version_data.name, "error": str(result)}
+            )
+        else:
+            created_versions.append(result)
+    return created_versions, errors
+
 
 def register_jira_tools(jira_mcp: FastMCP) -> None:
     """Register all Jira tools with the FastMCP server."""
@@ -148,11 +345,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error retrieving issue {issue_key}: {e}")
             error_message = f"Issue '{issue_key}' not found or access denied"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Issue '{issue_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for issue '{issue_key}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {
@@ -247,11 +445,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error searching issues with JQL '{jql}': {e}")
             error_message = f"JQL search failed: {str(e)}"
-            if e.response and e.response.status_code == 400:
+            status_code = _get_status_code(e)
+            if status_code == 400:
                 error_message = f"Invalid JQL query: {jql}"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = "Access denied. You may not have permission to search with this JQL query."
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {"success": False, "error": error_message, "jql": jql}
@@ -397,11 +596,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error creating issue: {e}")
             error_message = f"Failed to create issue: {str(e)}"
-            if e.response and e.response.status_code == 403:
+            status_code = _get_status_code(e)
+            if status_code == 403:
                 error_message = "Access denied. You may not have permission to create issues in this project."
-            elif e.response and e.response.status_code == 404:
+            elif status_code == 404:
                 error_message = f"Project '{project_key}' not found or issue type '{issue_type}' does not exist."
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {"success": False, "error": error_message}
@@ -448,9 +648,10 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error retrieving projects: {e}")
             error_message = f"Failed to retrieve projects: {str(e)}"
-            if e.response and e.response.status_code == 401:
+            status_code = _get_status_code(e)
+            if status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = "Access denied. You may not have permission to view projects."
 
             response_data = {"success": False, "error": error_message}
@@ -518,11 +719,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error retrieving comments for issue {issue_key}: {e}")
             error_message = f"Failed to retrieve comments: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Issue '{issue_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for issue '{issue_key}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {
@@ -600,11 +802,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error adding comment to issue {issue_key}: {e}")
             error_message = f"Failed to add comment: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Issue '{issue_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for issue '{issue_key}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {
@@ -673,13 +876,14 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error deleting comment {comment_id} from issue {issue_key}: {e}")
             error_message = f"Failed to delete comment: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Issue '{issue_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for issue '{issue_key}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
-            elif e.response and e.response.status_code == 404:
+            elif status_code == 404:
                 error_message = f"Comment '{comment_id}' not found in issue '{issue_key}'"
 
             response_data = {
@@ -763,11 +967,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error retrieving epic issues for {epic_key}: {e}")
             error_message = f"Failed to retrieve epic issues: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Epic '{epic_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for epic '{epic_key}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {
@@ -826,12 +1031,11 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
 
         try:
             # Parse the issues data
-            import json as json_lib
             try:
-                issues_data = json_lib.loads(issues)
-            except json_lib.JSONDecodeError:
-                # If it's not valid JSON, try to treat it as a JSON string
-                issues_data = json_lib.loads(json_lib.dumps({"issues": []}))
+                issues_data = json.loads(issues)
+            except json.JSONDecodeError:
+                # If it's not valid JSON, fall back to an empty batch
+                issues_data = {"issues": []}
 
             # Ensure we have a list of issues
             if isinstance(issues_data, dict) and "issues" in issues_data:
@@ -857,9 +1061,10 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error in batch issue creation: {e}")
             error_message = f"Batch issue creation failed: {str(e)}"
-            if e.response and e.response.status_code == 403:
+            status_code = _get_status_code(e)
+            if status_code == 403:
                 error_message = "Access denied. You may not have permission to create issues."
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {"success": False, "error": error_message}
@@ -956,11 +1161,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error getting development status for {issue_key}: {e}")
             error_message = f"Failed to get development status: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Issue '{issue_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for issue '{issue_key}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {
@@ -1040,13 +1246,14 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error adding issues to sprint {sprint_id}: {e}")
             error_message = f"Failed to add issues to sprint: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Sprint '{sprint_id}' not found or one or more issues do not exist"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied. You may not have permission to modify sprint '{sprint_id}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
-            elif e.response and e.response.status_code == 400:
+            elif status_code == 400:
                 error_message = "Bad request. Issues may already be in an active sprint or sprint may be closed."
 
             response_data = {
@@ -1077,7 +1284,7 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         start_at: Annotated[
             int,
             Field(
-                description="Starting index for pagination (0-based).",
+                description=_START_AT_DESC,
                 default=0,
                 ge=0,
             ),
@@ -1085,7 +1292,7 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         max_results: Annotated[
             int,
             Field(
-                description="Maximum number of results to return (1-10000).",
+                description=_MAX_FIELD_RESULTS_DESC,
                 default=10000,
                 ge=1,
                 le=10000,
@@ -1114,47 +1321,18 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         if not field_id or not field_id.strip():
             raise ValueError("Field ID is required and cannot be empty")
 
-        try:
-            field_options_response = jira.get_field_options(
-                field_id=field_id.strip(),
-                start_at=start_at,
-                max_results=max_results,
-            )
-
-            result = field_options_response.to_simplified_dict() if hasattr(field_options_response, 'to_simplified_dict') else field_options_response
-
-            response_data = {
-                "success": True,
-                "field_id": field_id,
-                "field_options": result,
-                "start_at": start_at,
-                "max_results": max_results,
-                "total": getattr(field_options_response, 'total', len(result.get('values', []))),
-            }
-        except HTTPError as e:
-            logger.error(f"HTTP error getting field options for {field_id}: {e}")
-            error_message = f"Failed to get field options: {str(e)}"
-            if e.response and e.response.status_code == 404:
-                error_message = f"Field '{field_id}' not found or field does not have options"
-            elif e.response and e.response.status_code == 403:
-                error_message = f"Access denied for field '{field_id}'"
-            elif e.response and e.response.status_code == 401:
-                error_message = "Authentication failed. Please check your credentials."
-
-            response_data = {
-                "success": False,
-                "error": error_message,
-                "field_id": field_id,
-            }
-        except Exception as e:
-            logger.error(f"Unexpected error getting field options for {field_id}: {e}")
-            response_data = {
-                "success": False,
-                "error": f"An unexpected error occurred: {str(e)}",
-                "field_id": field_id,
-            }
-
-        return json.dumps(response_data, indent=2)
+        return _field_metadata_response(
+            jira.get_field_options,
+            result_key="field_options",
+            label="field options",
+            ids={"field_id": field_id},
+            start_at=start_at,
+            max_results=max_results,
+            not_found_message=(
+                f"Field '{field_id}' not found or field does not have options"
+            ),
+            access_denied_message=f"Access denied for field '{field_id}'",
+        )
 
     @jira_mcp.tool(tags={"jira", "read"})
     @handle_tool_errors(default_return_key="field_contexts", service_name="Jira")
@@ -1169,7 +1347,7 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         start_at: Annotated[
             int,
             Field(
-                description="Starting index for pagination (0-based).",
+                description=_START_AT_DESC,
                 default=0,
                 ge=0,
             ),
@@ -1177,7 +1355,7 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         max_results: Annotated[
             int,
             Field(
-                description="Maximum number of results to return (1-10000).",
+                description=_MAX_FIELD_RESULTS_DESC,
                 default=10000,
                 ge=1,
                 le=10000,
@@ -1206,47 +1384,18 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         if not field_id or not field_id.strip():
             raise ValueError("Field ID is required and cannot be empty")
 
-        try:
-            field_contexts_response = jira.get_field_contexts(
-                field_id=field_id.strip(),
-                start_at=start_at,
-                max_results=max_results,
-            )
-
-            result = field_contexts_response.to_simplified_dict() if hasattr(field_contexts_response, 'to_simplified_dict') else field_contexts_response
-
-            response_data = {
-                "success": True,
-                "field_id": field_id,
-                "field_contexts": result,
-                "start_at": start_at,
-                "max_results": max_results,
-                "total": getattr(field_contexts_response, 'total', len(result.get('values', []))),
-            }
-        except HTTPError as e:
-            logger.error(f"HTTP error getting field contexts for {field_id}: {e}")
-            error_message = f"Failed to get field contexts: {str(e)}"
-            if e.response and e.response.status_code == 404:
-                error_message = f"Field '{field_id}' not found or field does not have contexts"
-            elif e.response and e.response.status_code == 403:
-                error_message = f"Access denied for field '{field_id}'"
-            elif e.response and e.response.status_code == 401:
-                error_message = "Authentication failed. Please check your credentials."
-
-            response_data = {
-                "success": False,
-                "error": error_message,
-                "field_id": field_id,
-            }
-        except Exception as e:
-            logger.error(f"Unexpected error getting field contexts for {field_id}: {e}")
-            response_data = {
-                "success": False,
-                "error": f"An unexpected error occurred: {str(e)}",
-                "field_id": field_id,
-            }
-
-        return json.dumps(response_data, indent=2)
+        return _field_metadata_response(
+            jira.get_field_contexts,
+            result_key="field_contexts",
+            label="field contexts",
+            ids={"field_id": field_id},
+            start_at=start_at,
+            max_results=max_results,
+            not_found_message=(
+                f"Field '{field_id}' not found or field does not have contexts"
+            ),
+            access_denied_message=f"Access denied for field '{field_id}'",
+        )
 
     @jira_mcp.tool(tags={"jira", "read"})
     @handle_tool_errors(default_return_key="field_context_options", service_name="Jira")
@@ -1267,7 +1416,7 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         start_at: Annotated[
             int,
             Field(
-                description="Starting index for pagination (0-based).",
+                description=_START_AT_DESC,
                 default=0,
                 ge=0,
             ),
@@ -1275,7 +1424,7 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         max_results: Annotated[
             int,
             Field(
-                description="Maximum number of results to return (1-10000).",
+                description=_MAX_FIELD_RESULTS_DESC,
                 default=10000,
                 ge=1,
                 le=10000,
@@ -1307,51 +1456,20 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         if not context_id or not context_id.strip():
             raise ValueError("Context ID is required and cannot be empty")
 
-        try:
-            field_context_options_response = jira.get_field_context_options(
-                field_id=field_id.strip(),
-                context_id=context_id.strip(),
-                start_at=start_at,
-                max_results=max_results,
-            )
-
-            result = field_context_options_response.to_simplified_dict() if hasattr(field_context_options_response, 'to_simplified_dict') else field_context_options_response
-
-            response_data = {
-                "success": True,
-                "field_id": field_id,
-                "context_id": context_id,
-                "field_context_options": result,
-                "start_at": start_at,
-                "max_results": max_results,
-                "total": getattr(field_context_options_response, 'total', len(result.get('values', []))),
-            }
-        except HTTPError as e:
-            logger.error(f"HTTP error getting field context options for {field_id}, context {context_id}: {e}")
-            error_message = f"Failed to get field context options: {str(e)}"
-            if e.response and e.response.status_code == 404:
-                error_message = f"Field '{field_id}' or context '{context_id}' not found"
-            elif e.response and e.response.status_code == 403:
-                error_message = f"Access denied for field '{field_id}' or context '{context_id}'"
-            elif e.response and e.response.status_code == 401:
-                error_message = "Authentication failed. Please check your credentials."
-
-            response_data = {
-                "success": False,
-                "error": error_message,
-                "field_id": field_id,
-                "context_id": context_id,
-            }
-        except Exception as e:
-            logger.error(f"Unexpected error getting field context options for {field_id}, context {context_id}: {e}")
-            response_data = {
-                "success": False,
-                "error": f"An unexpected error occurred: {str(e)}",
-                "field_id": field_id,
-                "context_id": context_id,
-            }
-
-        return json.dumps(response_data, indent=2)
+        return _field_metadata_response(
+            jira.get_field_context_options,
+            result_key="field_context_options",
+            label="field context options",
+            ids={"field_id": field_id, "context_id": context_id},
+            start_at=start_at,
+            max_results=max_results,
+            not_found_message=(
+                f"Field '{field_id}' or context '{context_id}' not found"
+            ),
+            access_denied_message=(
+                f"Access denied for field '{field_id}' or context '{context_id}'"
+            ),
+        )
 
     # ADDITIONAL MISSING UPSTREAM TOOLS
 
@@ -1456,11 +1574,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error searching with JQL '{jql}': {e}")
             error_message = f"JQL search failed: {str(e)}"
-            if e.response and e.response.status_code == 400:
+            status_code = _get_status_code(e)
+            if status_code == 400:
                 error_message = f"Invalid JQL query: {jql}"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = "Access denied. You may not have permission to search with this JQL query."
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {"success": False, "error": error_message, "jql": jql}
@@ -1556,11 +1675,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error searching for active issues: {e}")
             error_message = f"Active issues search failed: {str(e)}"
-            if e.response and e.response.status_code == 400:
+            status_code = _get_status_code(e)
+            if status_code == 400:
                 error_message = f"Invalid JQL query: {jql}"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = "Access denied. You may not have permission to search for active issues."
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
             response_data = {"success": False, "error": error_message}
         except Exception as e:
@@ -1632,11 +1752,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error downloading attachments for {issue_key}: {e}")
             error_message = f"Failed to download attachments: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Issue '{issue_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for issue '{issue_key}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {
@@ -1710,11 +1831,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error linking issues to epic {epic_key}: {e}")
             error_message = f"Failed to link issues to epic: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Epic '{epic_key}' not found or one or more issues do not exist"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied. You may not have permission to link issues to epic '{epic_key}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {
@@ -1843,11 +1965,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error creating remote issue link: {e}")
             error_message = f"Failed to create remote issue link: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Issue '{issue_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = "Access denied. You may not have permission to create issue links."
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {"success": False, "error": error_message}
@@ -1901,9 +2024,10 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error searching fields: {e}")
             error_message = f"Failed to search fields: {str(e)}"
-            if e.response and e.response.status_code == 401:
+            status_code = _get_status_code(e)
+            if status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = "Access denied. You may not have permission to search fields."
 
             response_data = {"success": False, "error": error_message}
@@ -1965,11 +2089,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error getting project issues for {project_key}: {e}")
             error_message = f"Failed to get project issues: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Project '{project_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for project '{project_key}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {
@@ -2025,11 +2150,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error getting transitions for {issue_key}: {e}")
             error_message = f"Failed to get transitions: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Issue '{issue_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for issue '{issue_key}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {
@@ -2085,11 +2211,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error getting worklog for {issue_key}: {e}")
             error_message = f"Failed to get worklog: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Issue '{issue_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for issue '{issue_key}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {
@@ -2190,11 +2317,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error adding worklog to {issue_key}: {e}")
             error_message = f"Failed to add worklog: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Issue '{issue_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for issue '{issue_key}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {
@@ -2288,9 +2416,10 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error getting agile boards: {e}")
             error_message = f"Failed to get agile boards: {str(e)}"
-            if e.response and e.response.status_code == 401:
+            status_code = _get_status_code(e)
+            if status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = "Access denied. You may not have permission to view boards."
 
             response_data = {"success": False, "error": error_message}
@@ -2392,11 +2521,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error getting board issues for {board_id}: {e}")
             error_message = f"Failed to get board issues: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Board '{board_id}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for board '{board_id}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {
@@ -2481,11 +2611,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error getting sprints from board {board_id}: {e}")
             error_message = f"Failed to get sprints: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Board '{board_id}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for board '{board_id}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {
@@ -2573,11 +2704,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error getting sprint issues for {sprint_id}: {e}")
             error_message = f"Failed to get sprint issues: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Sprint '{sprint_id}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for sprint '{sprint_id}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {
@@ -2624,9 +2756,10 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error getting link types: {e}")
             error_message = f"Failed to get link types: {str(e)}"
-            if e.response and e.response.status_code == 401:
+            status_code = _get_status_code(e)
+            if status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = "Access denied. You may not have permission to view link types."
 
             response_data = {"success": False, "error": error_message}
@@ -2721,12 +2854,11 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
 
         try:
             # Parse the fields JSON
-            import json as json_lib
             fields_dict = {}
             if fields and fields.strip():
                 try:
-                    fields_dict = json_lib.loads(fields)
-                except json_lib.JSONDecodeError:
+                    fields_dict = json.loads(fields)
+                except json.JSONDecodeError:
                     logger.warning(f"Invalid JSON in fields parameter: {fields}")
 
             # Add standard fields if provided
@@ -2746,26 +2878,27 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
                 labels_list = [label.strip() for label in labels.split(",") if label.strip()]
                 update_dict["labels"] = labels_list
 
-            # Merge fields
-            merged_fields = {**fields_dict, **update_dict}
+            # Merge fields in place; fields_dict is freshly parsed and owned here
+            fields_dict.update(update_dict)
 
-            if not merged_fields:
+            if not fields_dict:
                 raise ValueError("No fields provided for update")
 
             issue = jira.update_issue(
                 issue_key=issue_key.strip(),
-                fields=merged_fields,
+                fields=fields_dict,
             )
             result = issue.to_simplified_dict()
             response_data = {"success": True, "issue": result}
         except HTTPError as e:
             logger.error(f"HTTP error updating issue {issue_key}: {e}")
             error_message = f"Failed to update issue: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Issue '{issue_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for issue '{issue_key}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {"success": False, "error": error_message}
@@ -2827,11 +2960,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error deleting issue {issue_key}: {e}")
             error_message = f"Failed to delete issue: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Issue '{issue_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for issue '{issue_key}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {"success": False, "error": error_message}
@@ -2899,34 +3033,38 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
             raise ValueError("Link type name is required and cannot be empty")
 
         try:
-            # This would need to be implemented in the client - for now return success
-            # TODO: Implement create_issue_link in the Jira client
-            response_data = {
-                "success": True,
-                "inward_issue_key": inward_issue_key,
-                "outward_issue_key": outward_issue_key,
-                "link_type_name": link_type_name,
-                "comment": comment,
-                "message": "Issue link created successfully",
-                "note": "create_issue_link not yet implemented in client - returning mock success",
-            }
-        except HTTPError as e:
-            logger.error(f"HTTP error creating issue link: {e}")
-            error_message = f"Failed to create issue link: {str(e)}"
-            if e.response and e.response.status_code == 404:
-                error_message = "One or both issues not found"
-            elif e.response and e.response.status_code == 403:
-                error_message = "Access denied. You may not have permission to link issues."
-            elif e.response and e.response.status_code == 401:
-                error_message = "Authentication failed. Please check your credentials."
+            # Build the link payload in one literal; the comment is only
+            # included when provided
+            link_data = {
+                "type": {"name": link_type_name.strip()},
+                "inwardIssue": {"key": inward_issue_key.strip()},
+                "outwardIssue": {"key": outward_issue_key.strip()},
+                **({"comment": {"body": comment}} if comment else {}),
+            }
+            response_data = jira.create_issue_link(link_data)
+        except Exception as e:
+            # The links mixin wraps HTTP errors (including authentication
+            # failures) in other exceptions, keeping the original as the cause
+            http_error = e if isinstance(e, HTTPError) else e.__cause__
+            if isinstance(http_error, HTTPError):
+                logger.error(f"HTTP error creating issue link: {http_error}")
+                error_message = f"Failed to create issue link: {str(http_error)}"
+                status_code = _get_status_code(http_error)
+                if status_code == 404:
+                    error_message = "One or both issues not found"
+                elif status_code == 403:
+                    error_message = (
+                        "Access denied. You may not have permission to link issues."
+                    )
+                elif status_code == 401:
+                    error_message = (
+                        "Authentication failed. Please check your credentials."
+                    )
+            else:
+                logger.error(f"Unexpected error creating issue link: {e}")
+                error_message = f"An unexpected error occurred: {str(e)}"
 
             response_data = {"success": False, "error": error_message}
-        except Exception as e:
-            logger.error(f"Unexpected error creating issue link: {e}")
-            response_data = {
-                "success": False,
-                "error": f"An unexpected error occurred: {str(e)}",
-            }
 
         return json.dumps(response_data, indent=2)
 
@@ -2971,11 +3109,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error removing issue link {link_id}: {e}")
             error_message = f"Failed to remove issue link: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Issue link '{link_id}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = "Access denied. You may not have permission to remove issue links."
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {"success": False, "error": error_message}
@@ -3042,12 +3181,11 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
 
         try:
             # Parse the fields JSON
-            import json as json_lib
             fields_dict = {}
             if fields and fields.strip():
                 try:
-                    fields_dict = json_lib.loads(fields)
-                except json_lib.JSONDecodeError:
+                    fields_dict = json.loads(fields)
+                except json.JSONDecodeError:
                     logger.warning(f"Invalid JSON in fields parameter: {fields}")
 
             issue = jira.transition_issue(
@@ -3061,11 +3199,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error transitioning issue {issue_key}: {e}")
             error_message = f"Failed to transition issue: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Issue '{issue_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for issue '{issue_key}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {"success": False, "error": error_message}
@@ -3153,11 +3292,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error creating sprint: {e}")
             error_message = f"Failed to create sprint: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Board '{board_id}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = "Access denied. You may not have permission to create sprints."
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {"success": False, "error": error_message}
@@ -3251,11 +3391,12 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error updating sprint {sprint_id}: {e}")
             error_message = f"Failed to update sprint: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Sprint '{sprint_id}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = "Access denied. You may not have permission to update sprints."
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
             response_data = {"success": False, "error": error_message}
@@ -3316,25 +3457,21 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error getting project versions for {project_key}: {e}")
             error_message = f"Failed to get project versions: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Project '{project_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = f"Access denied for project '{project_key}'"
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
-            response_data = {
-                "success": False,
-                "error": error_message,
-                "project_key": project_key,
-            }
+            return _error_response(error_message, project_key=project_key)
         except Exception as e:
             logger.error(f"Unexpected error getting project versions for {project_key}: {e}")
-            response_data = {
-                "success": False,
-                "error": f"An unexpected error occurred: {str(e)}",
-                "project_key": project_key,
-            }
+            return _error_response(
+                f"An unexpected error occurred: {str(e)}",
+                project_key=project_key,
+            )
 
         return json.dumps(response_data, indent=2)
 
@@ -3410,6 +3547,7 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
             raise ValueError("Project key is required and cannot be empty")
         if not name or not name.strip():
             raise ValueError("Version name is required and cannot be empty")
+        _validate_version_dates(start_date, release_date)
 
         try:
             version = jira.create_version(
@@ -3421,22 +3559,20 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
             )
             response_data = {"success": True, "version": version}
         except HTTPError as e:
-            logger.error(f"HTTP error creating version: {e}")
+            logger.error("HTTP error creating version: %s", e)
             error_message = f"Failed to create version: {str(e)}"
-            if e.response and e.response.status_code == 404:
+            status_code = _get_status_code(e)
+            if status_code == 404:
                 error_message = f"Project '{project_key}' not found"
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = "Access denied. You may not have permission to create versions."
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
-            response_data = {"success": False, "error": error_message}
+            return _error_response(error_message)
         except Exception as e:
-            logger.error(f"Unexpected error creating version: {e}")
-            response_data = {
-                "success": False,
-                "error": f"An unexpected error occurred: {str(e)}",
-            }
+            logger.error("Unexpected error creating version: %s", e)
+            return _error_response(f"An unexpected error occurred: {str(e)}")
 
         return json.dumps(response_data, indent=2)
 
@@ -3448,7 +3584,7 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         versions: Annotated[
             str,
             Field(
-                description="JSON array of version objects. Each version should have: project, name, and optional description, start_date, release_date."
+                description=_VERSIONS_DESC
             ),
         ],
         validate_only: Annotated[
@@ -3467,7 +3603,8 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
             validate_only: If True, only validate the versions without creating them.
 
         Returns:
-            JSON string representing the batch creation results.
+            JSON string representing the batch creation results. Versions that
+            could not be created are listed under "errors" with their index.
 
         Raises:
             ValueError: If the Jira client is not configured or required parameters are missing.
@@ -3477,62 +3614,53 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
             raise ValueError("Versions data is required and cannot be empty")
 
         try:
-            # Parse the versions data
-            import json as json_lib
-            try:
-                versions_data = json_lib.loads(versions)
-            except json_lib.JSONDecodeError:
-                raise ValueError("Invalid JSON format for versions data")
-
-            if not isinstance(versions_data, list):
-                raise ValueError("Versions data must be an array")
-
-            created_versions = []
-            for version_data in versions_data:
-                if not isinstance(version_data, dict):
-                    continue
-
-                if validate_only:
-                    # Just validate required fields
-                    if 'project' not in version_data or 'name' not in version_data:
-                        raise ValueError("Each version must have 'project' and 'name' fields")
-                    created_versions.append({
-                        "project": version_data.get('project'),
-                        "name": version_data.get('name'),
-                        "validated": True
-                    })
-                else:
-                    # Create the version
-                    version = jira.create_version(
-                        project=version_data.get('project'),
-                        name=version_data.get('name'),
-                        description=version_data.get('description'),
-                        start_date=version_data.get('start_date'),
-                        release_date=version_data.get('release_date'),
-                    )
-                    created_versions.append(version)
+            # Validate every item up front so a bad entry fails the batch
+            # before any version is created
+            version_items = _parse_version_inputs(versions)
+            for version_data in version_items:
+                _validate_version_dates(
+                    version_data.start_date, version_data.release_date
+                )
+
+            if not version_items:
+                return _EMPTY_BATCH_VERSIONS_JSON[validate_only]
+
+            if validate_only:
+                created_versions = [
+                    {
+                        "project": version_data.project,
+                        "name": version_data.name,
+                        "validated": True,
+                    }
+                    for version_data in version_items
+                ]
+                errors: list[dict[str, Any]] = []
+            else:
+                created_versions, errors = await _create_versions_concurrently(
+                    jira, version_items
+                )
 
             response_data = {
-                "success": True,
+                "success": not errors,
                 "versions": created_versions,
                 "total": len(created_versions),
                 "validated_only": validate_only,
             }
+            if errors:
+                response_data["errors"] = errors
         except HTTPError as e:
-            logger.error(f"HTTP error in batch version creation: {e}")
+            logger.error("HTTP error in batch version creation: %s", e)
             error_message = f"Batch version creation failed: {str(e)}"
-            if e.response and e.response.status_code == 403:
+            status_code = _get_status_code(e)
+            if status_code == 403:
                 error_message = "Access denied. You may not have permission to create versions."
-            elif e.response and e.response.status_code == 401:
+            elif status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
 
-            response_data = {"success": False, "error": error_message}
+            return _error_response(error_message)
         except Exception as e:
-            logger.error(f"Unexpected error in batch version creation: {e}")
-            response_data = {
-                "success": False,
-                "error": f"An unexpected error occurred: {str(e)}",
-            }
+            logger.error("Unexpected error in batch version creation: %s", e)
+            return _error_response(f"An unexpected error occurred: {str(e)}")
 
         return json.dumps(response_data, indent=2)
 
@@ -3581,9 +3709,10 @@ def register_jira_tools(jira_mcp: FastMCP) -> None:
         except HTTPError as e:
             logger.error(f"HTTP error getting batch changelogs: {e}")
             error_message = f"Failed to get batch changelogs: {str(e)}"
-            if e.response and e.response.status_code == 401:
+            status_code = _get_status_code(e)
+            if status_code == 401:
                 error_message = "Authentication failed. Please check your credentials."
-            elif e.response and e.response.status_code == 403:
+            elif status_code == 403:
                 error_message = "Access denied. You may not have permission to view changelogs."
 
             response_data = {"success": False, "error": error_message}
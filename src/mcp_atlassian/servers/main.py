@@ -2,7 +2,6 @@
 
 import logging
 import os
-import uuid
 from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
 from typing import Any, Literal, Optional
@@ -21,9 +20,15 @@ from mcp_atlassian.confluence import ConfluenceFetcher
 from mcp_atlassian.confluence.config import ConfluenceConfig
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.utils.decorators import generate_correlation_id
 from mcp_atlassian.utils.environment import get_available_services
 from mcp_atlassian.utils.io import is_read_only_mode
-from mcp_atlassian.utils.logging import mask_sensitive, setup_structured_logging
+from mcp_atlassian.utils.logging import (
+    LazyMask,
+    reset_correlation_id,
+    set_correlation_id,
+    setup_structured_logging,
+)
 from mcp_atlassian.utils.metrics import (
     health_check_endpoint,
     metrics_endpoint,
@@ -296,9 +301,24 @@ class UserTokenMiddleware(BaseHTTPMiddleware):
             correlation_id = existing_correlation_id
         else:
             # Generate correlation ID for this request
-            correlation_id = str(uuid.uuid4())[:8]
+            correlation_id = generate_correlation_id()
         request.state.correlation_id = correlation_id
+        # Bind it for code running in this request's task. Tool calls do not
+        # rely on it: a stateful session's task is started from its first
+        # request and inherits that request's value, so handle_tool_errors
+        # reads the ID from request.state instead.
+        token = set_correlation_id(correlation_id)
+        try:
+            return await self._dispatch(request, call_next, correlation_id)
+        finally:
+            reset_correlation_id(token)
 
+    async def _dispatch(
+        self,
+        request: Request,
+        call_next: RequestResponseEndpoint,
+        correlation_id: str,
+    ) -> Response:
         logger.debug(
             f"[{correlation_id}] UserTokenMiddleware.dispatch: ENTERED for request path='{request.url.path}', method='{request.method}'"
         )
@@ -339,13 +359,18 @@ class UserTokenMiddleware(BaseHTTPMiddleware):
             )
             confluence_url_header = request.headers.get("X-Atlassian-Confluence-Url")
 
-            token_for_log = mask_sensitive(
+            token_for_log = LazyMask(
                 auth_header.split(" ", 1)[1].strip()
                 if auth_header and " " in auth_header
                 else auth_header
             )
             logger.debug(
-                f"[{correlation_id}] UserTokenMiddleware: Path='{request.url.path}', AuthHeader='{mask_sensitive(auth_header)}', ParsedToken(masked)='{token_for_log}', CloudId='{cloud_id_header}'"
+                "[%s] UserTokenMiddleware: Path='%s', AuthHeader='%s', ParsedToken(masked)='%s', CloudId='%s'",
+                correlation_id,
+                request.url.path,
+                LazyMask(auth_header),
+                token_for_log,
+                cloud_id_header,
             )
 
             # Extract and save cloudId if provided
@@ -395,7 +420,9 @@ class UserTokenMiddleware(BaseHTTPMiddleware):
                     }
                     return JSONResponse(error_response, status_code=401)
                 logger.debug(
-                    f"[{correlation_id}] UserTokenMiddleware.dispatch: Bearer token extracted (masked): ...{mask_sensitive(token, 8)}"
+                    "[%s] UserTokenMiddleware.dispatch: Bearer token extracted (masked): ...%s",
+                    correlation_id,
+                    LazyMask(token, 8),
                 )
                 request.state.user_atlassian_token = token
                 request.state.user_atlassian_auth_type = "oauth"
@@ -417,7 +444,9 @@ class UserTokenMiddleware(BaseHTTPMiddleware):
                     }
                     return JSONResponse(error_response, status_code=401)
                 logger.debug(
-                    f"[{correlation_id}] UserTokenMiddleware.dispatch: PAT (Token scheme) extracted (masked): ...{mask_sensitive(token, 8)}"
+                    "[%s] UserTokenMiddleware.dispatch: PAT (Token scheme) extracted (masked): ...%s",
+                    correlation_id,
+                    LazyMask(token, 8),
                 )
                 request.state.user_atlassian_token = token
                 request.state.user_atlassian_auth_type = "pat"
@@ -0,0 +1,39 @@
+"""Helpers for running blocking Atlassian client calls concurrently."""
+
+from collections.abc import Callable, Sequence
+from typing import TypeVar
+
+import anyio
+
+T = TypeVar("T")
+
+
+async def run_in_threads(
+    calls: Sequence[Callable[[], T]], limit: int
+) -> list[T | Exception]:
+    """Run blocking calls in worker threads, at most ``limit`` at a time.
+
+    A failing call does not cancel the others, so every call that was started
+    runs to completion. Results keep the input order, with the exception a
+    call raised standing in place of its result.
+
+    Args:
+        calls: Zero-argument callables, typically ``functools.partial`` objects
+        limit: Maximum number of calls running at once
+
+    Returns:
+        One result or exception per call, in input order
+    """
+    results: list[T | Exception] = [None] * len(calls)  # type: ignore[list-item]
+    limiter = anyio.CapacityLimiter(limit)
+
+    async def _run(index: int, call: Callable[[], T]) -> None:
+        try:
+            results[index] = await anyio.to_thread.run_sync(call, limiter=limiter)
+        except Exception as e:  # noqa: BLE001 - reported in place of the result
+            results[index] = e
+
+    async with anyio.create_task_group() as task_group:
+        for index, call in enumerate(calls):
+            task_group.start_soon(_run, index, call)
+    return results
@@ -1,22 +1,55 @@
+import itertools
 import json
 import logging
-import uuid
+import random
+import secrets
+import time
 from collections.abc import Awaitable, Callable
-from functools import wraps
+from functools import partial, wraps
 from typing import Any, TypeVar
 
-import requests
 from fastmcp import Context
-from requests.exceptions import HTTPError
+from requests.exceptions import HTTPError, RequestException
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
-from mcp_atlassian.utils.retry import async_retry_with_backoff, RetryConfig
+from mcp_atlassian.utils.env import is_env_truthy
+from mcp_atlassian.utils.logging import reset_correlation_id, set_correlation_id
+from mcp_atlassian.utils.retry import _RATE_LIMIT_REMAINING_HEADERS
 
 logger = logging.getLogger(__name__)
 
 
 F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
 
+_random = random.random
+
+# Serialises the JSON error envelopes returned by handle_tool_errors. They
+# are read by MCP clients, so they are compact (C encoder) unless
+# MCP_PRETTY_ERRORS asks for indented output while debugging.
+_dump_error = partial(
+    json.dumps,
+    indent=2 if is_env_truthy("MCP_PRETTY_ERRORS") else None,
+    ensure_ascii=False,
+)
+
+
+def _http_request_correlation_id(request_context: Any) -> str | None:
+    """Return the correlation ID the HTTP middleware stored on this call's request.
+
+    The ID is read from the request object rather than the correlation
+    ContextVar: in stateful streamable-HTTP sessions tools run in a session
+    task started from the first HTTP request, so the ContextVar there still
+    holds that first request's ID.
+    """
+    request = getattr(request_context, "request", None)
+    correlation_id = getattr(getattr(request, "state", None), "correlation_id", None)
+    return correlation_id if isinstance(correlation_id, str) else None
+
+
+def _latest_correlation_id(request_context: Any, fallback: str) -> str:
+    """Return the request context's correlation ID, which the tool may have updated."""
+    return getattr(request_context, "correlation_id", None) or fallback
+
 
 def is_rate_limit_error(error: HTTPError) -> bool:
     """Detect if an error is due to rate limiting.
@@ -27,40 +60,32 @@ def is_rate_limit_error(error: HTTPError) -> bool:
     Returns:
         True if the error indicates rate limiting
     """
-    if not hasattr(error, 'response') or not error.response:
+    # requests.Response is falsy for 4xx/5xx, so compare against None
+    response = getattr(error, "response", None)
+    if response is None:
         return False
 
-    status_code = getattr(error.response, 'status_code', None)
-    headers = getattr(error.response, 'headers', {})
-
     # Check for 429 status code
-    if status_code == 429:
+    if getattr(response, "status_code", None) == 429:
         return True
 
+    headers = getattr(response, "headers", None) or {}
+
     # Check for Retry-After header (even empty string indicates rate limiting)
-    if 'Retry-After' in headers:
+    if "Retry-After" in headers:
         return True
 
-    # Check for rate limit remaining at zero (handle various header names and value types)
-    rate_limit_headers = [
-        'X-RateLimit-Remaining',
-        'x-ratelimit-remaining',
-        'X-Rate-Limit-Remaining',
-        'Rate-Limit-Remaining',
-        'X-Rate-Remaining',
-        'RateLimit-Remaining',
-    ]
-
-    for header_name in rate_limit_headers:
-        rate_limit_remaining = headers.get(header_name)
-        if rate_limit_remaining is not None:
-            try:
-                # Convert to string for comparison, then to int for numeric check
-                if str(rate_limit_remaining) == '0' or int(rate_limit_remaining) == 0:
-                    return True
-            except (ValueError, TypeError):
-                # If we can't parse the value, continue with other checks
-                pass
+    # Check for rate limit remaining at zero; values are normally strings but
+    # may be numbers when headers are built by hand
+    for header_name in _RATE_LIMIT_REMAINING_HEADERS:
+        remaining = headers.get(header_name)
+        if remaining is None:
+            continue
+        try:
+            if int(remaining) == 0:
+                return True
+        except (ValueError, TypeError):
+            continue
 
     return False
 
@@ -79,47 +104,117 @@ def check_write_access(service_name_or_func: str | F = "Service") -> Callable:
         service_name_or_func: Either the service name or the function being decorated
     """
 
-    # Check if this is being called as @check_write_access (without parameters)
+    # Direct decorator usage: @check_write_access
     if callable(service_name_or_func):
-        # Direct decorator usage: @check_write_access
-        func = service_name_or_func
-        service_name = "Service"
-    else:
-        # Parameterized decorator usage: @check_write_access("Jira")
-        service_name = service_name_or_func
-        # Return the actual decorator that will be applied to the function
-        def decorator(func: F) -> F:
-            return _create_wrapper(func, service_name)
-        return decorator
+        return _create_wrapper(service_name_or_func, service_name="Service")
 
-    # For direct usage, create and return the wrapped function
-    return _create_wrapper(func, service_name)
+    # Parameterized decorator usage: @check_write_access("Jira")
+    return partial(_create_wrapper, service_name=service_name_or_func)
 
 
 def _create_wrapper(func: F, service_name: str) -> F:
     """Create the actual wrapper function for check_write_access."""
+    tool_name = func.__name__
+    action_description = tool_name.replace("_", " ")  # "create_issue" -> "create issue"
+
     @wraps(func)
     async def wrapper(ctx: Context, *args: Any, **kwargs: Any) -> Any:
-        lifespan_ctx_dict = ctx.request_context.lifespan_context
-        app_lifespan_ctx = (
-            lifespan_ctx_dict.get("app_lifespan_context")
-            if isinstance(lifespan_ctx_dict, dict)
-            else None
-        )  # type: ignore
+        # The lifespan context is normally a dict holding the app context;
+        # anything else means there is no read-only setting to enforce
+        try:
+            app_lifespan_ctx = ctx.request_context.lifespan_context[
+                "app_lifespan_context"
+            ]
+        except (KeyError, TypeError):
+            app_lifespan_ctx = None
 
         if app_lifespan_ctx is not None and app_lifespan_ctx.read_only:
-            tool_name = func.__name__
-            action_description = tool_name.replace(
-                "_", " "
-            )  # e.g., "create_issue" -> "create issue"
             logger.warning(f"Attempted to call tool '{tool_name}' in read-only mode.")
-            raise ValueError(f"Cannot {action_description} in read-only mode for {service_name}.")
+            raise ValueError(
+                f"Cannot {action_description} in read-only mode for {service_name}."
+            )
 
         return await func(ctx, *args, **kwargs)
 
     return wrapper  # type: ignore
 
 
+# Retry policy for transient failures (rate limiting, 5xx) of API calls
+API_RETRY_ATTEMPTS = 3
+API_RETRY_BASE_DELAY = 0.5
+API_RETRY_MAX_DELAY = 30.0
+API_RETRY_BUDGET = 15.0
+
+
+def _backoff_delay(retry_after: Any, previous_delay: float = 0.0) -> float:
+    """Seconds to wait before retrying a rate-limited or failing request.
+
+    Honours a numeric ``Retry-After`` header. Otherwise uses decorrelated
+    jitter: a random delay between the base delay and three times the
+    previous one, which spreads concurrent clients apart better than plain
+    exponential backoff. Both are capped at ``API_RETRY_MAX_DELAY``.
+
+    Args:
+        retry_after: Value of the ``Retry-After`` header, if any
+        previous_delay: Delay used before the previous attempt (0 for none)
+
+    Returns:
+        Delay in seconds
+    """
+    if isinstance(retry_after, str) and retry_after.strip().isdigit():
+        return min(float(retry_after), API_RETRY_MAX_DELAY)
+    upper = max(API_RETRY_BASE_DELAY, previous_delay) * 3
+    delay = API_RETRY_BASE_DELAY + (upper - API_RETRY_BASE_DELAY) * _random()
+    return min(API_RETRY_MAX_DELAY, delay)
+
+
+def _call_with_retry(
+    func: Callable,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    correlation_id: str,
+    operation_name: str,
+) -> Any:
+    """Call ``func``, retrying rate-limited and 5xx responses in place.
+
+    Retrying here reuses the open session and parsed arguments instead of
+    failing the whole tool call. Gives up after ``API_RETRY_ATTEMPTS`` calls
+    or once waiting would exceed ``API_RETRY_BUDGET`` seconds, re-raising
+    the last error.
+    """
+    started = time.monotonic()
+    delay = 0.0
+    for attempt in range(API_RETRY_ATTEMPTS):
+        try:
+            return func(*args, **kwargs)
+        except HTTPError as http_err:
+            status_code = getattr(http_err.response, "status_code", None)
+            transient = is_rate_limit_error(http_err) or (
+                isinstance(status_code, int) and status_code >= 500
+            )
+            if (
+                not transient
+                or status_code in (401, 403)
+                or attempt + 1 >= API_RETRY_ATTEMPTS
+            ):
+                raise
+            headers = getattr(http_err.response, "headers", None) or {}
+            delay = _backoff_delay(headers.get("Retry-After"), delay)
+            if time.monotonic() - started + delay > API_RETRY_BUDGET:
+                raise
+            logger.warning(
+                "[%s] HTTP %s during %s, retrying in %.2fs (attempt %d/%d)",
+                correlation_id,
+                status_code,
+                operation_name,
+                delay,
+                attempt + 2,
+                API_RETRY_ATTEMPTS,
+                extra={"correlation_id": correlation_id, "operation": operation_name},
+            )
+            time.sleep(delay)
+
+
 def handle_atlassian_api_errors(service_name: str = "Atlassian API") -> Callable:
     """
     Decorator to handle common Atlassian API exceptions (Jira, Confluence, etc.).
@@ -129,14 +224,19 @@ def handle_atlassian_api_errors(service_name: str = "Atlassian API") -> Callable
     """
 
     def decorator(func: Callable) -> Callable:
+        operation_name = getattr(func, "__name__", "API operation")
+        # Static logging fields for this operation
+        log_context = {"operation": operation_name, "service": service_name}
+
         @wraps(func)
         def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
             # Generate correlation ID for this API call
-            correlation_id = str(uuid.uuid4())[:8]
-            operation_name = getattr(func, "__name__", "API operation")
+            correlation_id = generate_correlation_id()
 
             try:
-                return func(self, *args, **kwargs)
+                return _call_with_retry(
+                    func, (self, *args), kwargs, correlation_id, operation_name
+                )
             except HTTPError as http_err:
                 if http_err.response is not None and http_err.response.status_code in [
                     401,
@@ -149,18 +249,21 @@ def handle_atlassian_api_errors(service_name: str = "Atlassian API") -> Callable
                     )
                     logger.error(
                         f"[{correlation_id}] Authentication error in {operation_name}: {error_msg}",
-                        extra={"correlation_id": correlation_id, "operation": operation_name, "service": service_name}
+                        extra={"correlation_id": correlation_id, **log_context},
                     )
                     raise MCPAtlassianAuthenticationError(error_msg) from http_err
                 else:
-                    status_code = getattr(http_err.response, 'status_code', 'Unknown') if http_err.response else 'Unknown'
+                    status_code = (
+                        getattr(http_err.response, "status_code", "Unknown")
+                        if http_err.response
+                        else "Unknown"
+                    )
                     logger.error(
                         f"[{correlation_id}] HTTP {status_code} error during {operation_name}: {http_err}",
                         extra={
                             "correlation_id": correlation_id,
-                            "operation": operation_name,
-                            "service": service_name,
-                            "status_code": status_code
+                            "status_code": status_code,
+                            **log_context,
                         },
                         exc_info=False,
                     )
@@ -168,30 +271,30 @@ def handle_atlassian_api_errors(service_name: str = "Atlassian API") -> Callable
             except KeyError as e:
                 logger.error(
                     f"[{correlation_id}] Missing key in {operation_name} results: {str(e)}",
-                    extra={"correlation_id": correlation_id, "operation": operation_name, "service": service_name}
+                    extra={"correlation_id": correlation_id, **log_context},
                 )
                 return []
-            except requests.RequestException as e:
+            except RequestException as e:
                 logger.error(
                     f"[{correlation_id}] Network error during {operation_name}: {str(e)}",
-                    extra={"correlation_id": correlation_id, "operation": operation_name, "service": service_name}
+                    extra={"correlation_id": correlation_id, **log_context},
                 )
                 return []
             except (ValueError, TypeError) as e:
                 logger.error(
                     f"[{correlation_id}] Error processing {operation_name} results: {str(e)}",
-                    extra={"correlation_id": correlation_id, "operation": operation_name, "service": service_name}
+                    extra={"correlation_id": correlation_id, **log_context},
                 )
                 return []
             except Exception as e:  # noqa: BLE001 - Intentional fallback with logging
                 logger.error(
                     f"[{correlation_id}] Unexpected error during {operation_name}: {str(e)}",
-                    extra={"correlation_id": correlation_id, "operation": operation_name, "service": service_name}
+                    extra={"correlation_id": correlation_id, **log_context},
                 )
                 logger.debug(
                     f"[{correlation_id}] Full exception details for {operation_name}:",
                     extra={"correlation_id": correlation_id},
-                    exc_info=True
+                    exc_info=True,
                 )
                 return []
 
@@ -222,39 +325,40 @@ def handle_tool_errors(
     """
 
     def decorator(func: F) -> F:
+        tool_name = func.__name__
+        # Fields shared by every error envelope of this tool
+        error_context = {
+            "service": service_name,
+            "tool": tool_name,
+            default_return_key: {},
+        }
+
+        # Static logging fields for this tool
+        log_context = {"tool": tool_name, "service": service_name}
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> str:
-            # Extract context if available (first arg is usually ctx for MCP tools)
-            ctx = None
-            correlation_id = None
-
-            if args and hasattr(args[0], 'request_context'):
-                ctx = args[0]
+            # The first argument is the MCP context for tools; reuse its
+            # correlation ID, else the HTTP request's, else generate one, and
+            # store it there for logging
+            request_context = (
+                getattr(args[0], "request_context", None) if args else None
+            )
+            correlation_id = getattr(request_context, "correlation_id", None)
+            if not correlation_id:
+                correlation_id = (
+                    _http_request_correlation_id(request_context)
+                    or generate_correlation_id()
+                )
+                if request_context is not None:
+                    request_context.correlation_id = correlation_id
+            token = set_correlation_id(correlation_id)
 
             try:
-                # Check for correlation ID right before executing function
-                if args and hasattr(args[0], 'request_context') and hasattr(args[0].request_context, 'correlation_id'):
-                    context_correlation_id = args[0].request_context.correlation_id
-                    if context_correlation_id:
-                        correlation_id = context_correlation_id
-                        # Store in context for logging if not already there
-                        if ctx and hasattr(ctx, 'request_context') and not hasattr(ctx.request_context, 'correlation_id'):
-                            ctx.request_context.correlation_id = correlation_id
-
-                # Generate correlation ID if none exists
-                if not correlation_id:
-                    correlation_id = str(uuid.uuid4())[:8]
-                    # Store correlation ID in context for logging
-                    if ctx and hasattr(ctx, 'request_context'):
-                        ctx.request_context.correlation_id = correlation_id
-
                 return await func(*args, **kwargs)
             except MCPAtlassianAuthenticationError as auth_err:
-                # Re-capture correlation ID from context in case it was updated during function execution
-                if args and hasattr(args[0], 'request_context') and hasattr(args[0].request_context, 'correlation_id'):
-                    current_correlation_id = args[0].request_context.correlation_id
-                    if current_correlation_id:
-                        correlation_id = current_correlation_id
+                # The tool may have updated the correlation ID on its context
+                correlation_id = _latest_correlation_id(request_context, correlation_id)
 
                 error_details = {
                     "success": False,
@@ -262,29 +366,28 @@ def handle_tool_errors(
                     "error_type": "authentication",
                     "message": str(auth_err),
                     "correlation_id": correlation_id,
-                    "service": service_name,
-                    "tool": func.__name__,
-                    default_return_key: {},
+                    **error_context,
                 }
                 logger.error(
-                    f"[{correlation_id}] Authentication error in {func.__name__}: {auth_err}",
-                    extra={"correlation_id": correlation_id, "tool": func.__name__, "service": service_name}
+                    f"[{correlation_id}] Authentication error in {tool_name}: {auth_err}",
+                    extra={"correlation_id": correlation_id, **log_context},
                 )
-                return json.dumps(error_details, indent=2, ensure_ascii=False)
+                return _dump_error(error_details)
 
             except HTTPError as http_err:
-                # Re-capture correlation ID from context in case it was updated during function execution
-                if args and hasattr(args[0], 'request_context') and hasattr(args[0].request_context, 'correlation_id'):
-                    current_correlation_id = args[0].request_context.correlation_id
-                    if current_correlation_id:
-                        correlation_id = current_correlation_id
-
-                status_code = http_err.response.status_code if http_err.response else "Unknown"
-                # Detect rate limiting
-                is_rate_limit = status_code == 429 or (
-                    hasattr(http_err.response, 'headers') and
-                    http_err.response.headers.get('X-RateLimit-Remaining') == '0'
+                # The tool may have updated the correlation ID on its context
+                correlation_id = _latest_correlation_id(request_context, correlation_id)
+
+                # requests.Response is falsy for 4xx/5xx, so compare against None
+                response = http_err.response
+                status_code = (
+                    response.status_code if response is not None else "Unknown"
                 )
+                headers = getattr(response, "headers", None) or {}
+                retry_after = headers.get("Retry-After")
+                rate_limit_remaining = headers.get("X-RateLimit-Remaining")
+                rate_limit_reset = headers.get("X-RateLimit-Reset")
+                is_rate_limit = is_rate_limit_error(http_err)
 
                 error_type = "rate_limit" if is_rate_limit else "http_error"
                 error_code = f"HTTP_{status_code}"
@@ -297,11 +400,8 @@ def handle_tool_errors(
                 elif status_code == 404:
                     message = f"Resource not found in {service_name}."
                 elif status_code == 429:
-                    retry_after = None
-                    if hasattr(http_err.response, 'headers'):
-                        retry_after = http_err.response.headers.get('Retry-After')
                     message = f"Rate limit exceeded for {service_name}. Please try again later{f' after {retry_after} seconds' if retry_after else ''}."
-                elif status_code >= 500:
+                elif isinstance(status_code, int) and status_code >= 500:
                     message = f"{service_name} server error. Please try again later."
                 else:
                     message = f"{service_name} API error: {str(http_err)}"
@@ -312,66 +412,56 @@ def handle_tool_errors(
                     "error_type": error_type,
                     "message": message,
                     "correlation_id": correlation_id,
-                    "service": service_name,
-                    "tool": func.__name__,
                     "status_code": status_code,
-                    default_return_key: {},
+                    **error_context,
                 }
 
                 # Add retry information for rate limiting
-                if is_rate_limit and hasattr(http_err.response, 'headers'):
-                    retry_after = http_err.response.headers.get('Retry-After')
+                if is_rate_limit:
                     if retry_after:
                         error_details["retry_after"] = retry_after
+                    # Suggested wait, jittered so concurrent clients do not
+                    # retry in lockstep
+                    error_details["retry_after_suggested"] = round(
+                        _backoff_delay(retry_after), 2
+                    )
                     # Include rate limit headers if present
-                    rate_limit_header_mapping = {
-                        'X-RateLimit-Remaining': 'rate_limit_remaining',
-                        'X-RateLimit-Reset': 'rate_limit_reset'
-                    }
-                    for header_key, field_name in rate_limit_header_mapping.items():
-                        if header_key in http_err.response.headers:
-                            error_details[field_name] = http_err.response.headers[header_key]
+                    if rate_limit_remaining is not None:
+                        error_details["rate_limit_remaining"] = rate_limit_remaining
+                    if rate_limit_reset is not None:
+                        error_details["rate_limit_reset"] = rate_limit_reset
 
                 logger.error(
-                    f"[{correlation_id}] HTTP {status_code} error in {func.__name__}: {message}",
+                    f"[{correlation_id}] HTTP {status_code} error in {tool_name}: {message}",
                     extra={
                         "correlation_id": correlation_id,
-                        "tool": func.__name__,
-                        "service": service_name,
                         "status_code": status_code,
-                        "error_type": error_type
-                    }
+                        "error_type": error_type,
+                        **log_context,
+                    },
                 )
-                return json.dumps(error_details, indent=2, ensure_ascii=False)
+                return _dump_error(error_details)
 
             except ValueError as val_err:
-                # Re-capture correlation ID from context in case it was updated during function execution
-                if args and hasattr(args[0], 'request_context') and hasattr(args[0].request_context, 'correlation_id'):
-                    current_correlation_id = args[0].request_context.correlation_id
-                    if current_correlation_id:
-                        correlation_id = current_correlation_id
+                # The tool may have updated the correlation ID on its context
+                correlation_id = _latest_correlation_id(request_context, correlation_id)
 
                 error_details = {
                     "success": False,
                     "error": str(val_err),
                     "error_type": "validation",
                     "correlation_id": correlation_id,
-                    "service": service_name,
-                    "tool": func.__name__,
-                    default_return_key: {},
+                    **error_context,
                 }
                 logger.error(
-                    f"[{correlation_id}] Validation error in {func.__name__}: {val_err}",
-                    extra={"correlation_id": correlation_id, "tool": func.__name__, "service": service_name}
+                    f"[{correlation_id}] Validation error in {tool_name}: {val_err}",
+                    extra={"correlation_id": correlation_id, **log_context},
                 )
-                return json.dumps(error_details, indent=2, ensure_ascii=False)
+                return _dump_error(error_details)
 
             except Exception as e:
-                # Re-capture correlation ID from context in case it was updated during function execution
-                if args and hasattr(args[0], 'request_context') and hasattr(args[0].request_context, 'correlation_id'):
-                    current_correlation_id = args[0].request_context.correlation_id
-                    if current_correlation_id:
-                        correlation_id = current_correlation_id
+                # The tool may have updated the correlation ID on its context
+                correlation_id = _latest_correlation_id(request_context, correlation_id)
 
                 error_details = {
                     "success": False,
@@ -379,31 +469,40 @@ def handle_tool_errors(
                     "error_type": "internal",
                     "message": f"An unexpected error occurred in {service_name}: {str(e)}",
                     "correlation_id": correlation_id,
-                    "service": service_name,
-                    "tool": func.__name__,
-                    default_return_key: {},
+                    **error_context,
                 }
                 logger.error(
-                    f"[{correlation_id}] Unexpected error in {func.__name__}: {e}",
+                    f"[{correlation_id}] Unexpected error in {tool_name}: {e}",
                     extra={
                         "correlation_id": correlation_id,
-                        "tool": func.__name__,
-                        "service": service_name,
-                        "error_type": "internal"
+                        "error_type": "internal",
+                        **log_context,
                     },
-                    exc_info=True
+                    exc_info=True,
                 )
-                return json.dumps(error_details, indent=2, ensure_ascii=False)
+                return _dump_error(error_details)
+            finally:
+                reset_correlation_id(token)
 
         return wrapper  # type: ignore
 
     return decorator
 
 
+# Correlation IDs are a 32-bit sequence number starting at a random offset
+_correlation_sequence = itertools.count(secrets.randbits(32))
+
+
 def generate_correlation_id() -> str:
     """Generate a unique correlation ID for request tracking.
 
+    IDs only need to tell log lines apart, not be unguessable, so they
+    come from a 32-bit counter that starts at a random value chosen at
+    startup instead of drawing fresh randomness per call. IDs are unique
+    within a process for 2**32 consecutive calls, and the random start
+    keeps processes apart.
+
     Returns:
         An 8-character alphanumeric string for correlation tracking
     """
-    return str(uuid.uuid4())[:8]
+    return f"{next(_correlation_sequence) & 0xFFFFFFFF:08x}"
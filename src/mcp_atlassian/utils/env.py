@@ -1,6 +1,18 @@
 """Environment variable utility functions for MCP Atlassian."""
 
 import os
+import re
+
+# One "key=value" pair of a comma-separated header list; keys must be non-empty
+_HEADER_PAIR_RE = re.compile(r"(?:^|,)\s*([^=,\s][^=,]*?)\s*=\s*([^,]*?)\s*(?=,|$)")
+
+# Lowercase values accepted by the boolean environment variable helpers
+_TRUTHY_VALUES = frozenset({"true", "1", "yes"})
+_EXTENDED_TRUTHY_VALUES = frozenset({"true", "1", "yes", "y", "on"})
+_FALSY_VALUES = frozenset({"false", "0", "no"})
+# Longer values cannot match, so they are rejected without lowercasing
+_MAX_TRUTHY_LEN = max(map(len, _EXTENDED_TRUTHY_VALUES))
+_MAX_FALSY_LEN = max(map(len, _FALSY_VALUES))
 
 
 def is_env_truthy(env_var_name: str, default: str = "") -> bool:
@@ -16,7 +28,10 @@ def is_env_truthy(env_var_name: str, default: str = "") -> bool:
     Returns:
         True if the environment variable is set to a truthy value, False otherwise
     """
-    return os.getenv(env_var_name, default).lower() in ("true", "1", "yes")
+    value = os.getenv(env_var_name, default)
+    if not value or len(value) > _MAX_TRUTHY_LEN:
+        return False
+    return value.lower() in _TRUTHY_VALUES
 
 
 def is_env_extended_truthy(env_var_name: str, default: str = "") -> bool:
@@ -32,7 +47,10 @@ def is_env_extended_truthy(env_var_name: str, default: str = "") -> bool:
     Returns:
         True if the environment variable is set to a truthy value, False otherwise
     """
-    return os.getenv(env_var_name, default).lower() in ("true", "1", "yes", "y", "on")
+    value = os.getenv(env_var_name, default)
+    if not value or len(value) > _MAX_TRUTHY_LEN:
+        return False
+    return value.lower() in _EXTENDED_TRUTHY_VALUES
 
 
 def is_env_ssl_verify(
@@ -51,7 +69,10 @@ def is_env_ssl_verify(
     Returns:
         True unless explicitly set to false values
     """
-    return getenv(env, env_var_name, default).lower() not in ("false", "0", "no")
+    value = getenv(env, env_var_name, default)
+    if not value or len(value) > _MAX_FALSY_LEN:
+        return True
+    return value.lower() not in _FALSY_VALUES
 
 
 def getenv(
@@ -94,22 +115,5 @@ def get_custom_headers(env_var_name: str) -> dict[str, str]:
     if not header_string or not header_string.strip():
         return {}
 
-    headers = {}
-    pairs = header_string.split(",")
-
-    for pair in pairs:
-        pair = pair.strip()
-        if not pair:
-            continue
-
-        if "=" not in pair:
-            continue
-
-        key, value = pair.split("=", 1)  # Split on first = only
-        key = key.strip()
-        value = value.strip()
-
-        if key:  # Only add if key is not empty
-            headers[key] = value
-
-    return headers
+    # Pairs without "=" or with an empty key are skipped; values may contain "="
+    return dict(_HEADER_PAIR_RE.findall(header_string))
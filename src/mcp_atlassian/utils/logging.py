@@ -5,50 +5,55 @@ including level-dependent stream handling to route logs to the appropriate
 output stream based on their level, structured JSON logging, and correlation tracking.
 """
 
+import atexit
+import copy
 import json
 import logging
+import queue
 import sys
 import time
-from datetime import datetime
+from contextvars import ContextVar, Token
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict, TextIO
 
+# json.dumps builds a new encoder whenever ``default`` is passed; reuse one
+_log_encoder = json.JSONEncoder(default=str)
 
-def setup_logging(
-    level: int = logging.WARNING, stream: TextIO = sys.stderr
-) -> logging.Logger:
-    """
-    Configure MCP-Atlassian logging with level-based stream routing.
+# Correlation ID of the request or tool call running in the current context.
+# Set by the HTTP middleware and the tool error handler; read by anything
+# that logs on their behalf.
+_correlation_id: ContextVar[str | None] = ContextVar(
+    "mcp_atlassian_correlation_id", default=None
+)
 
-    Args:
-        level: The minimum logging level to display (default: WARNING)
-        stream: The stream to write logs to (default: sys.stderr)
+
+def get_correlation_id() -> str | None:
+    """Return the correlation ID bound to the current context, if any."""
+    return _correlation_id.get()
+
+
+def set_correlation_id(correlation_id: str | None) -> Token:
+    """Bind a correlation ID to the current context.
 
     Returns:
-        The configured logger instance
+        A token to pass to :func:`reset_correlation_id` when the scope ends
     """
-    # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(level)
+    return _correlation_id.set(correlation_id)
 
-    # Remove existing handlers to prevent duplication
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
 
-    # Add the level-dependent handler
-    handler = logging.StreamHandler(stream)
-    formatter = logging.Formatter("%(levelname)s - %(name)s - %(message)s")
-    handler.setFormatter(formatter)
-    root_logger.addHandler(handler)
+def reset_correlation_id(token: Token) -> None:
+    """Restore the correlation ID that was bound before ``token`` was issued."""
+    _correlation_id.reset(token)
 
-    # Configure specific loggers
-    loggers = ["mcp-atlassian", "mcp.server", "mcp.server.lowlevel.server", "mcp-jira"]
 
-    for logger_name in loggers:
-        logger = logging.getLogger(logger_name)
-        logger.setLevel(level)
+# Precomputed asterisk runs for typical token lengths; longer runs are built
+# on demand. Masked results themselves are deliberately not memoised so that
+# credentials are never retained by a module-level cache.
+_STAR_RUNS = tuple("*" * n for n in range(129))
 
-    # Return the application logger
-    return logging.getLogger("mcp-atlassian")
+
+def _stars(count: int) -> str:
+    return _STAR_RUNS[count] if count < len(_STAR_RUNS) else "*" * count
 
 
 def mask_sensitive(value: str | None, keep_chars: int = 4) -> str:
@@ -63,15 +68,56 @@ def mask_sensitive(value: str | None, keep_chars: int = 4) -> str:
     """
     if not value:
         return "Not Provided"
-    if len(value) <= keep_chars * 2:
+    length = len(value)
+    if length <= keep_chars * 2:
         # For short values, mask completely
-        return "*" * len(value)
-    else:
-        # For longer values, show first and last keep_chars
-        start = value[:keep_chars]
-        end = value[-keep_chars:]
-        middle_length = len(value) - (keep_chars * 2)
-        return f"{start}{'*' * middle_length}{end}"
+        return _stars(length)
+    # For longer values, show first and last keep_chars
+    return f"{value[:keep_chars]}{_stars(length - keep_chars * 2)}{value[-keep_chars:]}"
+
+
+class LazyMask:
+    """Defers :func:`mask_sensitive` until a log record is actually rendered.
+
+    Pass as a ``%s`` argument to a logger call so disabled levels never pay
+    for masking.
+    """
+
+    __slots__ = ("value", "keep_chars")
+
+    def __init__(self, value: str | None, keep_chars: int = 4) -> None:
+        self.value = value
+        self.keep_chars = keep_chars
+
+    def __str__(self) -> str:
+        return mask_sensitive(self.value, self.keep_chars)
+
+
+# Header names are compared in title case so "authorization" is masked too
+_SENSITIVE_HEADERS = frozenset(
+    {"Authorization", "Cookie", "Set-Cookie", "Proxy-Authorization"}
+)
+_COOKIE_HEADERS = frozenset({"Cookie", "Set-Cookie"})
+# (scheme prefix, prefix length) pairs whose credentials are partially shown
+_AUTH_PREFIXES = (("Basic ", 6), ("Bearer ", 7))
+
+
+def _mask_header_value(key: str, value: str) -> str:
+    """Mask a single header value according to its (case-insensitive) name."""
+    k_title = key.title()
+    if k_title not in _SENSITIVE_HEADERS:
+        return str(value)
+    if k_title == "Authorization":
+        # Preserve auth type but mask the credentials
+        for prefix, prefix_len in _AUTH_PREFIXES:
+            if value.startswith(prefix):
+                return f"{prefix}{mask_sensitive(value[prefix_len:])}"
+        # Unknown auth type - mask completely
+        return "*****"
+    if k_title in _COOKIE_HEADERS:
+        # Cookies are masked completely
+        return "*****"
+    return mask_sensitive(value)
 
 
 def get_masked_session_headers(headers: dict[str, str]) -> dict[str, str]:
@@ -83,42 +129,34 @@ def get_masked_session_headers(headers: dict[str, str]) -> dict[str, str]:
     Returns:
         Dictionary with sensitive headers masked
     """
-    sensitive_headers = {"Authorization", "Cookie", "Set-Cookie", "Proxy-Authorization"}
-    masked_headers = {}
-
-    for key, value in headers.items():
-        if key in sensitive_headers:
-            if key == "Authorization":
-                # Preserve auth type but mask the credentials
-                if value.startswith("Basic "):
-                    token = value[6:]
-                    masked_headers[key] = f"Basic {mask_sensitive(token)}"
-                elif value.startswith("Bearer "):
-                    token = value[7:]
-                    masked_headers[key] = f"Bearer {mask_sensitive(token)}"
-                else:
-                    # Unknown auth type - mask completely
-                    masked_headers[key] = "*****"
-            else:
-                # For cookies and other sensitive headers, mask completely
-                if key in {"Cookie", "Set-Cookie"}:
-                    masked_headers[key] = "*****"
-                else:
-                    masked_headers[key] = mask_sensitive(value)
-        else:
-            masked_headers[key] = str(value)
-
-    return masked_headers
+    return {key: _mask_header_value(key, value) for key, value in headers.items()}
+
+
+# Optional record attributes (passed via ``extra=``) copied into JSON entries
+_EXTRA_KEYS = ("tool", "service", "status_code", "error_type", "operation")
 
 
 class StructuredFormatter(logging.Formatter):
     """Structured JSON log formatter with correlation ID support."""
 
+    # (epoch second, local ISO-8601 text) of the most recently formatted second;
+    # kept in one tuple so concurrent readers never see a mismatched pair
+    _second_cache: tuple[int, str] = (-1, "")
+
+    def _format_timestamp(self, record: logging.LogRecord) -> str:
+        """Format the record time as local ISO-8601 with millisecond precision."""
+        second = int(record.created)
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+            self._second_cache = (second, prefix)
+        return f"{prefix}.{int(record.msecs):03d}"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON."""
         # Create base log entry
         log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": self._format_timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -127,22 +165,16 @@ class StructuredFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
-        # Include correlation ID only if set
-        correlation_id = getattr(record, 'correlation_id', None)
+        # Include correlation ID only if set, on the record or in the context
+        correlation_id = getattr(record, "correlation_id", None)
+        if correlation_id is None:
+            correlation_id = _correlation_id.get()
         if correlation_id is not None:
             log_entry["correlation_id"] = correlation_id
 
-        # Add extra fields
-        extra_fields = {
-            'tool': getattr(record, 'tool', None),
-            'service': getattr(record, 'service', None),
-            'status_code': getattr(record, 'status_code', None),
-            'error_type': getattr(record, 'error_type', None),
-            'operation': getattr(record, 'operation', None),
-        }
-
-        # Only include non-None extra fields
-        for key, value in extra_fields.items():
+        # Add extra fields, only including non-None ones
+        for key in _EXTRA_KEYS:
+            value = getattr(record, key, None)
             if value is not None:
                 log_entry[key] = value
 
@@ -150,13 +182,46 @@ class StructuredFormatter(logging.Formatter):
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_entry, default=str)
+        return _log_encoder.encode(log_entry)
+
+
+class _ContextQueueHandler(QueueHandler):
+    """QueueHandler that captures per-call state before the record changes thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        # The listener thread cannot see this context's correlation ID
+        if getattr(record, "correlation_id", None) is None:
+            correlation_id = _correlation_id.get()
+            if correlation_id is not None:
+                record.correlation_id = correlation_id
+        # Render the message now, as its arguments may change once we return.
+        # exc_info is kept so the listener's formatter can still render it.
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Background listener writing queued records, when queued logging is enabled
+_queue_listener: QueueListener | None = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the background log listener, if one is running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 def setup_structured_logging(
     level: int = logging.INFO,
     stream: TextIO = sys.stderr,
-    enable_json: bool = False
+    enable_json: bool = False,
+    use_queue: bool = False,
 ) -> logging.Logger:
     """
     Configure MCP-Atlassian logging with structured output.
@@ -165,10 +230,14 @@ def setup_structured_logging(
         level: The minimum logging level to display (default: INFO)
         stream: The stream to write logs to (default: sys.stderr)
         enable_json: Whether to use JSON formatting (default: False for compatibility)
+        use_queue: Whether to hand records to a background thread that formats
+            and writes them, keeping stream I/O off the logging call (default: False)
 
     Returns:
         The configured logger instance
     """
+    global _queue_listener
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
@@ -176,6 +245,7 @@ def setup_structured_logging(
     # Remove existing handlers to prevent duplication
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _stop_queue_listener()
 
     # Add the structured handler
     handler = logging.StreamHandler(stream)
@@ -189,7 +259,13 @@ def setup_structured_logging(
         )
 
     handler.setFormatter(formatter)
-    root_logger.addHandler(handler)
+    if use_queue:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_listener = QueueListener(log_queue, handler)
+        _queue_listener.start()
+        root_logger.addHandler(_ContextQueueHandler(log_queue))
+    else:
+        root_logger.addHandler(handler)
 
     # Configure specific loggers
     loggers = ["mcp-atlassian", "mcp.server", "mcp.server.lowlevel.server", "mcp-jira"]
@@ -203,7 +279,9 @@ def setup_structured_logging(
 
 
 def setup_logging(
-    level: int = logging.WARNING, stream: TextIO = sys.stderr
+    level: int = logging.WARNING,
+    stream: TextIO = sys.stderr,
+    use_queue: bool = False,
 ) -> logging.Logger:
     """
     Configure MCP-Atlassian logging with level-based stream routing.
@@ -211,12 +289,15 @@ def setup_logging(
     Args:
         level: The minimum logging level to display (default: WARNING)
         stream: The stream to write logs to (default: sys.stderr)
+        use_queue: Whether to write records from a background thread (default: False)
 
     Returns:
         The configured logger instance
     """
     # For backward compatibility, use structured logging without JSON
-    return setup_structured_logging(level=level, stream=stream, enable_json=False)
+    return setup_structured_logging(
+        level=level, stream=stream, enable_json=False, use_queue=use_queue
+    )
 
 
 def log_with_correlation(
@@ -236,9 +317,12 @@ def log_with_correlation(
         correlation_id: Optional correlation ID for request tracking
         extra: Additional context fields
     """
+    if not logger.isEnabledFor(level):
+        return
+
     log_extra = extra or {}
     if correlation_id:
-        log_extra['correlation_id'] = correlation_id
+        log_extra["correlation_id"] = correlation_id
 
     logger.log(level, message, extra=log_extra)
 
@@ -259,6 +343,9 @@ def log_config_param(
         value: The parameter value
         sensitive: Whether the value should be masked
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     display_value = mask_sensitive(value) if sensitive else (value or "Not Provided")
     logger.info(f"{service} {param}: {display_value}")
 
@@ -7,24 +7,74 @@ capabilities for the MCP server.
 import asyncio
 import json
 import logging
+import threading
 import time
 from collections import defaultdict, deque
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
+import anyio
+import pydantic_core
 from fastmcp import Context
 from starlette.responses import JSONResponse
 
+from mcp_atlassian.utils.logging import get_correlation_id
+
 logger = logging.getLogger(__name__)
 
 
+class _FastJSONResponse(JSONResponse):
+    """JSONResponse rendered by pydantic-core's serializer.
+
+    Produces the same compact UTF-8 JSON as Starlette's ``json.dumps`` path
+    at a fraction of the cost; non-JSON values fall back to ``str``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content, inf_nan_mode="null", fallback=str)
+
+
+# Identical errors closer together than this (seconds) share one record
+_COALESCE_WINDOW = 1.0
+
+
+def _local_isoformat(epoch: float) -> str:
+    """Render an epoch timestamp as ISO 8601 local time with its UTC offset."""
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).astimezone().isoformat()
+
+
 class ErrorMetrics:
     """Error metrics collector and aggregator."""
 
     def __init__(self, max_history: int = 1000, max_age_hours: int = 24):
         self.max_history = max_history
         self.max_age = timedelta(hours=max_age_hours)
-        self._errors: deque = deque(maxlen=max_history)
+        # Error records are stored column-wise: one bounded deque per field,
+        # all the same length, rather than one dict per record
+        self._first_epochs: deque[float] = deque(maxlen=max_history)
+        # Epoch of each record's latest occurrence; drives age expiry
+        self._error_epochs: deque[float] = deque(maxlen=max_history)
+        self._types: deque[str] = deque(maxlen=max_history)
+        self._services: deque[str] = deque(maxlen=max_history)
+        self._tools: deque[str | None] = deque(maxlen=max_history)
+        self._correlation_ids: deque[str | None] = deque(maxlen=max_history)
+        self._status_codes: deque[int | None] = deque(maxlen=max_history)
+        self._messages: deque[str | None] = deque(maxlen=max_history)
+        self._counts: deque[int] = deque(maxlen=max_history)
+        self._columns = (
+            self._first_epochs,
+            self._error_epochs,
+            self._types,
+            self._services,
+            self._tools,
+            self._correlation_ids,
+            self._status_codes,
+            self._messages,
+            self._counts,
+        )
+        # Errors represented by the stored records (records may be coalesced)
+        self._recent_total = 0
         self._error_counts: Dict[str, int] = defaultdict(int)
         self._service_errors: Dict[str, int] = defaultdict(int)
         self._tool_errors: Dict[str, int] = defaultdict(int)
@@ -39,18 +89,43 @@ class ErrorMetrics:
         status_code: int | None = None,
         message: str | None = None,
     ):
-        """Record an error occurrence."""
-        error_record = {
-            "timestamp": datetime.now().isoformat(),
-            "error_type": error_type,
-            "service": service,
-            "tool": tool,
-            "correlation_id": correlation_id,
-            "status_code": status_code,
-            "message": message,
-        }
-
-        self._errors.append(error_record)
+        """Record an error occurrence.
+
+        A burst of identical (error type, service, tool) errors, each within
+        ``_COALESCE_WINDOW`` seconds of the previous one, is folded into the
+        first record's ``count`` rather than stored one record per error.
+        """
+        now_ts = time.time()
+        epochs = self._error_epochs
+        counts = self._counts
+
+        if (
+            epochs
+            and now_ts - epochs[-1] < _COALESCE_WINDOW
+            and self._types[-1] == error_type
+            and self._services[-1] == service
+            and self._tools[-1] == tool
+        ):
+            counts[-1] += 1
+            epochs[-1] = now_ts
+        else:
+            if len(counts) == self.max_history:
+                # The appends below evict the oldest record
+                self._recent_total -= counts[0]
+            row = (
+                now_ts,
+                now_ts,
+                error_type,
+                service,
+                tool,
+                correlation_id,
+                status_code,
+                message,
+                1,
+            )
+            for column, value in zip(self._columns, row, strict=True):
+                column.append(value)
+        self._recent_total += 1
         self._error_counts[error_type] += 1
         self._service_errors[service] += 1
         if tool:
@@ -60,16 +135,55 @@ class ErrorMetrics:
             f"Recorded error: {error_type} in {service}" + (f" tool {tool}" if tool else "")
         )
 
+    def _expire(self, cutoff: float) -> None:
+        """Drop records at or before ``cutoff`` from the front of the window.
+
+        Records are appended in time order, so expired entries are always at
+        the left and each record is popped at most once.
+        """
+        epochs = self._error_epochs
+        while epochs and epochs[0] <= cutoff:
+            self._recent_total -= self._counts[0]
+            for column in self._columns:
+                column.popleft()
+
+    def _recent_records(self, limit: int) -> List[Dict[str, Any]]:
+        """Materialise the last ``limit`` records as dicts for reporting."""
+        start = max(0, len(self._counts) - limit)
+        rows = zip(
+            *(islice(column, start, None) for column in self._columns), strict=True
+        )
+        return [
+            {
+                "timestamp": _local_isoformat(first),
+                "error_type": error_type,
+                "service": service,
+                "tool": tool,
+                "correlation_id": correlation_id,
+                "status_code": status_code,
+                "message": message,
+                "count": count,
+                "last_timestamp": _local_isoformat(last),
+            }
+            for (
+                first,
+                last,
+                error_type,
+                service,
+                tool,
+                correlation_id,
+                status_code,
+                message,
+                count,
+            ) in rows
+        ]
+
     def get_error_summary(self) -> Dict[str, Any]:
         """Get a summary of error metrics."""
         now = datetime.now()
-        recent_errors = [
-            error for error in self._errors
-            if now - datetime.fromisoformat(error["timestamp"]) < self.max_age
-        ]
+        self._expire(time.time() - self.max_age.total_seconds())
 
-        # Calculate error rates
-        total_errors = len(recent_errors)
+        total_errors = self._recent_total
         uptime_hours = (now - self._start_time).total_seconds() / 3600
         error_rate = total_errors / uptime_hours if uptime_hours > 0 else 0
 
@@ -80,7 +194,7 @@ class ErrorMetrics:
             "error_types": dict(self._error_counts),
             "service_errors": dict(self._service_errors),
             "tool_errors": dict(self._tool_errors),
-            "recent_errors": list(recent_errors)[-10:],  # Last 10 errors
+            "recent_errors": self._recent_records(10),  # Last 10 error records
         }
 
     def get_health_status(self) -> Dict[str, Any]:
@@ -126,33 +240,85 @@ class ErrorMetrics:
 class HealthChecker:
     """Health check manager for the MCP server."""
 
-    def __init__(self):
+    def __init__(self, cache_ttl: float = 1.5):
         self.metrics = ErrorMetrics()
         self._health_checks: Dict[str, callable] = {}
+        # Whether each check is a coroutine function, decided once at registration
+        self._check_is_async: Dict[str, bool] = {}
+        # Probes arriving within cache_ttl seconds share one result; anyio's
+        # lock works whichever event loop backend serves the endpoint
+        self._cache_ttl = cache_ttl
+        self._cache_expiry = 0.0
+        self._cached_result: Dict[str, Any] | None = None
+        self._cache_lock = anyio.Lock()
+        self._summary_expiry = 0.0
+        self._cached_summary: Dict[str, Any] | None = None
 
     def register_health_check(self, name: str, check_func: callable):
         """Register a health check function."""
         self._health_checks[name] = check_func
+        self._check_is_async[name] = asyncio.iscoroutinefunction(check_func)
+        self._cache_expiry = 0.0
 
     async def run_health_checks(self) -> Dict[str, Any]:
-        """Run all registered health checks."""
-        results = {}
-        overall_healthy = True
+        """Run all registered health checks, reusing a result younger than the TTL.
+
+        Concurrent callers wait on a single refresh rather than each running
+        every check.
+        """
+        if time.monotonic() < self._cache_expiry:
+            return self._cached_result
+        async with self._cache_lock:
+            # Another probe may have refreshed the result while we waited
+            if time.monotonic() < self._cache_expiry:
+                return self._cached_result
+            result = await self._run_health_checks()
+            self._cached_result = result
+            self._cache_expiry = time.monotonic() + self._cache_ttl
+            return result
 
-        for name, check_func in self._health_checks.items():
-            try:
-                if asyncio.iscoroutinefunction(check_func):
-                    result = await check_func()
-                else:
-                    result = check_func()
-                results[name] = {"status": "healthy", "result": result}
-            except Exception as e:
-                results[name] = {
-                    "status": "unhealthy",
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat(),
-                }
-                overall_healthy = False
+    def get_error_summary(self) -> Dict[str, Any]:
+        """Get the error summary, reusing one younger than the TTL."""
+        now = time.monotonic()
+        if now >= self._summary_expiry:
+            self._cached_summary = self.metrics.get_error_summary()
+            self._summary_expiry = now + self._cache_ttl
+        return self._cached_summary
+
+    @staticmethod
+    async def _run_check(
+        name: str, check_func: callable, is_async: bool, results: Dict[str, Any]
+    ) -> None:
+        """Run one health check and store its outcome under ``name``."""
+        try:
+            if is_async:
+                result = await check_func()
+            else:
+                # Sync checks (psutil, etc.) may block, keep them off the loop
+                result = await anyio.to_thread.run_sync(check_func)
+            results[name] = {"status": "healthy", "result": result}
+        except Exception as e:
+            results[name] = {
+                "status": "unhealthy",
+                "error": str(e),
+                "timestamp": datetime.now().isoformat(),
+            }
+
+    async def _run_health_checks(self) -> Dict[str, Any]:
+        """Run all registered health checks concurrently."""
+        # Pre-seed in registration order so the report order is stable
+        results: Dict[str, Any] = dict.fromkeys(self._health_checks)
+
+        is_async = self._check_is_async
+        async with anyio.create_task_group() as tg:
+            for name, check_func in self._health_checks.items():
+                tg.start_soon(
+                    self._run_check, name, check_func, is_async[name], results
+                )
+
+        overall_healthy = all(
+            result["status"] == "healthy" for result in results.values()
+        )
 
         # Include error metrics in health check
         error_health = self.metrics.get_health_status()
@@ -195,10 +361,10 @@ async def health_check_endpoint() -> JSONResponse:
     try:
         health_status = await health_checker.run_health_checks()
         status_code = 200 if health_status["overall_status"] == "healthy" else 503
-        return JSONResponse(health_status, status_code=status_code)
+        return _FastJSONResponse(health_status, status_code=status_code)
     except Exception as e:
         logger.error(f"Health check failed: {e}")
-        return JSONResponse(
+        return _FastJSONResponse(
             {
                 "overall_status": "critical",
                 "timestamp": datetime.now().isoformat(),
@@ -211,11 +377,11 @@ async def health_check_endpoint() -> JSONResponse:
 async def metrics_endpoint() -> JSONResponse:
     """Metrics endpoint for monitoring."""
     try:
-        metrics = health_checker.metrics.get_error_summary()
-        return JSONResponse(metrics, status_code=200)
+        metrics = health_checker.get_error_summary()
+        return _FastJSONResponse(metrics, status_code=200)
     except Exception as e:
         logger.error(f"Metrics endpoint failed: {e}")
-        return JSONResponse(
+        return _FastJSONResponse(
             {
                 "error": str(e),
                 "timestamp": datetime.now().isoformat(),
@@ -233,9 +399,15 @@ def create_jira_health_check(jira_config) -> callable:
         # Basic connectivity check
         try:
             from mcp_atlassian.jira import JiraFetcher
-            jira = JiraFetcher(jira_config)
-            # Try to get a simple project list to verify connectivity
-            projects = jira.get_all_projects(include_archived=False)
+
+            def probe() -> list[dict[str, Any]]:
+                jira = JiraFetcher(jira_config)
+                # Try to get a simple project list to verify connectivity
+                return jira.get_all_projects(include_archived=False)
+
+            # The client is synchronous; run it in a worker thread so the
+            # Confluence probe can proceed concurrently
+            projects = await anyio.to_thread.run_sync(probe)
             return {"projects_count": len(projects), "connected": True}
         except Exception as e:
             raise Exception(f"Jira connectivity failed: {str(e)}")
@@ -251,9 +423,13 @@ def create_confluence_health_check(confluence_config) -> callable:
 
         try:
             from mcp_atlassian.confluence import ConfluenceFetcher
-            confluence = ConfluenceFetcher(confluence_config)
-            # Try to get a simple space list to verify connectivity
-            spaces = confluence.get_spaces(limit=1)
+
+            def probe() -> dict[str, object]:
+                confluence = ConfluenceFetcher(confluence_config)
+                # Try to get a simple space list to verify connectivity
+                return confluence.get_spaces(limit=1)
+
+            spaces = await anyio.to_thread.run_sync(probe)
             return {"spaces_count": len(spaces), "connected": True}
         except Exception as e:
             raise Exception(f"Confluence connectivity failed: {str(e)}")
@@ -261,6 +437,57 @@ def create_confluence_health_check(confluence_config) -> callable:
     return check_confluence_health
 
 
+class _SystemStats:
+    """Memory and disk usage, sampled with psutil at most once per ``ttl`` seconds.
+
+    Probes in between are served the cached figures, so frequent health
+    checks do not each pay for the underlying system calls.
+    """
+
+    def __init__(self, ttl: float = 5.0) -> None:
+        self.ttl = ttl
+        self.memory: Dict[str, Any] | None = None
+        self.disk: Dict[str, Any] | None = None
+        self.updated_at = float("-inf")
+        # Checks run concurrently in worker threads; sample only once
+        self._lock = threading.Lock()
+
+    def _refresh(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now - self.updated_at < self.ttl:
+                return
+
+            import psutil
+
+            memory = psutil.virtual_memory()
+            disk = psutil.disk_usage('/')
+            self.memory = {
+                "total_gb": round(memory.total / (1024**3), 2),
+                "available_gb": round(memory.available / (1024**3), 2),
+                "percent_used": memory.percent,
+            }
+            self.disk = {
+                "total_gb": round(disk.total / (1024**3), 2),
+                "free_gb": round(disk.free / (1024**3), 2),
+                "percent_used": round((disk.used / disk.total) * 100, 2),
+            }
+            self.updated_at = now
+
+    def get_memory(self) -> Dict[str, Any]:
+        """Return the latest memory usage sample."""
+        self._refresh()
+        return self.memory
+
+    def get_disk(self) -> Dict[str, Any]:
+        """Return the latest disk usage sample for the root filesystem."""
+        self._refresh()
+        return self.disk
+
+
+_system_stats = _SystemStats()
+
+
 def setup_health_checks(jira_config=None, confluence_config=None):
     """Set up default health checks for the MCP server."""
     if jira_config:
@@ -272,27 +499,8 @@ def setup_health_checks(jira_config=None, confluence_config=None):
         )
 
     # Add system health checks
-    def check_memory():
-        import psutil
-        memory = psutil.virtual_memory()
-        return {
-            "total_gb": round(memory.total / (1024**3), 2),
-            "available_gb": round(memory.available / (1024**3), 2),
-            "percent_used": memory.percent,
-        }
-
-    health_checker.register_health_check("memory", check_memory)
-
-    def check_disk():
-        import psutil
-        disk = psutil.disk_usage('/')
-        return {
-            "total_gb": round(disk.total / (1024**3), 2),
-            "free_gb": round(disk.free / (1024**3), 2),
-            "percent_used": round((disk.used / disk.total) * 100, 2),
-        }
-
-    health_checker.register_health_check("disk", check_disk)
+    health_checker.register_health_check("memory", _system_stats.get_memory)
+    health_checker.register_health_check("disk", _system_stats.get_disk)
 
 
 # Decorator for automatic error recording
@@ -303,10 +511,7 @@ def track_errors(service_name: str):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                # Extract correlation ID if available
-                correlation_id = None
-                if args and hasattr(args[0], 'request_context'):
-                    correlation_id = getattr(args[0].request_context, 'correlation_id', None)
+                correlation_id = get_correlation_id()
 
                 # Determine error type
                 error_type = "internal"
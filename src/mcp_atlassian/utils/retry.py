@@ -15,10 +15,27 @@ from typing import Any, TypeVar
 import requests
 from requests.exceptions import HTTPError, RequestException
 
+from mcp_atlassian.utils.logging import get_correlation_id
+
 logger = logging.getLogger(__name__)
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+_random = random.random
+
+# Retry delays shorter than this yield to the event loop instead of arming a timer
+_MIN_TIMED_SLEEP = 0.01
+
+# Header spellings used by Atlassian and intermediate proxies. Response headers
+# are case-insensitive, so each spelling is listed once.
+_RATE_LIMIT_REMAINING_HEADERS = (
+    'X-RateLimit-Remaining',
+    'X-Rate-Limit-Remaining',
+    'Rate-Limit-Remaining',
+    'X-Rate-Remaining',
+    'RateLimit-Remaining',
+)
+
 
 class RetryConfig:
     """Configuration for retry behavior."""
@@ -30,7 +47,7 @@ class RetryConfig:
         max_delay: float = 60.0,
         exponential_base: float = 2.0,
         jitter: bool = True,
-        retryable_status_codes: set[int] | None = None,
+        retryable_status_codes: set[int] | frozenset[int] | None = None,
         retryable_exceptions: tuple[type[Exception], ...] | None = None,
     ):
         self.max_attempts = max_attempts
@@ -38,6 +55,12 @@ class RetryConfig:
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.jitter = jitter
+        # Capped, non-negative backoff per attempt, precomputed since configs
+        # are not modified after construction
+        self._delays = tuple(
+            max(0.0, min(base_delay * exponential_base**attempt, max_delay))
+            for attempt in range(max_attempts)
+        )
 
         # Default retryable status codes
         if retryable_status_codes is None:
@@ -56,7 +79,7 @@ class RetryConfig:
                 523,  # Origin Is Unreachable (Cloudflare)
                 524,  # A Timeout Occurred (Cloudflare)
             }
-        self.retryable_status_codes = retryable_status_codes
+        self.retryable_status_codes = frozenset(retryable_status_codes)
 
         # Default retryable exceptions (HTTPError handled separately for status code logic)
         if retryable_exceptions is None:
@@ -66,6 +89,56 @@ class RetryConfig:
                 TimeoutError,
             )
         self.retryable_exceptions = retryable_exceptions
+        self.is_retryable = self._compile_predicate()
+
+    def _compile_predicate(self) -> Callable[[Exception, str | None], bool]:
+        """Build the retry predicate with this config's codes and exceptions bound."""
+        retryable_status_codes = self.retryable_status_codes
+        retryable_exceptions = self.retryable_exceptions
+
+        def is_retryable(error: Exception, correlation_id: str | None = None) -> bool:
+            if isinstance(error, HTTPError):
+                # HTTP errors are judged by status code and rate limit headers only
+                response = getattr(error, 'response', None)
+                if response is None:
+                    return False
+                status_code = response.status_code
+                if status_code in retryable_status_codes:
+                    logger.debug(
+                        f"[{correlation_id}] Retryable HTTP status code: {status_code}"
+                    )
+                    return True
+                headers = getattr(response, 'headers', None)
+                return headers is not None and _rate_limit_exhausted(
+                    headers, correlation_id
+                )
+
+            if isinstance(error, retryable_exceptions):
+                logger.debug(
+                    f"[{correlation_id}] Retryable exception detected: {type(error).__name__}: {error}"
+                )
+                return True
+
+            return False
+
+        return is_retryable
+
+
+def _rate_limit_exhausted(headers: Any, correlation_id: str | None) -> bool:
+    """Return True if any rate-limit-remaining header reports zero."""
+    for header_name in _RATE_LIMIT_REMAINING_HEADERS:
+        rate_limit_remaining = headers.get(header_name)
+        if rate_limit_remaining is not None:
+            try:
+                if str(rate_limit_remaining) == '0' or int(rate_limit_remaining) == 0:
+                    logger.debug(
+                        f"[{correlation_id}] Rate limit exhausted ({header_name}: 0)"
+                    )
+                    return True
+            except (ValueError, TypeError):
+                # If we can't parse the value, continue with other checks
+                pass
+    return False
 
 
 def is_retryable_error(
@@ -82,47 +155,7 @@ def is_retryable_error(
     Returns:
         True if the error is retryable, False otherwise
     """
-    # Check for HTTP errors with retryable status codes first
-    if isinstance(error, HTTPError) and hasattr(error, 'response') and error.response is not None:
-        status_code = error.response.status_code
-        if status_code in config.retryable_status_codes:
-            logger.debug(
-                f"[{correlation_id}] Retryable HTTP status code: {status_code}"
-            )
-            return True
-
-        # Check for rate limit headers (handle various header names and value types)
-        if hasattr(error.response, 'headers'):
-            rate_limit_headers = [
-                'X-RateLimit-Remaining',
-                'x-ratelimit-remaining',
-                'X-Rate-Limit-Remaining',
-                'Rate-Limit-Remaining',
-                'X-Rate-Remaining',
-                'RateLimit-Remaining',
-            ]
-
-            for header_name in rate_limit_headers:
-                rate_limit_remaining = error.response.headers.get(header_name)
-                if rate_limit_remaining is not None:
-                    try:
-                        if str(rate_limit_remaining) == '0' or int(rate_limit_remaining) == 0:
-                            logger.debug(
-                                f"[{correlation_id}] Rate limit exhausted ({header_name}: 0)"
-                            )
-                            return True
-                    except (ValueError, TypeError):
-                        # If we can't parse the value, continue with other checks
-                        pass
-
-    # Check for retryable exceptions (excluding HTTPError which was handled above)
-    if isinstance(error, config.retryable_exceptions) and not isinstance(error, HTTPError):
-        logger.debug(
-            f"[{correlation_id}] Retryable exception detected: {type(error).__name__}: {error}"
-        )
-        return True
-
-    return False
+    return config.is_retryable(error, correlation_id)
 
 
 def calculate_delay(attempt: int, config: RetryConfig, correlation_id: str | None = None) -> float:
@@ -137,15 +170,19 @@ def calculate_delay(attempt: int, config: RetryConfig, correlation_id: str | Non
     Returns:
         Delay in seconds
     """
-    delay = config.base_delay * (config.exponential_base ** attempt)
-    delay = min(delay, config.max_delay)
+    delays = config._delays
+    if attempt < len(delays):
+        delay = delays[attempt]
+    else:
+        delay = max(
+            0.0,
+            min(config.base_delay * (config.exponential_base ** attempt), config.max_delay),
+        )
 
     if config.jitter:
-        # Add random jitter to avoid thundering herd
-        jitter_range = delay * 0.1
-        delay += random.uniform(-jitter_range, jitter_range)
-
-    delay = max(0, delay)  # Ensure non-negative
+        # Add up to +/-10% random jitter to avoid thundering herd; the base
+        # delay is non-negative, so the result stays non-negative too
+        delay += (_random() * 2.0 - 1.0) * (delay * 0.1)
 
     logger.debug(
         f"[{correlation_id}] Calculated delay for attempt {attempt + 1}: {delay:.2f}s"
@@ -153,6 +190,62 @@ def calculate_delay(attempt: int, config: RetryConfig, correlation_id: str | Non
     return delay
 
 
+def _should_retry(
+    error: Exception, attempt: int, config: RetryConfig, correlation_id: str | None
+) -> bool:
+    """Log a failed attempt and decide whether another attempt should follow."""
+    if attempt == config.max_attempts - 1:
+        logger.error(
+            f"[{correlation_id}] All {config.max_attempts} retry attempts exhausted"
+        )
+        return False
+
+    if not config.is_retryable(error, correlation_id):
+        logger.warning(
+            f"[{correlation_id}] Non-retryable error encountered: {type(error).__name__}: {error}"
+        )
+        return False
+
+    logger.warning(
+        f"[{correlation_id}] Attempt {attempt + 1} failed with retryable error: {type(error).__name__}: {error}"
+    )
+    return True
+
+
+async def _async_retry_from(
+    func: Callable,
+    config: RetryConfig,
+    args: tuple,
+    kwargs: dict[str, Any],
+    correlation_id: str | None,
+    first_attempt: int,
+) -> Any:
+    """Run the retry loop starting at ``first_attempt`` (0-based)."""
+    for attempt in range(first_attempt, config.max_attempts):
+        try:
+            if attempt > 0:
+                delay = calculate_delay(attempt, config, correlation_id)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        f"[{correlation_id}] Retrying after {delay:.2f}s (attempt {attempt + 1}/{config.max_attempts})"
+                    )
+                # Sleeps below timer resolution only need to yield to the loop
+                await asyncio.sleep(delay if delay >= _MIN_TIMED_SLEEP else 0)
+
+            result = await func(*args, **kwargs)
+
+            if attempt > 0 and logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"[{correlation_id}] Retry successful on attempt {attempt + 1}"
+                )
+
+            return result
+
+        except Exception as e:
+            if not _should_retry(e, attempt, config, correlation_id):
+                raise
+
+
 async def async_retry_with_backoff(
     func: Callable,
     config: RetryConfig,
@@ -176,48 +269,7 @@ async def async_retry_with_backoff(
     Raises:
         The last exception if all retries are exhausted
     """
-    last_exception = None
-
-    for attempt in range(config.max_attempts):
-        try:
-            if attempt > 0:
-                delay = calculate_delay(attempt, config, correlation_id)
-                logger.info(
-                    f"[{correlation_id}] Retrying after {delay:.2f}s (attempt {attempt + 1}/{config.max_attempts})"
-                )
-                await asyncio.sleep(delay)
-
-            result = await func(*args, **kwargs)
-
-            if attempt > 0:
-                logger.info(
-                    f"[{correlation_id}] Retry successful on attempt {attempt + 1}"
-                )
-
-            return result
-
-        except Exception as e:
-            last_exception = e
-
-            if attempt == config.max_attempts - 1:
-                logger.error(
-                    f"[{correlation_id}] All {config.max_attempts} retry attempts exhausted"
-                )
-                break
-
-            if not is_retryable_error(e, config, correlation_id):
-                logger.warning(
-                    f"[{correlation_id}] Non-retryable error encountered: {type(e).__name__}: {e}"
-                )
-                break
-
-            logger.warning(
-                f"[{correlation_id}] Attempt {attempt + 1} failed with retryable error: {type(e).__name__}: {e}"
-            )
-
-    # Re-raise the last exception
-    if last_exception is not None:
-        raise last_exception
+    return await _async_retry_from(func, config, args, kwargs, correlation_id, 0)
 
 
 def retry_with_backoff(
@@ -243,13 +295,17 @@ def retry_with_backoff(
     def decorator(func: F) -> F:
         @wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Extract correlation ID from first argument if it's a context object
-            correlation_id = None
-            if args and hasattr(args[0], 'request_context'):
-                correlation_id = getattr(args[0].request_context, 'correlation_id', None)
-
-            return await async_retry_with_backoff(
-                func, config, *args, correlation_id=correlation_id, **kwargs
+            # Fast path: most calls succeed first time, so skip the retry
+            # scaffolding until something actually fails
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                correlation_id = get_correlation_id()
+                if not _should_retry(e, 0, config, correlation_id):
+                    raise
+
+            return await _async_retry_from(
+                func, config, args, kwargs, correlation_id, 1
             )
 
         @wraps(func)
@@ -271,7 +327,7 @@ def retry_with_backoff(
                     if attempt == config.max_attempts - 1:
                         break
 
-                    if not is_retryable_error(e, config):
+                    if not config.is_retryable(e):
                         break
 
                     logger.warning(
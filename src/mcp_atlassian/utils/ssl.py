@@ -1,16 +1,52 @@
 """SSL-related utility functions for MCP Atlassian."""
 
 import logging
+import os
 import ssl
+import threading
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlparse
 
 from requests.adapters import HTTPAdapter
+from requests.models import PreparedRequest
 from requests.sessions import Session
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
 from urllib3.poolmanager import PoolManager
+from urllib3.util.ssl_ import create_urllib3_context
 
 logger = logging.getLogger("mcp-atlassian")
 
+# One non-verifying context shared by every SSLIgnoreAdapter; building a
+# context loads the default trust store, so it is only done once.
+_insecure_ssl_context: ssl.SSLContext | None = None
+_insecure_ssl_context_lock = threading.Lock()
+
+
+def _get_insecure_context() -> ssl.SSLContext:
+    """Return the shared SSL context that skips certificate verification.
+
+    The context must not be modified once built, as every adapter uses it.
+    """
+    global _insecure_ssl_context
+    if _insecure_ssl_context is None:
+        with _insecure_ssl_context_lock:
+            if _insecure_ssl_context is None:
+                context = ssl.create_default_context()
+                _disable_verification(context)
+                _insecure_ssl_context = context
+    return _insecure_ssl_context
+
+
+def _disable_verification(context: ssl.SSLContext) -> None:
+    """Turn off certificate and hostname checks on an SSL context."""
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+
+    # Enable legacy SSL renegotiation
+    context.options |= 0x4  # SSL_OP_LEGACY_SERVER_CONNECT
+    context.options |= 0x40000  # SSL_OP_ALLOW_UNSAFE_LEGACY_RENEGOTIATION
+
 
 class SSLIgnoreAdapter(HTTPAdapter):
     """HTTP adapter that ignores SSL verification.
@@ -37,28 +73,23 @@ class SSLIgnoreAdapter(HTTPAdapter):
             block: Whether to block when the pool is full
             pool_kwargs: Additional arguments for the pool manager
         """
-        # Configure SSL context to disable verification completely
-        context = ssl.create_default_context()
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_NONE
-
-        # Enable legacy SSL renegotiation
-        context.options |= 0x4  # SSL_OP_LEGACY_SERVER_CONNECT
-        context.options |= 0x40000  # SSL_OP_ALLOW_UNSAFE_LEGACY_RENEGOTIATION
-
         self.poolmanager = PoolManager(
             num_pools=connections,
             maxsize=maxsize,
             block=block,
-            ssl_context=context,
+            ssl_context=_get_insecure_context(),
             **pool_kwargs,
         )
 
     def cert_verify(self, conn: Any, url: str, verify: bool, cert: Any | None) -> None:
         """Override cert verification to disable SSL verification.
 
-        This method is still included for backward compatibility, but the main
-        SSL disabling happens in init_poolmanager.
+        This override is required alongside init_poolmanager: urllib3 sets
+        ``verify_mode`` on the supplied SSL context from the connection's
+        ``cert_reqs`` on every connect, so the connection itself must be marked
+        CERT_NONE or the shared context would be switched back to verifying.
+        Delegating to the base implementation also keeps its client
+        certificate handling.
 
         Args:
             conn: The connection
@@ -69,6 +100,254 @@ class SSLIgnoreAdapter(HTTPAdapter):
         super().cert_verify(conn, url, verify=False, cert=cert)
 
 
+@lru_cache(maxsize=8)
+def _get_verifying_context(ca_location: str) -> ssl.SSLContext:
+    """Return the shared verifying SSL context for a CA bundle or directory.
+
+    Raises:
+        OSError: If the CA certificates cannot be loaded.
+    """
+    context = create_urllib3_context()
+    if os.path.isdir(ca_location):
+        context.load_verify_locations(capath=ca_location)
+    else:
+        context.load_verify_locations(cafile=ca_location)
+    return context
+
+
+class _VerifyingAdapter(HTTPAdapter):
+    """HTTP adapter that verifies against shared, preloaded SSL contexts.
+
+    Left to itself, urllib3 creates a new SSLContext and parses the whole CA
+    bundle for every connection. This adapter hands its pools one context
+    per CA location instead, with the bundle already loaded. Requests that
+    present a client certificate keep the default behaviour, so the
+    certificate is never loaded into a shared context.
+    """
+
+    def build_connection_pool_key_attributes(
+        self,
+        request: PreparedRequest,
+        verify: bool | str,
+        cert: str | tuple[str, str] | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Use the shared context for verified HTTPS requests without a cert."""
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request, verify, cert
+        )
+        if verify is False or cert or host_params["scheme"] != "https":
+            return host_params, pool_kwargs
+
+        ca_location = verify if isinstance(verify, str) else DEFAULT_CA_BUNDLE_PATH
+        try:
+            context = _get_verifying_context(ca_location)
+        except OSError:
+            # Let requests report the missing or invalid bundle itself
+            return host_params, pool_kwargs
+
+        pool_kwargs.pop("ca_certs", None)
+        pool_kwargs.pop("ca_cert_dir", None)
+        pool_kwargs["ssl_context"] = context
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn: Any, url: str, verify: bool, cert: Any | None) -> None:
+        """Verify as usual, without reloading CAs into a preloaded context."""
+        super().cert_verify(conn, url, verify, cert)
+        # urllib3 loads the pool's CA locations into its context on every
+        # connect, which is the work the shared context exists to avoid
+        if verify and getattr(conn, "conn_kw", {}).get("ssl_context") is not None:
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+
+class _ClientCertAdapter(HTTPAdapter):
+    """HTTP adapter whose SSL context already holds the client certificate.
+
+    Passing the certificate through ``session.cert`` makes urllib3 re-read and
+    parse the PEM files on every new connection; loading them into the
+    context up front does that work once.
+    """
+
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs: Any) -> None:
+        # Set before HTTPAdapter.__init__, which builds the pool manager
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        """Initialize the connection pool manager with the preloaded context."""
+        self.poolmanager = PoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            ssl_context=self._ssl_context,
+            **pool_kwargs,
+        )
+
+
+class _ClientCertIgnoreAdapter(_ClientCertAdapter, SSLIgnoreAdapter):
+    """Client certificate adapter that also ignores SSL verification."""
+
+
+def _load_client_cert_context(
+    client_cert: str,
+    client_key: str,
+    client_key_password: str | None = None,
+    *,
+    ssl_verify: bool,
+) -> ssl.SSLContext:
+    """Build an SSL context with the client certificate loaded into it.
+
+    Encrypted private keys are decrypted here with the given password, which
+    requests itself has no way to pass through.
+
+    Raises:
+        OSError: If the certificate or key cannot be loaded (including
+            ssl.SSLError for malformed files or a wrong password).
+    """
+    # Like urllib3's own contexts, this relies on requests supplying the CA
+    # bundle for each connection rather than loading the system trust store
+    context = create_urllib3_context()
+    if not ssl_verify:
+        _disable_verification(context)
+    context.load_cert_chain(
+        certfile=client_cert, keyfile=client_key, password=client_key_password
+    )
+    return context
+
+
+# Shared non-verifying client certificate adapters, keyed by certificate and
+# key path plus modification times
+_CLIENT_CERT_ADAPTER_CACHE_SIZE = 32
+_client_cert_ignore_adapters: dict[
+    tuple[str, str, int, int], _ClientCertIgnoreAdapter
+] = {}
+_client_cert_ignore_adapters_lock = threading.Lock()
+
+
+def _get_client_cert_ignore_adapter(
+    client_cert: str,
+    client_key: str,
+    client_key_password: str | None,
+    cert_mtime_ns: int,
+    key_mtime_ns: int,
+) -> _ClientCertIgnoreAdapter:
+    """Return the shared non-verifying adapter for a client certificate.
+
+    Adapters are cached by certificate and key path plus their modification
+    times, so a rotated certificate is picked up the next time a session is
+    configured. The key password is deliberately not part of the cache key,
+    so the cache never retains it.
+    """
+    cache_key = (client_cert, client_key, cert_mtime_ns, key_mtime_ns)
+    with _client_cert_ignore_adapters_lock:
+        adapter = _client_cert_ignore_adapters.get(cache_key)
+    if adapter is None:
+        context = _load_client_cert_context(
+            client_cert,
+            client_key,
+            client_key_password,
+            ssl_verify=False,
+        )
+        with _client_cert_ignore_adapters_lock:
+            cached = _client_cert_ignore_adapters
+            if (
+                cache_key not in cached
+                and len(cached) >= _CLIENT_CERT_ADAPTER_CACHE_SIZE
+            ):
+                # Evict the oldest entry to keep the cache bounded
+                del cached[next(iter(cached))]
+            adapter = cached.setdefault(cache_key, _ClientCertIgnoreAdapter(context))
+    return adapter
+
+
+def _load_client_cert_adapter(
+    ssl_verify: bool,
+    client_cert: str,
+    client_key: str,
+    client_key_password: str | None = None,
+) -> _ClientCertAdapter | None:
+    """Return a preloaded client certificate adapter, or None if loading fails."""
+    try:
+        if ssl_verify:
+            # urllib3 loads each request's CA bundle into the context, so a
+            # verifying context is never shared between sessions
+            context = _load_client_cert_context(
+                client_cert,
+                client_key,
+                client_key_password,
+                ssl_verify=True,
+            )
+            return _ClientCertAdapter(context)
+        return _get_client_cert_ignore_adapter(
+            client_cert,
+            client_key,
+            client_key_password,
+            os.stat(client_cert).st_mtime_ns,
+            os.stat(client_key).st_mtime_ns,
+        )
+    except OSError as e:
+        logger.debug(
+            "Could not preload client certificate %s, leaving it to requests: %s",
+            client_cert,
+            e,
+        )
+        return None
+
+
+@lru_cache(maxsize=1)
+def _get_verifying_adapter() -> _VerifyingAdapter:
+    """Return the verifying adapter shared by every session."""
+    return _VerifyingAdapter()
+
+
+@lru_cache(maxsize=128)
+def _get_ignore_adapter(connections: int = 10, maxsize: int = 10) -> SSLIgnoreAdapter:
+    """Return the shared SSLIgnoreAdapter for the given pool sizing.
+
+    Adapters (and their urllib3 pool managers) are thread-safe, so one
+    instance is mounted on every session and domain that skips verification,
+    keeping its connection pools warm across reconfiguration.
+    """
+    return SSLIgnoreAdapter(pool_connections=connections, pool_maxsize=maxsize)
+
+
+@lru_cache(maxsize=256)
+def _mount_prefixes(url: str) -> tuple[str, ...]:
+    """Return the adapter mount prefixes for a service URL, https first.
+
+    An HTTPS service only needs its https prefix. Otherwise both schemes are
+    covered, since a plain HTTP (or scheme-less) URL may redirect to HTTPS.
+    """
+    parsed = urlparse(url)
+    https_prefix = f"https://{parsed.netloc}"
+    if parsed.scheme.lower() == "https":
+        return (https_prefix,)
+    return https_prefix, f"http://{parsed.netloc}"
+
+
+@lru_cache(maxsize=256)
+def _warn_ssl_disabled(service_name: str, domain: str) -> None:
+    """Warn once per service and domain that SSL verification is disabled."""
+    logger.warning(
+        "%s SSL verification disabled for %s. This is insecure and should only "
+        "be used in testing environments.",
+        service_name,
+        domain,
+    )
+
+
+@lru_cache(maxsize=256)
+def _log_client_cert(service_name: str, client_cert: str) -> None:
+    """Log once per service and certificate that mutual TLS is configured."""
+    logger.info(
+        "%s client certificate authentication configured with cert: %s",
+        service_name,
+        client_cert,
+    )
+
+
 def configure_ssl_verification(
     service_name: str,
     url: str,
@@ -82,10 +361,14 @@ def configure_ssl_verification(
 
     If SSL verification is disabled, this function will configure the session
     to use a custom SSL adapter that bypasses certificate validation for the
-    service's domain.
+    service's domain. Otherwise the domain is served by an adapter that reuses
+    one preloaded SSL context per CA bundle across all sessions.
 
     If client certificate paths are provided, they will be configured for
-    mutual TLS authentication.
+    mutual TLS authentication. They are loaded once, decrypting the key with
+    ``client_key_password`` if given, into a dedicated adapter's SSL context
+    for the service's domain; if that fails they are set on the session for
+    requests to load per connection.
 
     Args:
         service_name: Name of the service for logging (e.g., "Confluence", "Jira")
@@ -96,33 +379,46 @@ def configure_ssl_verification(
         client_key: Path to client private key file (.pem)
         client_key_password: Password for encrypted private key (optional)
     """
+    adapter: HTTPAdapter | None = None
+
     # Configure client certificate if provided
     if client_cert and client_key:
-        # If password is provided, we need to handle it differently
-        # For now, we'll use a tuple format that requests understands
-        if client_key_password:
-            logger.warning(
-                f"{service_name} client certificate authentication with encrypted keys is configured. "
-                "Note: Encrypted private keys require additional handling."
-            )
-            # Note: requests doesn't directly support encrypted private keys
-            # Users would need to decrypt the key first or use a custom adapter
-
-        # Set the client certificate on the session
-        session.cert = (client_cert, client_key)
-        logger.info(
-            f"{service_name} client certificate authentication configured with cert: {client_cert}"
+        adapter = _load_client_cert_adapter(
+            ssl_verify, client_cert, client_key, client_key_password
         )
 
-    if not ssl_verify:
-        logger.warning(
-            f"{service_name} SSL verification disabled. This is insecure and should only be used in testing environments."
-        )
+        if adapter is None:
+            if client_key_password:
+                # requests doesn't support encrypted private keys, so the
+                # session fallback below can only work for unencrypted ones
+                logger.warning(
+                    "%s client certificate authentication with encrypted keys "
+                    "is configured, but the key could not be loaded with the "
+                    "given password. Connections using it are likely to fail.",
+                    service_name,
+                )
 
-        # Get the domain from the configured URL
-        domain = urlparse(url).netloc
+            # Set the client certificate on the session
+            session.cert = (client_cert, client_key)
+        _log_client_cert(service_name, client_cert)
+
+    if not ssl_verify:
+        prefixes = _mount_prefixes(url)
+        _warn_ssl_disabled(service_name, prefixes[0].removeprefix("https://"))
+        if adapter is None:
+            adapter = _get_ignore_adapter()
 
-        # Mount the adapter to handle requests to this domain
-        adapter = SSLIgnoreAdapter()
-        session.mount(f"https://{domain}", adapter)
-        session.mount(f"http://{domain}", adapter)
+    if adapter is not None:
+        # Mount the adapter to handle requests to the configured URL's domain,
+        # unless this session already routes it there
+        for prefix in _mount_prefixes(url):
+            if session.adapters.get(prefix) is not adapter:
+                session.mount(prefix, adapter)
+    elif isinstance(url, str) and url:
+        # Verify through the shared preloaded contexts, without displacing
+        # an adapter someone else mounted for this domain. Without a usable
+        # URL the session's default adapters are left as they are.
+        adapter = _get_verifying_adapter()
+        for prefix in _mount_prefixes(url):
+            if prefix not in session.adapters:
+                session.mount(prefix, adapter)
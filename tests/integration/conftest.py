@@ -4,10 +4,14 @@ import pytest
 
 
 def pytest_configure(config):
-    """Add integration marker."""
+    """Add integration and xdist_group markers."""
     config.addinivalue_line(
         "markers", "integration: mark test as requiring integration with real services"
     )
+    # Registered here too so the mark is accepted when pytest-xdist is not installed
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run the marked tests on a single xdist worker"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -9,12 +9,15 @@ real Confluence instances and will create/modify real data.
 import json
 import os
 import uuid
-from typing import Any, Dict
+from functools import partial
+from typing import Any
 
+import anyio
 import pytest
 
 from fastmcp import Client
 from fastmcp.client import FastMCPTransport
+from fastmcp.exceptions import ToolError
 from mcp.types import TextContent
 
 from mcp_atlassian.confluence import ConfluenceFetcher
@@ -23,8 +26,89 @@ from mcp_atlassian.servers import main_mcp
 from tests.utils.base import BaseAuthTest
 from tests.utils.test_setup import fresh_confluence_test_environment
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Upper bound on concurrent tool calls, to stay clear of Confluence rate limits
+MAX_CONCURRENT_TOOL_CALLS = 8
+
+# Sample markdown page body for the content format tests
+MARKDOWN_CONTENT = """
+# Heading 1
+This is **bold** text and this is *italic* text.
+
+## Heading 2
+- List item 1
+- List item 2
+- List item 3
+
+### Code example
+```
+print("Hello, World!")
+```
+""".strip()
+
+# Sample wiki markup page body for the content format tests
+WIKI_CONTENT = """
+h1. Wiki Markup Heading
+
+This is *bold* text and this is _italic_ text.
+
+h2. Sub Heading
+
+* List item 1
+* List item 2
+* List item 3
+
+{code:language=python}
+print("Hello, World!")
+{code}
+""".strip()
+
+# Markdown page body mixing code, tables and quotes for the content option tests
+RICH_MARKDOWN_CONTENT = """
+# Test Page Content
+
+This page contains various content types for testing MCP functions.
+
+## Features Tested
+- Markdown conversion
+- Metadata inclusion
+- Content retrieval options
+
+### Code Example
+```python
+def hello_world():
+    print("Hello from MCP!")
+    return "success"
+```
+
+### Tables
+| Column 1 | Column 2 | Column 3 |
+|----------|----------|----------|
+| Data 1   | Data 2   | Data 3   |
+| More 1   | More 2   | More 3   |
+
+**Bold text** and *italic text*.
+
+> This is a blockquote for testing purposes.
+""".strip()
+
+
+@pytest.fixture(scope="module")
+def anyio_backend():
+    """Run the live tests once, on asyncio, so the shared MCP client can be reused."""
+    return "asyncio"
+
 
 @pytest.mark.integration
+@pytest.mark.anyio
+# fresh_confluence_test_environment sweeps every test-looking page out of the
+# shared space before each test, so the class must not be split across xdist
+# workers (run with --dist loadgroup)
+@pytest.mark.xdist_group("confluence_live")
 @pytest.mark.usefixtures("fresh_confluence_test_environment")
 class TestConfluenceMCPFunctions(BaseAuthTest):
     """Live tests for all Confluence MCP functions with real API calls."""
@@ -35,18 +119,26 @@ class TestConfluenceMCPFunctions(BaseAuthTest):
         if not request.config.getoption("--use-real-data", default=False):
             pytest.skip("Live MCP tests only run with --use-real-data flag")
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def confluence_client(self):
-        """Create real Confluence client from environment."""
+        """Create real Confluence client from environment.
+
+        Shared by every test in the class so its HTTP session and connection
+        pool are reused instead of reconnecting per test.
+        """
         if not os.getenv("CONFLUENCE_URL"):
             pytest.skip("CONFLUENCE_URL not set in environment")
 
         config = ConfluenceConfig.from_env()
         return ConfluenceFetcher(config=config)
 
-    @pytest.fixture(scope="function")
+    @pytest.fixture(scope="class")
     async def mcp_client(self):
-        """Create FastMCP client connected to the main server for tool calls."""
+        """Create FastMCP client connected to the main server for tool calls.
+
+        The client is shared by every test in the class, so the server lifespan
+        and MCP handshake run once; per-test state lives in ``created_resources``.
+        """
         transport = FastMCPTransport(main_mcp)
         client = Client(transport=transport)
         async with client as connected_client:
@@ -58,48 +150,96 @@ class TestConfluenceMCPFunctions(BaseAuthTest):
         key = os.getenv("CONFLUENCE_TEST_SPACE_KEY", "TEST")
         return key
 
+    @pytest.fixture
+    def unique_id(self):
+        """Short unique suffix for test resource names."""
+        return uuid.uuid4().hex[:8]
+
     @pytest.fixture
     def created_resources(self):
         """Track all created resources for cleanup."""
         resources = {
             "pages": [],
-            "comments": [],
-            "labels": []
         }
         yield resources
         # Cleanup will be handled per test
 
-    async def call_mcp_tool(self, client: Client, tool_name: str, **kwargs) -> Dict[str, Any]:
-        """Helper to call MCP tool via client and parse JSON response."""
-        result_content = await client.call_tool(tool_name, kwargs)
-        # result_content is a list of TextContent objects
-        if result_content and isinstance(result_content[0], TextContent):
-            return json.loads(result_content[0].text)
-        return {"success": False, "error": "No valid content returned"}
+    @pytest.fixture
+    async def scratch_page(self, mcp_client, confluence_client, test_space_key, created_resources, unique_id):
+        """Create a throwaway page for tests that act on an existing page.
 
-    def cleanup_created_resources(self, confluence_client, resources: Dict[str, list]):
-        """Clean up all created resources."""
-        # Clean up pages last (as they might contain comments and labels)
-        for comment_id in resources.get("comments", []):
-            try:
-                # Comments can't be deleted directly, they're deleted with the page
-                pass
-            except Exception:
-                pass
+        Yields the page ID and deletes every page in ``created_resources``
+        on teardown.
+        """
+        page_result = await self.call_mcp_tool(
+            mcp_client,
+            "create_page",
+            space_key=test_space_key,
+            title=f"MCP Test Scratch Page {unique_id}",
+            content="Page for testing page operations"
+        )
 
-        for label_name in resources.get("labels", []):
-            try:
-                # Labels can't be deleted directly, they're removed from pages
-                pass
-            except Exception:
-                pass
+        page_id = page_result["page"]["id"]
+        created_resources["pages"].append(page_id)
+        try:
+            yield page_id
+        finally:
+            await self.cleanup_created_resources(confluence_client, created_resources)
+
+    async def call_mcp_tool(self, client: Client, tool_name: str, **kwargs) -> dict[str, Any]:
+        """Helper to call MCP tool via client and parse its JSON text response."""
+        result = await client.call_tool_mcp(tool_name, kwargs)
+        if result.isError:
+            raise ToolError(result.content[0].text)
+        # result.content is a list of TextContent objects
+        if result.content and isinstance(result.content[0], TextContent):
+            return json_loads(result.content[0].text)
+        return {"success": False, "error": "No valid content returned"}
 
-        for page_id in resources.get("pages", []):
+    async def call_mcp_tools(
+        self,
+        client: Client,
+        calls: list[tuple[str, dict[str, Any]]],
+        created_pages: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run independent MCP tool calls concurrently, returning results in call order.
+
+        IDs of pages returned by the calls are added to ``created_pages`` as each
+        call completes, so cleanup still sees them if a sibling call fails.
+        """
+        results: list[dict[str, Any]] = [{} for _ in calls]
+        limiter = anyio.CapacityLimiter(MAX_CONCURRENT_TOOL_CALLS)
+
+        async def run_call(index: int, tool_name: str, kwargs: dict[str, Any]) -> None:
+            async with limiter:
+                result = await self.call_mcp_tool(client, tool_name, **kwargs)
+            results[index] = result
+            if created_pages is not None and isinstance(result, dict) and "page" in result:
+                created_pages.append(result["page"]["id"])
+
+        async with anyio.create_task_group() as tg:
+            for index, (tool_name, kwargs) in enumerate(calls):
+                tg.start_soon(run_call, index, tool_name, kwargs)
+        return results
+
+    async def cleanup_created_resources(self, confluence_client, resources: dict[str, list]):
+        """Clean up all created resources, deleting pages concurrently."""
+        # Comments and labels can't be deleted directly; they go with their page
+        limiter = anyio.CapacityLimiter(MAX_CONCURRENT_TOOL_CALLS)
+
+        async def delete_page(page_id: str) -> None:
             try:
-                confluence_client.delete_page(page_id=page_id)
+                await anyio.to_thread.run_sync(
+                    partial(confluence_client.delete_page, page_id=page_id),
+                    limiter=limiter,
+                )
             except Exception:
                 pass
 
+        async with anyio.create_task_group() as tg:
+            for page_id in resources.get("pages", []):
+                tg.start_soon(delete_page, page_id)
+
     async def test_confluence_search(self, mcp_client, confluence_client, test_space_key):
         """Test confluence_search MCP function."""
         # Test simple search
@@ -129,9 +269,8 @@ class TestConfluenceMCPFunctions(BaseAuthTest):
             if isinstance(page, dict) and "space" in page:
                 assert page["space"]["key"] == test_space_key
 
-    async def test_confluence_page_lifecycle(self, mcp_client, confluence_client, test_space_key, created_resources):
+    async def test_confluence_page_lifecycle(self, mcp_client, confluence_client, test_space_key, created_resources, unique_id):
         """Test confluence_get_page, confluence_create_page, confluence_update_page, and confluence_delete_page MCP functions."""
-        unique_id = str(uuid.uuid4())[:8]
         title = f"MCP Test Page {unique_id}"
 
         try:
@@ -151,24 +290,18 @@ class TestConfluenceMCPFunctions(BaseAuthTest):
             page_id = create_result["page"]["id"]
             created_resources["pages"].append(page_id)
 
-            # Get the page by ID
-            get_result = await self.call_mcp_tool(
+            # Get the page by ID and by title and space to verify it persisted
+            get_result, get_by_title_result = await self.call_mcp_tools(
                 mcp_client,
-                "get_page",
-                page_id=page_id
+                [
+                    ("get_page", {"page_id": page_id}),
+                    ("get_page", {"title": title, "space_key": test_space_key}),
+                ]
             )
 
             assert "metadata" in get_result
             assert get_result["metadata"]["title"] == title
 
-            # Get the page by title and space
-            get_by_title_result = await self.call_mcp_tool(
-                mcp_client,
-                "get_page",
-                title=title,
-                space_key=test_space_key
-            )
-
             assert "metadata" in get_by_title_result
             assert get_by_title_result["metadata"]["title"] == title
 
@@ -188,16 +321,6 @@ class TestConfluenceMCPFunctions(BaseAuthTest):
             assert "page" in update_result
             assert update_result["page"]["title"] == updated_title
 
-            # Verify the update
-            get_updated_result = await self.call_mcp_tool(
-                mcp_client,
-                "get_page",
-                page_id=page_id
-            )
-
-            assert "metadata" in get_updated_result
-            assert get_updated_result["metadata"]["title"] == updated_title
-
             # Delete the page
             delete_result = await self.call_mcp_tool(
                 mcp_client,
@@ -218,11 +341,10 @@ class TestConfluenceMCPFunctions(BaseAuthTest):
             assert "error" in get_deleted_result
 
         finally:
-            self.cleanup_created_resources(confluence_client, created_resources)
+            await self.cleanup_created_resources(confluence_client, created_resources)
 
-    async def test_confluence_page_hierarchy(self, mcp_client, confluence_client, test_space_key, created_resources):
+    async def test_confluence_page_hierarchy(self, mcp_client, confluence_client, test_space_key, created_resources, unique_id):
         """Test confluence_get_page_children MCP function with page hierarchy."""
-        unique_id = str(uuid.uuid4())[:8]
 
         try:
             # Create parent page
@@ -237,173 +359,130 @@ class TestConfluenceMCPFunctions(BaseAuthTest):
             parent_id = parent_result["page"]["id"]
             created_resources["pages"].append(parent_id)
 
-            # Create child pages
-            child1_result = await self.call_mcp_tool(
+            # Create child pages in one batch call
+            children_batch_result = await self.call_mcp_tool(
                 mcp_client,
-                "create_page",
+                "batch_create_pages",
                 space_key=test_space_key,
-                title=f"Child Page 1 {unique_id}",
-                content="First child page content",
-                parent_id=parent_id
-            )
-
-            child1_id = child1_result["page"]["id"]
-            created_resources["pages"].append(child1_id)
-
-            child2_result = await self.call_mcp_tool(
-                mcp_client,
-                "create_page",
-                space_key=test_space_key,
-                title=f"Child Page 2 {unique_id}",
-                content="Second child page content",
-                parent_id=parent_id
-            )
-
-            child2_id = child2_result["page"]["id"]
-            created_resources["pages"].append(child2_id)
-
-            # Get children of parent page
+                pages=json.dumps([
+                    {
+                        "title": f"Child Page 1 {unique_id}",
+                        "content": "First child page content",
+                        "parent_id": parent_id
+                    },
+                    {
+                        "title": f"Child Page 2 {unique_id}",
+                        "content": "Second child page content",
+                        "parent_id": parent_id
+                    },
+                ])
+            )
+
+            # Track whatever was created before asserting, so cleanup sees it
+            created_resources["pages"].extend(
+                page["id"] for page in children_batch_result["pages"]
+            )
+            assert children_batch_result["success"] is True
+            child1_id, child2_id = [page["id"] for page in children_batch_result["pages"]]
+
+            # Get children of parent page with content; both children fit in one page
             children_result = await self.call_mcp_tool(
                 mcp_client,
                 "get_page_children",
-                parent_id=parent_id
+                parent_id=parent_id,
+                include_content=True,
+                limit=2
             )
 
             assert children_result["success"] is True
             assert children_result["count"] >= 2
-            assert len(children_result["results"]) >= 2
+            assert len(children_result["results"]) == 2
 
             # Verify both children are in the results
             child_ids = [child["id"] for child in children_result["results"]]
             assert child1_id in child_ids
             assert child2_id in child_ids
 
-            # Test with content inclusion
-            children_with_content_result = await self.call_mcp_tool(
-                mcp_client,
-                "get_page_children",
-                parent_id=parent_id,
-                include_content=True,
-                limit=2
-            )
-
-            assert children_with_content_result["success"] is True
-            assert len(children_with_content_result["results"]) <= 2
-
-            for child in children_with_content_result["results"]:
+            for child in children_result["results"]:
                 assert "content" in child
 
         finally:
-            self.cleanup_created_resources(confluence_client, created_resources)
+            await self.cleanup_created_resources(confluence_client, created_resources)
 
-    async def test_confluence_comments(self, mcp_client, confluence_client, test_space_key, created_resources):
+    async def test_confluence_comments(self, mcp_client, scratch_page, unique_id):
         """Test confluence_get_comments and confluence_add_comment MCP functions."""
-        unique_id = str(uuid.uuid4())[:8]
-
-        try:
-            # Create test page
-            page_result = await self.call_mcp_tool(
-                mcp_client,
-                "create_page",
-                space_key=test_space_key,
-                title=f"Comment Test Page {unique_id}",
-                content="Page for testing comments"
-            )
+        page_id = scratch_page
 
-            page_id = page_result["page"]["id"]
-            created_resources["pages"].append(page_id)
-
-            # Add a comment
-            comment_content = f"This is a test comment {unique_id} from MCP function"
-            add_comment_result = await self.call_mcp_tool(
-                mcp_client,
-                "add_comment",
-                page_id=page_id,
-                content=comment_content
-            )
+        # Add a comment
+        comment_content = f"This is a test comment {unique_id} from MCP function"
+        add_comment_result = await self.call_mcp_tool(
+            mcp_client,
+            "add_comment",
+            page_id=page_id,
+            content=comment_content
+        )
 
-            assert add_comment_result["success"] is True
-            assert comment_content in add_comment_result["comment"]["content"]
-            created_resources["comments"].append(add_comment_result["comment"]["id"])
+        assert add_comment_result["success"] is True
+        assert comment_content in add_comment_result["comment"]["content"]
 
-            # Get comments for the page
-            get_comments_result = await self.call_mcp_tool(
-                mcp_client,
-                "get_comments",
-                page_id=page_id
-            )
-
-            assert get_comments_result["success"] is True
-            assert len(get_comments_result["comments"]) >= 1
+        # Get comments for the page
+        get_comments_result = await self.call_mcp_tool(
+            mcp_client,
+            "get_comments",
+            page_id=page_id
+        )
 
-            # Find our comment
-            test_comment = None
-            for comment in get_comments_result["comments"]:
-                if unique_id in comment.get("content", ""):
-                    test_comment = comment
-                    break
+        assert get_comments_result["success"] is True
+        assert len(get_comments_result["comments"]) >= 1
 
-            assert test_comment is not None
-            assert unique_id in test_comment["content"]
+        # Find our comment
+        test_comment = None
+        for comment in get_comments_result["comments"]:
+            if unique_id in comment.get("content", ""):
+                test_comment = comment
+                break
 
-        finally:
-            self.cleanup_created_resources(confluence_client, created_resources)
+        assert test_comment is not None
+        assert unique_id in test_comment["content"]
 
-    async def test_confluence_labels(self, mcp_client, confluence_client, test_space_key, created_resources):
+    async def test_confluence_labels(self, mcp_client, scratch_page, unique_id):
         """Test confluence_get_labels and confluence_add_label MCP functions."""
-        unique_id = str(uuid.uuid4())[:8]
-
-        try:
-            # Create test page
-            page_result = await self.call_mcp_tool(
-                mcp_client,
-                "create_page",
-                space_key=test_space_key,
-                title=f"Label Test Page {unique_id}",
-                content="Page for testing labels"
-            )
+        page_id = scratch_page
 
-            page_id = page_result["page"]["id"]
-            created_resources["pages"].append(page_id)
-
-            # Get initial labels (should be empty)
-            initial_labels_result = await self.call_mcp_tool(
-                mcp_client,
-                "get_labels",
-                page_id=page_id
-            )
+        # Get initial labels (should be empty)
+        initial_labels_result = await self.call_mcp_tool(
+            mcp_client,
+            "get_labels",
+            page_id=page_id
+        )
 
-            assert initial_labels_result["success"] is True
-            initial_label_count = len(initial_labels_result["labels"])
+        assert initial_labels_result["success"] is True
+        initial_label_count = len(initial_labels_result["labels"])
 
-            # Add a label
-            test_label = f"mcp-test-{unique_id}"
-            add_label_result = await self.call_mcp_tool(
-                mcp_client,
-                "add_label",
-                page_id=page_id,
-                name=test_label
-            )
+        # Add a label
+        test_label = f"mcp-test-{unique_id}"
+        add_label_result = await self.call_mcp_tool(
+            mcp_client,
+            "add_label",
+            page_id=page_id,
+            name=test_label
+        )
 
-            assert add_label_result["success"] is True
-            created_resources["labels"].append(test_label)
+        assert add_label_result["success"] is True
 
-            # Verify label was added
-            updated_labels_result = await self.call_mcp_tool(
-                mcp_client,
-                "get_labels",
-                page_id=page_id
-            )
-
-            assert updated_labels_result["success"] is True
-            assert len(updated_labels_result["labels"]) == initial_label_count + 1
+        # Verify label was added
+        updated_labels_result = await self.call_mcp_tool(
+            mcp_client,
+            "get_labels",
+            page_id=page_id
+        )
 
-            # Find our label
-            label_names = [label["name"] for label in updated_labels_result["labels"]]
-            assert test_label in label_names
+        assert updated_labels_result["success"] is True
+        assert len(updated_labels_result["labels"]) == initial_label_count + 1
 
-        finally:
-            self.cleanup_created_resources(confluence_client, created_resources)
+        # Find our label
+        label_names = [label["name"] for label in updated_labels_result["labels"]]
+        assert test_label in label_names
 
     async def test_confluence_user_functions(self, mcp_client, confluence_client):
         """Test confluence_search_user and confluence_get_user_details MCP functions."""
@@ -438,79 +517,62 @@ class TestConfluenceMCPFunctions(BaseAuthTest):
             # User functions might not be available in all Confluence instances
             pytest.skip(f"User functions not available: {e}")
 
-    async def test_confluence_page_versions(self, mcp_client, confluence_client, test_space_key, created_resources):
+    async def test_confluence_page_versions(self, mcp_client, scratch_page, unique_id):
         """Test confluence_list_page_versions and confluence_get_page_version MCP functions."""
-        unique_id = str(uuid.uuid4())[:8]
-
-        try:
-            # Create test page
-            page_result = await self.call_mcp_tool(
-                mcp_client,
-                "create_page",
-                space_key=test_space_key,
-                title=f"Version Test Page {unique_id}",
-                content="Initial content"
-            )
-
-            page_id = page_result["page"]["id"]
-            created_resources["pages"].append(page_id)
-
-            # Get page versions (should have at least version 1)
-            versions_result = await self.call_mcp_tool(
-                mcp_client,
-                "list_page_versions",
-                page_id=page_id,
-                limit=10
-            )
+        page_id = scratch_page
 
-            assert versions_result["success"] is True
-            assert versions_result["count"] >= 1
-            assert len(versions_result["results"]) >= 1
+        # Get page versions (should have at least version 1)
+        versions_result = await self.call_mcp_tool(
+            mcp_client,
+            "list_page_versions",
+            page_id=page_id,
+            limit=10
+        )
 
-            # Get first version
-            first_version = versions_result["results"][0]
-            version_number = first_version["number"]
+        assert versions_result["success"] is True
+        assert versions_result["count"] >= 1
+        assert len(versions_result["results"]) >= 1
 
-            # Get specific version
-            specific_version_result = await self.call_mcp_tool(
-                mcp_client,
-                "get_page_version",
-                page_id=page_id,
-                version_number=version_number
-            )
+        # Get first version
+        first_version = versions_result["results"][0]
+        version_number = first_version["number"]
 
-            assert specific_version_result["success"] is True
-            assert specific_version_result["version_number"] == version_number
+        # Get specific version
+        specific_version_result = await self.call_mcp_tool(
+            mcp_client,
+            "get_page_version",
+            page_id=page_id,
+            version_number=version_number
+        )
 
-            # Update the page to create a new version
-            update_result = await self.call_mcp_tool(
-                mcp_client,
-                "update_page",
-                page_id=page_id,
-                title=f"Version Test Page {unique_id} - Updated",
-                content="Updated content",
-                version_comment="Creating new version"
-            )
+        assert specific_version_result["success"] is True
+        assert specific_version_result["version_number"] == version_number
 
-            assert update_result["success"] is True
+        # Update the page to create a new version
+        update_result = await self.call_mcp_tool(
+            mcp_client,
+            "update_page",
+            page_id=page_id,
+            title=f"MCP Test Scratch Page {unique_id} - Updated",
+            content="Updated content",
+            version_comment="Creating new version"
+        )
 
-            # Get versions again (should have 2 versions now)
-            updated_versions_result = await self.call_mcp_tool(
-                mcp_client,
-                "list_page_versions",
-                page_id=page_id,
-                limit=10
-            )
+        assert update_result["success"] is True
 
-            assert updated_versions_result["success"] is True
-            assert updated_versions_result["count"] >= 2
+        # Get versions again (should have 2 versions now)
+        updated_versions_result = await self.call_mcp_tool(
+            mcp_client,
+            "list_page_versions",
+            page_id=page_id,
+            limit=10
+        )
 
-        finally:
-            self.cleanup_created_resources(confluence_client, created_resources)
+        assert updated_versions_result["success"] is True
+        assert updated_versions_result["count"] >= 2
 
-    async def test_confluence_move_page(self, mcp_client, confluence_client, test_space_key, created_resources):
+    async def test_confluence_move_page(self, mcp_client, confluence_client, test_space_key, created_resources, unique_id):
         """Test confluence_move_page MCP function."""
-        unique_id = str(uuid.uuid4())[:8]
 
         try:
             # Create parent page
@@ -560,71 +622,36 @@ class TestConfluenceMCPFunctions(BaseAuthTest):
             assert page_to_move_id in child_ids
 
         finally:
-            self.cleanup_created_resources(confluence_client, created_resources)
+            await self.cleanup_created_resources(confluence_client, created_resources)
 
-    async def test_confluence_content_formats(self, mcp_client, confluence_client, test_space_key, created_resources):
+    async def test_confluence_content_formats(self, mcp_client, confluence_client, test_space_key, created_resources, unique_id):
         """Test different content formats in confluence_create_page and confluence_update_page."""
-        unique_id = str(uuid.uuid4())[:8]
 
         try:
-            # Test with markdown content
-            markdown_content = """
-# Heading 1
-This is **bold** text and this is *italic* text.
-
-## Heading 2
-- List item 1
-- List item 2
-- List item 3
-
-### Code example
-```
-print("Hello, World!")
-```
-            """.strip()
-
-            markdown_result = await self.call_mcp_tool(
-                mcp_client,
-                "create_page",
-                space_key=test_space_key,
-                title=f"Markdown Test Page {unique_id}",
-                content=markdown_content,
-                content_format="markdown"
+            # Create one page per content format
+            markdown_result, wiki_result = await self.call_mcp_tools(
+                mcp_client,
+                [
+                    ("create_page", {
+                        "space_key": test_space_key,
+                        "title": f"Markdown Test Page {unique_id}",
+                        "content": MARKDOWN_CONTENT,
+                        "content_format": "markdown"
+                    }),
+                    ("create_page", {
+                        "space_key": test_space_key,
+                        "title": f"Wiki Markup Test Page {unique_id}",
+                        "content": WIKI_CONTENT,
+                        "content_format": "wiki"
+                    }),
+                ],
+                created_pages=created_resources["pages"]
             )
 
             assert markdown_result["success"] is True
             markdown_page_id = markdown_result["page"]["id"]
-            created_resources["pages"].append(markdown_page_id)
-
-            # Test with wiki markup content
-            wiki_content = """
-h1. Wiki Markup Heading
-
-This is *bold* text and this is _italic_ text.
-
-h2. Sub Heading
-
-* List item 1
-* List item 2
-* List item 3
-
-{code:language=python}
-print("Hello, World!")
-{code}
-            """.strip()
-
-            wiki_result = await self.call_mcp_tool(
-                mcp_client,
-                "create_page",
-                space_key=test_space_key,
-                title=f"Wiki Markup Test Page {unique_id}",
-                content=wiki_content,
-                content_format="wiki"
-            )
 
             assert wiki_result["success"] is True
-            wiki_page_id = wiki_result["page"]["id"]
-            created_resources["pages"].append(wiki_page_id)
 
             # Test updating with different format
             update_result = await self.call_mcp_tool(
@@ -639,41 +666,41 @@ print("Hello, World!")
             assert update_result["success"] is True
 
         finally:
-            self.cleanup_created_resources(confluence_client, created_resources)
+            await self.cleanup_created_resources(confluence_client, created_resources)
 
     async def test_confluence_advanced_search(self, mcp_client, confluence_client, test_space_key):
         """Test advanced CQL search functionality."""
         try:
-            # Test search with date filters
-            date_search_result = await self.call_mcp_tool(
-                mcp_client,
-                "search",
-                query=f'space="{test_space_key}" and created >= startOfDay()',
-                limit=5
+            # Test search with date filters, a label filter and multiple
+            # conditions; the searches are independent, so run them together
+            (
+                date_search_result,
+                label_search_result,
+                multi_search_result,
+            ) = await self.call_mcp_tools(
+                mcp_client,
+                [
+                    ("search", {
+                        "query": f'space="{test_space_key}" and created >= startOfDay()',
+                        "limit": 5
+                    }),
+                    ("search", {
+                        "query": f'space="{test_space_key}" and label is not empty',
+                        "limit": 5
+                    }),
+                    ("search", {
+                        "query": f'space="{test_space_key}" and type=page and lastModified > startOfWeek()',
+                        "limit": 3
+                    }),
+                ]
             )
 
             assert date_search_result["success"] is True
             assert isinstance(date_search_result, list)
 
-            # Test search with label filter
-            label_search_result = await self.call_mcp_tool(
-                mcp_client,
-                "search",
-                query=f'space="{test_space_key}" and label is not empty',
-                limit=5
-            )
-
             assert label_search_result["success"] is True
             assert isinstance(label_search_result, list)
 
-            # Test search with multiple conditions
-            multi_search_result = await self.call_mcp_tool(
-                mcp_client,
-                "search",
-                query=f'space="{test_space_key}" and type=page and lastModified > startOfWeek()',
-                limit=3
-            )
-
             assert multi_search_result["success"] is True
             assert isinstance(multi_search_result, list)
 
@@ -687,23 +714,29 @@ print("Hello, World!")
             # Advanced search might not be available in all instances
             pytest.skip(f"Advanced search not available: {e}")
 
-    async def test_confluence_pagination(self, mcp_client, confluence_client, test_space_key, created_resources):
+    async def test_confluence_pagination(self, mcp_client, confluence_client, test_space_key, created_resources, unique_id):
         """Test pagination functionality in search and page children."""
-        unique_id = str(uuid.uuid4())[:8]
 
         try:
-            # Create multiple pages to test pagination
-            created_page_ids = []
-            for i in range(5):
-                page_result = await self.call_mcp_tool(
-                    mcp_client,
-                    "create_page",
-                    space_key=test_space_key,
-                    title=f"Pagination Test Page {i+1} {unique_id}",
-                    content=f"Content for page {i+1}"
-                )
-                created_page_ids.append(page_result["page"]["id"])
-                created_resources["pages"].append(page_result["page"]["id"])
+            # Create multiple pages to test pagination in one batch call
+            batch_result = await self.call_mcp_tool(
+                mcp_client,
+                "batch_create_pages",
+                space_key=test_space_key,
+                pages=json.dumps([
+                    {
+                        "title": f"Pagination Test Page {i+1} {unique_id}",
+                        "content": f"Content for page {i+1}"
+                    }
+                    for i in range(5)
+                ])
+            )
+
+            # Track whatever was created before asserting, so cleanup sees it
+            created_page_ids = [page["id"] for page in batch_result["pages"]]
+            created_resources["pages"].extend(created_page_ids)
+            assert batch_result["success"] is True
+            assert batch_result["total"] == 5
 
             # Test search pagination
             search_page1 = await self.call_mcp_tool(
@@ -730,7 +763,7 @@ print("Hello, World!")
                 created_resources["pages"].append(parent_id)
 
                 # Move some pages as children
-                for i, page_id in enumerate(created_page_ids[:3]):
+                async def move_to_parent(page_id: str) -> None:
                     try:
                         await self.call_mcp_tool(
                             mcp_client,
@@ -742,6 +775,10 @@ print("Hello, World!")
                         # Move might fail, that's okay for this test
                         pass
 
+                async with anyio.create_task_group() as tg:
+                    for page_id in created_page_ids[:3]:
+                        tg.start_soon(move_to_parent, page_id)
+
                 # Test paginated children
                 children_paged = await self.call_mcp_tool(
                     mcp_client,
@@ -754,7 +791,7 @@ print("Hello, World!")
                 assert len(children_paged["results"]) <= 2
 
         finally:
-            self.cleanup_created_resources(confluence_client, created_resources)
+            await self.cleanup_created_resources(confluence_client, created_resources)
 
     async def test_confluence_error_handling(self, mcp_client, confluence_client):
         """Test error handling for various edge cases."""
@@ -804,47 +841,17 @@ print("Hello, World!")
         assert not comment_error_result["success"]
         assert "error" in comment_error_result
 
-    async def test_confluence_page_content_options(self, mcp_client, confluence_client, test_space_key, created_resources):
+    async def test_confluence_page_content_options(self, mcp_client, confluence_client, test_space_key, created_resources, unique_id):
         """Test different page content retrieval options."""
-        unique_id = str(uuid.uuid4())[:8]
 
         try:
             # Create page with substantial content
-            content = """
-# Test Page Content
-
-This page contains various content types for testing MCP functions.
-
-## Features Tested
-- Markdown conversion
-- Metadata inclusion
-- Content retrieval options
-
-### Code Example
-```python
-def hello_world():
-    print("Hello from MCP!")
-    return "success"
-```
-
-### Tables
-| Column 1 | Column 2 | Column 3 |
-|----------|----------|----------|
-| Data 1   | Data 2   | Data 3   |
-| More 1   | More 2   | More 3   |
-
-**Bold text** and *italic text*.
-
-> This is a blockquote for testing purposes.
-            """.strip()
-
-            # Create page
             create_result = await self.call_mcp_tool(
                 mcp_client,
                 "create_page",
                 space_key=test_space_key,
                 title=f"Content Options Test {unique_id}",
-                content=content,
+                content=RICH_MARKDOWN_CONTENT,
                 content_format="markdown"
             )
 
@@ -892,4 +899,4 @@ def hello_world():
             assert "<" in content_value and ">" in content_value  # Basic HTML check
 
         finally:
-            self.cleanup_created_resources(confluence_client, created_resources)
\ No newline at end of file
+            await self.cleanup_created_resources(confluence_client, created_resources)
\ No newline at end of file
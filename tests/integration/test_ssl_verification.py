@@ -40,12 +40,13 @@ def test_configure_ssl_verification_with_real_confluence_url():
         # Extract domain from URL (remove protocol and path)
         domain = url.split("://")[1].split("/")[0]
 
-        # Verify the adapters are mounted correctly
-        assert len(session.adapters) == original_adapters_count + 2
-        assert f"https://{domain}" in session.adapters
-        assert f"http://{domain}" in session.adapters
+        # Verify the adapters are mounted correctly; plain HTTP instances
+        # also get the https prefix, as they may redirect to HTTPS
+        is_https = url.lower().startswith("https://")
+        assert len(session.adapters) == original_adapters_count + (1 if is_https else 2)
         assert isinstance(session.adapters[f"https://{domain}"], SSLIgnoreAdapter)
-        assert isinstance(session.adapters[f"http://{domain}"], SSLIgnoreAdapter)
+        if not is_https:
+            assert isinstance(session.adapters[f"http://{domain}"], SSLIgnoreAdapter)
 
 
 class TestSSLVerificationEnhanced(BaseAuthTest):
@@ -143,9 +144,8 @@ class TestSSLVerificationEnhanced(BaseAuthTest):
 
     @pytest.mark.integration
     def test_ssl_adapter_not_mounted_when_verification_enabled(self):
-        """Test that SSL adapters are not mounted when verification is enabled."""
+        """Test that SSL ignore adapters are not mounted when verifying."""
         session = Session()
-        original_adapter_count = len(session.adapters)
 
         # Configure with SSL verification enabled
         configure_ssl_verification(
@@ -155,9 +155,9 @@ class TestSSLVerificationEnhanced(BaseAuthTest):
             ssl_verify=True,  # SSL verification enabled
         )
 
-        # No additional adapters should be mounted
-        assert len(session.adapters) == original_adapter_count
-        assert "https://test.atlassian.net" not in session.adapters
+        # Only the verifying adapter serves the domain
+        adapter = session.adapters["https://test.atlassian.net"]
+        assert not isinstance(adapter, SSLIgnoreAdapter)
 
     @pytest.mark.integration
     def test_ssl_configuration_persistence_across_requests(self):
@@ -229,9 +229,10 @@ def test_configure_ssl_verification_with_real_jira_url():
         # Extract domain from URL (remove protocol and path)
         domain = url.split("://")[1].split("/")[0]
 
-        # Verify the adapters are mounted correctly
-        assert len(session.adapters) == original_adapters_count + 2
-        assert f"https://{domain}" in session.adapters
-        assert f"http://{domain}" in session.adapters
+        # Verify the adapters are mounted correctly; plain HTTP instances
+        # also get the https prefix, as they may redirect to HTTPS
+        is_https = url.lower().startswith("https://")
+        assert len(session.adapters) == original_adapters_count + (1 if is_https else 2)
         assert isinstance(session.adapters[f"https://{domain}"], SSLIgnoreAdapter)
-        assert isinstance(session.adapters[f"http://{domain}"], SSLIgnoreAdapter)
+        if not is_https:
+            assert isinstance(session.adapters[f"http://{domain}"], SSLIgnoreAdapter)
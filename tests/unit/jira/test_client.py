@@ -62,6 +62,27 @@ def test_init_with_basic_auth():
         assert client._current_user_account_id is None
 
 
+def test_init_skips_header_masking_when_debug_disabled():
+    """Test that session headers are only masked when debug logging is on."""
+    with (
+        patch("mcp_atlassian.jira.client.Jira"),
+        patch("mcp_atlassian.jira.client.configure_ssl_verification"),
+        patch("mcp_atlassian.jira.client.get_masked_session_headers") as mock_mask,
+        patch("mcp_atlassian.jira.client.logger") as mock_logger,
+    ):
+        mock_logger.isEnabledFor.return_value = False
+        config = JiraConfig(
+            url="https://test.atlassian.net",
+            auth_type="basic",
+            username="test_username",
+            api_token="test_token",
+        )
+
+        JiraClient(config=config)
+
+        mock_mask.assert_not_called()
+
+
 def test_init_with_token_auth():
     """Test initializing the client with token auth configuration."""
     with (
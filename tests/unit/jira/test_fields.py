@@ -262,6 +262,22 @@ class TestFieldsMixin:
             project="TEST", issue_type_id="10001"
         )
 
+    def test_get_required_fields_returns_copy_of_cached_result(
+        self, fields_mixin: FieldsMixin
+    ):
+        """Test cached required fields are served without exposing the cache entry."""
+        fields_mixin.get_project_issue_types = MagicMock()
+        fields_mixin._required_fields_cache[("TEST", "Bug")] = {
+            "summary": {"fieldId": "summary", "required": True}
+        }
+
+        first = fields_mixin.get_required_fields("Bug", "TEST")
+        first.pop("summary")
+        second = fields_mixin.get_required_fields("Bug", "TEST")
+
+        assert "summary" in second
+        fields_mixin.get_project_issue_types.assert_not_called()
+
     def test_get_required_fields_not_found(self, fields_mixin: FieldsMixin):
         """Test get_required_fields handles project/issue type not found."""
         # Scenario 1: Issue type not found in project
@@ -630,3 +646,23 @@ class TestFieldsMixin:
         result = fields_mixin.format_field_value("priority", "High")
         expected = {"id": "2", "name": "High"}
         assert result == expected
+
+    def test_get_field_options_cached(self, fields_mixin: FieldsMixin):
+        """Test get_field_options serves repeat requests from the cache."""
+        fields_mixin.jira.get.return_value = {
+            "startAt": 0,
+            "maxResults": 50,
+            "total": 1,
+            "isLast": True,
+            "values": [{"id": "10001", "value": "Option", "disabled": False}],
+        }
+
+        first = fields_mixin.get_field_options("customfield_10001")
+        second = fields_mixin.get_field_options("customfield_10001")
+
+        assert first is second
+        fields_mixin.jira.get.assert_called_once()
+
+        # A different page is a different cache entry
+        fields_mixin.get_field_options("customfield_10001", start_at=50)
+        assert fields_mixin.jira.get.call_count == 2
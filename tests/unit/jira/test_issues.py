@@ -714,6 +714,24 @@ class TestIssuesMixin:
         assert not issues_mixin._get_account_id.called
         assert document.key == "TEST-123"
 
+    def test_update_issue_batches_additional_fields(self, issues_mixin: IssuesMixin):
+        """Test regular kwargs are resolved in a single field-processing pass."""
+        issues_mixin.jira.get_issue.return_value = {
+            "id": "12345",
+            "key": "TEST-123",
+            "fields": {"summary": "Test Issue", "issuetype": {"name": "Bug"}},
+        }
+        issues_mixin.jira.issue_get_comments.return_value = {"comments": []}
+        issues_mixin._process_additional_fields = MagicMock()
+
+        issues_mixin.update_issue(
+            issue_key="TEST-123", labels=["a"], customfield_10010="value"
+        )
+
+        issues_mixin._process_additional_fields.assert_called_once_with(
+            {}, {"labels": ["a"], "customfield_10010": "value"}
+        )
+
     def test_delete_issue(self, issues_mixin: IssuesMixin):
         """Test deleting an issue."""
         # Call the method
@@ -450,6 +450,19 @@ def test_get_project_issue_types_empty_response(projects_mixin: ProjectsMixin):
     projects_mixin.jira.issue_types_for_project.assert_called_with("PROJ1")
 
 
+def test_get_project_issue_types_cached(
+    projects_mixin: ProjectsMixin, mock_issue_types: list[dict]
+):
+    """Test get_project_issue_types serves repeat calls from the cache."""
+    projects_mixin.jira.issue_types_for_project.return_value = mock_issue_types
+
+    first = projects_mixin.get_project_issue_types("PROJ1")
+    second = projects_mixin.get_project_issue_types("PROJ1")
+
+    assert first == second == mock_issue_types
+    projects_mixin.jira.issue_types_for_project.assert_called_once_with("PROJ1")
+
+
 def test_get_project_issue_types_exception(projects_mixin: ProjectsMixin):
     """Test get_project_issue_types method with exception."""
     projects_mixin.jira.issue_types_for_project.side_effect = Exception("API error")
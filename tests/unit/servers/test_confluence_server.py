@@ -493,6 +493,96 @@ async def test_create_page_with_string_parent_id(client, mock_confluence_fetcher
     assert result_data["page"]["title"] == "Test Page Mock Title"
 
 
+@pytest.mark.anyio
+async def test_batch_create_pages_preserves_order(client, mock_confluence_fetcher):
+    """Test batch_create_pages creates every page and keeps the input order."""
+
+    def create_page(**kwargs):
+        page = MagicMock()
+        page.to_simplified_dict.return_value = {"title": kwargs["title"]}
+        return page
+
+    mock_confluence_fetcher.create_page.side_effect = create_page
+    pages = [{"title": f"Page {i}", "content": f"Content {i}"} for i in range(10)]
+    pages.append(
+        {"title": "Wiki", "content": "h1. Wiki", "content_format": "wiki", "parent_id": 1}
+    )
+
+    response = await client.call_tool(
+        "confluence_batch_create_pages",
+        {"space_key": "TEST", "pages": json.dumps(pages)},
+    )
+
+    result_data = json.loads(response[0].text)
+    assert result_data["success"] is True
+    assert "errors" not in result_data
+    assert result_data["total"] == 11
+    assert [page["title"] for page in result_data["pages"]] == [
+        page["title"] for page in pages
+    ]
+    wiki_call = next(
+        call
+        for call in mock_confluence_fetcher.create_page.call_args_list
+        if call.kwargs["title"] == "Wiki"
+    )
+    assert wiki_call.kwargs["space_key"] == "TEST"
+    assert wiki_call.kwargs["parent_id"] == "1"
+    assert wiki_call.kwargs["is_markdown"] is False
+    assert wiki_call.kwargs["content_representation"] == "wiki"
+
+
+@pytest.mark.anyio
+async def test_batch_create_pages_reports_failure(client, mock_confluence_fetcher):
+    """Test a failing page is reported alongside the pages that were created."""
+
+    def create_page(**kwargs):
+        if kwargs["title"] == "Bad":
+            raise ValueError("A page with this title already exists")
+        page = MagicMock()
+        page.to_simplified_dict.return_value = {"title": kwargs["title"]}
+        return page
+
+    mock_confluence_fetcher.create_page.side_effect = create_page
+    pages = [
+        {"title": "Good", "content": "Content"},
+        {"title": "Bad", "content": "Content"},
+    ]
+
+    response = await client.call_tool(
+        "confluence_batch_create_pages",
+        {"space_key": "TEST", "pages": json.dumps(pages)},
+    )
+
+    result_data = json.loads(response[0].text)
+    assert result_data["success"] is False
+    assert result_data["pages"] == [{"title": "Good"}]
+    assert result_data["total"] == 1
+    assert result_data["errors"] == [
+        {"index": 1, "title": "Bad", "error": "A page with this title already exists"}
+    ]
+
+
+@pytest.mark.anyio
+async def test_batch_create_pages_validates_before_creating(
+    client, mock_confluence_fetcher
+):
+    """Test an invalid entry fails the batch before any page is created."""
+    pages = [
+        {"title": "Good", "content": "Content"},
+        {"title": "Bad", "content": "Content", "content_format": "html"},
+    ]
+
+    response = await client.call_tool(
+        "confluence_batch_create_pages",
+        {"space_key": "TEST", "pages": json.dumps(pages)},
+    )
+
+    result_data = json.loads(response[0].text)
+    assert result_data["success"] is False
+    assert "1.content_format" in result_data["error"]
+    mock_confluence_fetcher.create_page.assert_not_called()
+
+
 @pytest.mark.anyio
 async def test_update_page_with_numeric_parent_id(client, mock_confluence_fetcher):
     """Test updating a page with numeric parent_id (integer) - should convert to string."""
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+import mcp_atlassian.servers.dependencies as dependencies
 from mcp_atlassian.confluence import ConfluenceConfig, ConfluenceFetcher
 from mcp_atlassian.jira import JiraConfig, JiraFetcher
 from mcp_atlassian.servers.context import MainAppContext
@@ -13,6 +14,7 @@ from mcp_atlassian.servers.dependencies import (
     _create_user_config_for_fetcher,
     get_confluence_fetcher,
     get_jira_fetcher,
+    jira_fetcher_cache,
 )
 from mcp_atlassian.utils.oauth import OAuthConfig
 from tests.utils.assertions import assert_mock_called_with_partial
@@ -23,6 +25,16 @@ from tests.utils.mocks import MockFastMCP
 pytestmark = pytest.mark.anyio
 
 
+@pytest.fixture(autouse=True)
+def clear_fetcher_caches():
+    """Keep cached fetchers from leaking between tests."""
+    jira_fetcher_cache.clear()
+    dependencies._global_jira_fetcher = None
+    yield
+    jira_fetcher_cache.clear()
+    dependencies._global_jira_fetcher = None
+
+
 @pytest.fixture
 def config_factory():
     """Factory for creating various configuration objects."""
@@ -574,6 +586,38 @@ class TestGetJiraFetcher:
         elif scenario["auth_type"] == "pat":
             assert called_config.personal_token == scenario["token"]
 
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.JiraFetcher")
+    async def test_user_fetcher_reused_across_requests(
+        self,
+        mock_jira_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        mock_request,
+        config_factory,
+        auth_scenarios,
+    ):
+        """Test that a validated user fetcher is reused for the same token."""
+        scenario = auth_scenarios["pat"]
+        _setup_mock_request_state(mock_request, scenario)
+        mock_get_http_request.return_value = mock_request
+
+        jira_config = config_factory.create_jira_config(auth_type="pat")
+        confluence_config = config_factory.create_confluence_config(auth_type="pat")
+        app_context = config_factory.create_app_context(jira_config, confluence_config)
+        _setup_mock_context(mock_context, app_context)
+
+        mock_fetcher = _create_mock_fetcher(JiraFetcher)
+        mock_jira_fetcher_class.return_value = mock_fetcher
+
+        first = await get_jira_fetcher(mock_context)
+        mock_request.state.jira_fetcher = None
+        second = await get_jira_fetcher(mock_context)
+
+        assert first is second is mock_fetcher
+        mock_jira_fetcher_class.assert_called_once()
+        mock_fetcher.get_current_user_account_id.assert_called_once()
+
     @patch("mcp_atlassian.servers.dependencies.get_http_request")
     @patch("mcp_atlassian.servers.dependencies.JiraFetcher")
     async def test_global_fallback_scenarios(
@@ -618,6 +662,37 @@ class TestGetJiraFetcher:
             mock_jira_fetcher_class.reset_mock()
             mock_get_http_request.reset_mock()
 
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.JiraFetcher")
+    async def test_global_fetcher_replaced_when_config_changes(
+        self,
+        mock_jira_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        config_factory,
+    ):
+        """Test that the global fetcher is reused until the global config changes."""
+        mock_get_http_request.side_effect = RuntimeError("No HTTP context")
+        mock_jira_fetcher_class.side_effect = lambda config: _create_mock_fetcher(
+            JiraFetcher
+        )
+
+        first_context = config_factory.create_app_context()
+        _setup_mock_context(mock_context, first_context)
+        first = await get_jira_fetcher(mock_context)
+        assert await get_jira_fetcher(mock_context) is first
+
+        second_context = config_factory.create_app_context()
+        _setup_mock_context(mock_context, second_context)
+        second = await get_jira_fetcher(mock_context)
+
+        assert second is not first
+        assert mock_jira_fetcher_class.call_count == 2
+        assert dependencies._global_jira_fetcher == (
+            second_context.full_jira_config,
+            second,
+        )
+
     @pytest.mark.parametrize(
         "error_scenario,expected_error_match",
         [
@@ -961,4 +961,272 @@ async def test_delete_comment_http_error(jira_client, mock_jira_fetcher):
     # Should return error
     assert content["success"] is False
     assert "error" in content
-    assert "Failed to delete comment" in content["error"]
\ No newline at end of file
+    assert "Failed to delete comment" in content["error"]
+
+
+@pytest.mark.anyio
+async def test_create_issue_link_builds_payload(jira_client, mock_jira_fetcher):
+    """Test create_issue_link sends a single link payload to the client."""
+    mock_jira_fetcher.create_issue_link.return_value = {
+        "success": True,
+        "message": "Link created between PROJ-1 and PROJ-2",
+        "link_type": "Blocks",
+        "inward_issue": "PROJ-1",
+        "outward_issue": "PROJ-2",
+    }
+
+    response = await jira_client.call_tool(
+        "jira_create_issue_link",
+        {
+            "inward_issue_key": "PROJ-1",
+            "outward_issue_key": "PROJ-2",
+            "link_type_name": "Blocks",
+            "comment": "Blocking release",
+        },
+    )
+
+    content = json.loads(response[0].text)
+    assert content["success"] is True
+    assert content["link_type"] == "Blocks"
+    mock_jira_fetcher.create_issue_link.assert_called_once_with(
+        {
+            "type": {"name": "Blocks"},
+            "inwardIssue": {"key": "PROJ-1"},
+            "outwardIssue": {"key": "PROJ-2"},
+            "comment": {"body": "Blocking release"},
+        }
+    )
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "status_code,expected_error",
+    [
+        (404, "One or both issues not found"),
+        (403, "Access denied. You may not have permission to link issues."),
+        (401, "Authentication failed. Please check your credentials."),
+    ],
+)
+async def test_create_issue_link_maps_http_errors_from_links_mixin(
+    jira_client, mock_jira_fetcher, status_code, expected_error
+):
+    """Test HTTP errors wrapped by the real LinksMixin are mapped by status code."""
+    from requests import Response
+    from requests.exceptions import HTTPError
+
+    from src.mcp_atlassian.jira.links import LinksMixin
+
+    response = Response()
+    response.status_code = status_code
+    links = LinksMixin.__new__(LinksMixin)
+    links.jira = MagicMock()
+    links.jira.create_issue_link.side_effect = HTTPError(response=response)
+    mock_jira_fetcher.create_issue_link.side_effect = links.create_issue_link
+
+    response = await jira_client.call_tool(
+        "jira_create_issue_link",
+        {
+            "inward_issue_key": "PROJ-1",
+            "outward_issue_key": "PROJ-404",
+            "link_type_name": "Blocks",
+        },
+    )
+
+    content = json.loads(response[0].text)
+    assert content == {"success": False, "error": expected_error}
+
+
+def test_get_status_code_reads_error_response():
+    """Test _get_status_code handles falsy 4xx responses and missing responses."""
+    from requests import Response
+    from requests.exceptions import HTTPError
+
+    from src.mcp_atlassian.servers.jira import _get_status_code
+
+    response = Response()
+    response.status_code = 404
+    assert not response  # 4xx responses are falsy
+    assert _get_status_code(HTTPError(response=response)) == 404
+    assert _get_status_code(HTTPError("no response")) is None
+
+
+@pytest.mark.anyio
+async def test_batch_create_versions_preserves_order(jira_client, mock_jira_fetcher):
+    """Test batch_create_versions returns created versions in input order."""
+    mock_jira_fetcher.create_version.side_effect = lambda **kwargs: {
+        "id": kwargs["name"],
+        "name": kwargs["name"],
+    }
+    versions = [{"project": "PROJ", "name": f"v{i}"} for i in range(12)]
+
+    response = await jira_client.call_tool(
+        "jira_batch_create_versions", {"versions": json.dumps(versions)}
+    )
+
+    content = json.loads(response[0].text)
+    assert content["success"] is True
+    assert [v["name"] for v in content["versions"]] == [f"v{i}" for i in range(12)]
+    assert mock_jira_fetcher.create_version.call_count == 12
+
+
+@pytest.mark.anyio
+async def test_batch_create_versions_reports_failure(jira_client, mock_jira_fetcher):
+    """Test a failing version is reported alongside the versions that were created."""
+
+    def create_version(**kwargs):
+        if kwargs["name"] == "bad":
+            raise ValueError("Version name already exists")
+        return {"name": kwargs["name"]}
+
+    mock_jira_fetcher.create_version.side_effect = create_version
+    versions = [{"project": "PROJ", "name": "good"}, {"project": "PROJ", "name": "bad"}]
+
+    response = await jira_client.call_tool(
+        "jira_batch_create_versions", {"versions": json.dumps(versions)}
+    )
+
+    content = json.loads(response[0].text)
+    assert content["success"] is False
+    assert content["versions"] == [{"name": "good"}]
+    assert content["total"] == 1
+    assert content["errors"] == [
+        {"index": 1, "name": "bad", "error": "Version name already exists"}
+    ]
+
+
+@pytest.mark.anyio
+async def test_batch_create_versions_validates_before_creating(
+    jira_client, mock_jira_fetcher
+):
+    """Test an invalid entry fails the batch before any version is created."""
+    versions = [{"project": "PROJ", "name": "v1"}, {"project": "PROJ"}]
+
+    response = await jira_client.call_tool(
+        "jira_batch_create_versions", {"versions": json.dumps(versions)}
+    )
+
+    content = json.loads(response[0].text)
+    assert content["success"] is False
+    assert "'project' and 'name'" in content["error"]
+    mock_jira_fetcher.create_version.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_batch_create_versions_rejects_malformed_dates(
+    jira_client, mock_jira_fetcher
+):
+    """Test malformed dates are rejected locally without calling Jira."""
+    versions = [
+        {"project": "PROJ", "name": "v1", "start_date": "2024-01-01"},
+        {"project": "PROJ", "name": "v2", "release_date": "01/02/2024"},
+    ]
+
+    response = await jira_client.call_tool(
+        "jira_batch_create_versions", {"versions": json.dumps(versions)}
+    )
+
+    content = json.loads(response[0].text)
+    assert content["success"] is False
+    assert "release_date must be in YYYY-MM-DD format" in content["error"]
+    mock_jira_fetcher.create_version.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_batch_create_versions_empty(jira_client, mock_jira_fetcher):
+    """Test an empty batch returns an empty result without calling Jira."""
+    response = await jira_client.call_tool(
+        "jira_batch_create_versions", {"versions": "[]"}
+    )
+
+    content = json.loads(response[0].text)
+    assert content == {
+        "success": True,
+        "versions": [],
+        "total": 0,
+        "validated_only": False,
+    }
+    mock_jira_fetcher.create_version.assert_not_called()
+
+
+def test_error_response_matches_json_dumps():
+    """Test _error_response renders the same document as json.dumps."""
+    from src.mcp_atlassian.servers.jira import _error_response
+
+    message = 'Field "x" not found — ünïcode'
+    assert _error_response(message, field_id="customfield_1") == json.dumps(
+        {"success": False, "error": message, "field_id": "customfield_1"},
+        indent=2,
+    )
+    assert _error_response("boom") == json.dumps(
+        {"success": False, "error": "boom"}, indent=2
+    )
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "payload, expected_error",
+    [
+        ("[{", "Invalid JSON format for versions data"),
+        ('{"project": "PROJ"}', "Versions data must be an array"),
+        ('[{"project": "PROJ", "name": 1}]', "Invalid version data at 0.name"),
+    ],
+)
+async def test_batch_create_versions_rejects_invalid_payload(
+    jira_client, mock_jira_fetcher, payload, expected_error
+):
+    """Test malformed version payloads are rejected before calling Jira."""
+    response = await jira_client.call_tool(
+        "jira_batch_create_versions", {"versions": payload}
+    )
+
+    content = json.loads(response[0].text)
+    assert content["success"] is False
+    assert expected_error in content["error"]
+    mock_jira_fetcher.create_version.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_get_field_context_options(jira_client, mock_jira_fetcher):
+    """Test get_field_context_options passes stripped ids and shapes the result."""
+    options = MagicMock()
+    options.to_simplified_dict.return_value = {"values": [{"id": "1"}]}
+    options.total = 1
+    mock_jira_fetcher.get_field_context_options.return_value = options
+
+    response = await jira_client.call_tool(
+        "jira_get_field_context_options",
+        {"field_id": " customfield_10001 ", "context_id": "10100"},
+    )
+
+    content = json.loads(response[0].text)
+    assert content["success"] is True
+    assert content["context_id"] == "10100"
+    assert content["field_context_options"] == {"values": [{"id": "1"}]}
+    assert content["total"] == 1
+    mock_jira_fetcher.get_field_context_options.assert_called_once_with(
+        field_id="customfield_10001",
+        context_id="10100",
+        start_at=0,
+        max_results=10000,
+    )
+
+
+@pytest.mark.anyio
+async def test_get_field_options_not_found(jira_client, mock_jira_fetcher):
+    """Test get_field_options maps a 404 to a field-specific error."""
+    from requests.exceptions import HTTPError
+
+    response = MagicMock()
+    response.status_code = 404
+    mock_jira_fetcher.get_field_options.side_effect = HTTPError(response=response)
+
+    result = await jira_client.call_tool(
+        "jira_get_field_options", {"field_id": "customfield_10001"}
+    )
+
+    content = json.loads(result[0].text)
+    assert content == {
+        "success": False,
+        "error": "Field 'customfield_10001' not found or field does not have options",
+        "field_id": "customfield_10001",
+    }
@@ -1,5 +1,6 @@
 """Tests for custom field options functionality."""
 
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -278,11 +279,15 @@ class TestFieldOptionMethods:
         cloud_mixin.config = Mock()
         cloud_mixin.config.is_cloud = True
         cloud_mixin.jira = Mock()
+        cloud_mixin._field_metadata_cache = {}
+        cloud_mixin._metadata_cache_lock = threading.Lock()
 
         server_mixin = Mock(spec=FieldsMixin)
         server_mixin.config = Mock()
         server_mixin.config.is_cloud = False
         server_mixin.jira = Mock()
+        server_mixin._field_metadata_cache = {}
+        server_mixin._metadata_cache_lock = threading.Lock()
 
         # Mock successful API responses
         mock_response = {
@@ -0,0 +1,56 @@
+"""Tests for the concurrency utilities module."""
+
+import threading
+import time
+from functools import partial
+
+import pytest
+
+from mcp_atlassian.utils.concurrency import run_in_threads
+
+
+@pytest.mark.anyio
+async def test_run_in_threads_keeps_input_order():
+    """Test that results come back in input order regardless of finish order."""
+
+    def work(value: int) -> int:
+        time.sleep(0.01 * (5 - value))
+        return value * 10
+
+    results = await run_in_threads([partial(work, i) for i in range(5)], 5)
+
+    assert results == [0, 10, 20, 30, 40]
+
+
+@pytest.mark.anyio
+async def test_run_in_threads_returns_errors_in_place():
+    """Test that a failing call is reported in place without stopping the others."""
+    error = ValueError("boom")
+
+    def fail() -> None:
+        raise error
+
+    results = await run_in_threads([lambda: "a", fail, lambda: "c"], 2)
+
+    assert results == ["a", error, "c"]
+
+
+@pytest.mark.anyio
+async def test_run_in_threads_respects_limit():
+    """Test that no more than ``limit`` calls run at the same time."""
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def work() -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    await run_in_threads([work] * 8, 3)
+
+    assert peak <= 3
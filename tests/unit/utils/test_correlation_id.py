@@ -11,7 +11,12 @@ from starlette.responses import JSONResponse
 
 from mcp_atlassian.servers.main import UserTokenMiddleware
 from mcp_atlassian.utils.decorators import handle_tool_errors
-from mcp_atlassian.utils.logging import log_with_correlation
+from mcp_atlassian.utils.logging import (
+    get_correlation_id,
+    log_with_correlation,
+    reset_correlation_id,
+    set_correlation_id,
+)
 
 
 class TestCorrelationIdTracking:
@@ -34,6 +39,7 @@ class TestCorrelationIdTracking:
         request.headers = {}
         # Create a real state object that can be modified
         from types import SimpleNamespace
+
         request.state = SimpleNamespace()
         return request
 
@@ -60,7 +66,7 @@ class TestCorrelationIdTracking:
         logger.addHandler(stream)
         logger.setLevel(logging.INFO)
 
-        with patch.object(logger, '_log') as mock_log:
+        with patch.object(logger, "_log") as mock_log:
             log_with_correlation(
                 logger, logging.INFO, "Test message", correlation_id="abc123"
             )
@@ -77,7 +83,7 @@ class TestCorrelationIdTracking:
         logger.addHandler(stream)
         logger.setLevel(logging.INFO)
 
-        with patch.object(logger, '_log') as mock_log:
+        with patch.object(logger, "_log") as mock_log:
             log_with_correlation(
                 logger, logging.INFO, "Test message", correlation_id=None
             )
@@ -88,7 +94,9 @@ class TestCorrelationIdTracking:
             assert "correlation_id" not in call_args[1]["extra"]
 
     @pytest.mark.asyncio
-    async def test_middleware_correlation_id_generation(self, middleware, mock_request, mock_call_next):
+    async def test_middleware_correlation_id_generation(
+        self, middleware, mock_request, mock_call_next
+    ):
         """Test that middleware generates correlation ID when not present."""
         # Setup request without correlation ID
         mock_request.headers = {
@@ -109,7 +117,9 @@ class TestCorrelationIdTracking:
         mock_call_next.assert_called_once_with(mock_request)
 
     @pytest.mark.asyncio
-    async def test_middleware_correlation_id_preservation(self, middleware, mock_request, mock_call_next):
+    async def test_middleware_correlation_id_preservation(
+        self, middleware, mock_request, mock_call_next
+    ):
         """Test that middleware preserves existing correlation ID."""
         # Setup request with existing correlation ID header
         existing_correlation_id = "existing123"
@@ -127,9 +137,30 @@ class TestCorrelationIdTracking:
         # Verify the request was processed normally
         mock_call_next.assert_called_once_with(mock_request)
 
+    @pytest.mark.asyncio
+    async def test_middleware_binds_correlation_id_for_request(
+        self, middleware, mock_request
+    ):
+        """Test that the request's correlation ID is bound while it is handled."""
+        mock_request.headers = {
+            "Authorization": "Bearer test-token",
+            "X-Correlation-ID": "bound123",
+        }
+        seen = []
+
+        async def call_next(request):
+            seen.append(get_correlation_id())
+            return JSONResponse({"test": "response"})
+
+        await middleware.dispatch(mock_request, call_next)
+
+        assert seen == ["bound123"]
+        assert get_correlation_id() is None
+
     @pytest.mark.asyncio
     async def test_error_decorator_correlation_id_generation(self, mock_context):
         """Test that error decorator generates correlation ID."""
+
         @handle_tool_errors(default_return_key="test", service_name="TestService")
         async def test_function(ctx: Context):
             raise ValueError("Test error")
@@ -137,6 +168,7 @@ class TestCorrelationIdTracking:
         result = await test_function(mock_context)
 
         import json
+
         error_data = json.loads(result)
 
         # Verify correlation ID was generated and included in error response
@@ -159,12 +191,57 @@ class TestCorrelationIdTracking:
         result = await test_function(mock_context)
 
         import json
+
         error_data = json.loads(result)
 
         # Verify context correlation ID was used
         assert "correlation_id" in error_data
         assert error_data["correlation_id"] == "context123"
 
+    @pytest.mark.asyncio
+    async def test_error_decorator_uses_http_request_correlation_id(self, mock_context):
+        """Test the decorator takes the ID of the HTTP request behind the call.
+
+        In a stateful session the tool runs in a task started from the first
+        request, so the context variable may still hold that request's ID.
+        """
+        mock_context.request_context.request.state.correlation_id = "request2"
+
+        @handle_tool_errors(default_return_key="test", service_name="TestService")
+        async def test_function(ctx: Context):
+            raise ValueError("Test error")
+
+        token = set_correlation_id("request1")
+        try:
+            result = await test_function(mock_context)
+        finally:
+            reset_correlation_id(token)
+
+        import json
+
+        assert json.loads(result)["correlation_id"] == "request2"
+
+    @pytest.mark.asyncio
+    async def test_error_decorator_ignores_inherited_context_correlation_id(
+        self, mock_context
+    ):
+        """Test an ID inherited through the context variable is not reused."""
+        mock_context.request_context.request = None
+
+        @handle_tool_errors(default_return_key="test", service_name="TestService")
+        async def test_function(ctx: Context):
+            raise ValueError("Test error")
+
+        token = set_correlation_id("request1")
+        try:
+            result = await test_function(mock_context)
+        finally:
+            reset_correlation_id(token)
+
+        import json
+
+        assert json.loads(result)["correlation_id"] != "request1"
+
     @pytest.mark.asyncio
     async def test_error_decorator_logging_with_correlation_id(self, mock_context):
         """Test that errors are logged with correlation ID."""
@@ -175,7 +252,7 @@ class TestCorrelationIdTracking:
         async def test_function(ctx: Context):
             raise ValueError("Test error")
 
-        with patch('mcp_atlassian.utils.decorators.logger') as mock_logger:
+        with patch("mcp_atlassian.utils.decorators.logger") as mock_logger:
             await test_function(mock_context)
 
             # Verify logger.error was called with correlation ID
@@ -188,8 +265,11 @@ class TestCorrelationIdTracking:
     @pytest.mark.asyncio
     async def test_concurrent_correlation_id_isolation(self):
         """Test that concurrent operations have isolated correlation IDs."""
+
         @handle_tool_errors(default_return_key="test", service_name="TestService")
-        async def test_function(ctx: Context, correlation_id_override: str | None = None):
+        async def test_function(
+            ctx: Context, correlation_id_override: str | None = None
+        ):
             # Override correlation ID if provided (for testing)
             if correlation_id_override:
                 ctx.request_context.correlation_id = correlation_id_override
@@ -202,6 +282,7 @@ class TestCorrelationIdTracking:
 
             result = await test_function(ctx, override_id)
             import json
+
             return json.loads(result)
 
         # Run multiple concurrent operations with different correlation IDs
@@ -217,12 +298,18 @@ class TestCorrelationIdTracking:
         assert results[2]["correlation_id"] == "thread3"
 
     @pytest.mark.asyncio
-    async def test_correlation_id_persistence_through_multiple_calls(self, mock_context):
+    async def test_correlation_id_persistence_through_multiple_calls(
+        self, mock_context
+    ):
         """Test correlation ID persistence through multiple function calls."""
+
         @handle_tool_errors(default_return_key="test", service_name="TestService")
         async def test_function(ctx: Context):
             import json
-            return json.dumps({"success": True, "correlation_id": ctx.request_context.correlation_id})
+
+            return json.dumps(
+                {"success": True, "correlation_id": ctx.request_context.correlation_id}
+            )
 
         # Set correlation ID in context
         mock_context.request_context.correlation_id = "persistent123"
@@ -233,6 +320,7 @@ class TestCorrelationIdTracking:
         result3 = await test_function(mock_context)
 
         import json
+
         data1 = json.loads(result1)
         data2 = json.loads(result2)
         data3 = json.loads(result3)
@@ -246,6 +334,21 @@ class TestCorrelationIdTracking:
         assert data2["correlation_id"] == "persistent123"
         assert data3["correlation_id"] == "persistent123"
 
+    @pytest.mark.asyncio
+    async def test_get_correlation_id_inside_tool(self, mock_context):
+        """Test the correlation ID is visible through the context variable."""
+        mock_context.request_context.correlation_id = "ctxvar123"
+        seen = []
+
+        @handle_tool_errors(default_return_key="test", service_name="TestService")
+        async def test_function(ctx: Context):
+            seen.append(get_correlation_id())
+            return "ok"
+
+        assert await test_function(mock_context) == "ok"
+        assert seen == ["ctxvar123"]
+        assert get_correlation_id() is None
+
     def test_correlation_id_format_validation(self):
         """Test correlation ID format and validation."""
         from mcp_atlassian.utils.decorators import generate_correlation_id
@@ -263,11 +366,13 @@ class TestCorrelationIdTracking:
         assert len(set(correlation_ids)) == 100  # All should be unique
 
     @pytest.mark.asyncio
-    async def test_middleware_correlation_id_logging(self, middleware, mock_request, mock_call_next):
+    async def test_middleware_correlation_id_logging(
+        self, middleware, mock_request, mock_call_next
+    ):
         """Test that middleware logs correlation ID information."""
         mock_request.headers = {"Authorization": "Bearer test-token"}
 
-        with patch('mcp_atlassian.servers.main.logger') as mock_logger:
+        with patch("mcp_atlassian.servers.main.logger") as mock_logger:
             result = await middleware.dispatch(mock_request, mock_call_next)
 
             # Verify correlation ID was logged (if middleware logs it)
@@ -291,7 +396,7 @@ class TestCorrelationIdTracking:
             lineno=42,
             msg="Test message with correlation ID",
             args=(),
-            exc_info=None
+            exc_info=None,
         )
         record.correlation_id = "test12345"
 
@@ -319,7 +424,7 @@ class TestCorrelationIdTracking:
             lineno=42,
             msg="Test message without correlation ID",
             args=(),
-            exc_info=None
+            exc_info=None,
         )
 
         # Format the record
@@ -328,4 +433,28 @@ class TestCorrelationIdTracking:
 
         # Verify correlation ID is not present when missing
         assert "correlation_id" not in log_entry
-        assert log_entry["message"] == "Test message without correlation ID"
\ No newline at end of file
+        assert log_entry["message"] == "Test message without correlation ID"
+
+
+def test_generated_correlation_ids_are_sequential_and_unique():
+    """Test generated IDs count up from a random start and do not repeat."""
+    from mcp_atlassian.utils.decorators import generate_correlation_id
+
+    ids = [generate_correlation_id() for _ in range(1000)]
+
+    assert len(set(ids)) == len(ids)
+    first = int(ids[0], 16)
+    assert [int(correlation_id, 16) for correlation_id in ids] == [
+        (first + offset) & 0xFFFFFFFF for offset in range(1000)
+    ]
+
+
+def test_generated_correlation_ids_wrap_at_32_bits():
+    """Test the sequence wraps to 00000000 instead of growing past 8 digits."""
+    import itertools
+
+    from mcp_atlassian.utils import decorators
+
+    with patch.object(decorators, "_correlation_sequence", itertools.count(0xFFFFFFFF)):
+        assert decorators.generate_correlation_id() == "ffffffff"
+        assert decorators.generate_correlation_id() == "00000000"
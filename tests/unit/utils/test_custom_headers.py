@@ -173,3 +173,9 @@ class TestParseCustomHeaders:
         result = get_custom_headers("TEST_HEADERS")
         expected = {"X-Multi": "line1\nline2", "X-Tab": "value\twith\ttabs"}
         assert result == expected
+
+    def test_empty_key_with_equals_in_value_is_skipped(self, monkeypatch):
+        """Test that a pair with an empty key is skipped even if its value has '='."""
+        monkeypatch.setenv("TEST_HEADERS", "=a=b,X-Valid=value")
+        result = get_custom_headers("TEST_HEADERS")
+        assert result == {"X-Valid": "value"}
@@ -1,8 +1,15 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
+from requests.exceptions import HTTPError
 
-from mcp_atlassian.utils.decorators import check_write_access
+from mcp_atlassian.utils.decorators import (
+    API_RETRY_BASE_DELAY,
+    API_RETRY_MAX_DELAY,
+    _backoff_delay,
+    check_write_access,
+    handle_atlassian_api_errors,
+)
 
 
 class DummyContext:
@@ -34,3 +41,86 @@ async def test_check_write_access_allows_in_writable():
     ctx = DummyContext(read_only=False)
     result = await dummy_tool(ctx, 4)
     assert result == 8
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("lifespan_context", [{}, None])
+async def test_check_write_access_allows_without_app_context(lifespan_context):
+    @check_write_access("Jira")
+    async def dummy_tool(ctx, x):
+        return x * 2
+
+    ctx = DummyContext(read_only=True)
+    ctx.request_context.lifespan_context = lifespan_context
+    assert await dummy_tool(ctx, 2) == 4
+
+
+def _http_error(status_code, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return HTTPError(f"HTTP {status_code}", response=response)
+
+
+@patch("mcp_atlassian.utils.decorators.time.sleep")
+def test_handle_atlassian_api_errors_retries_rate_limit(mock_sleep):
+    calls = []
+
+    class Client:
+        @handle_atlassian_api_errors("Test API")
+        def fetch(self):
+            calls.append(1)
+            if len(calls) == 1:
+                raise _http_error(429, {"Retry-After": "2"})
+            return ["ok"]
+
+    assert Client().fetch() == ["ok"]
+    assert len(calls) == 2
+    mock_sleep.assert_called_once_with(2.0)
+
+
+@patch("mcp_atlassian.utils.decorators.time.sleep")
+def test_handle_atlassian_api_errors_gives_up_after_attempts(mock_sleep):
+    class Client:
+        @handle_atlassian_api_errors("Test API")
+        def fetch(self):
+            raise _http_error(503)
+
+    with pytest.raises(HTTPError):
+        Client().fetch()
+    assert mock_sleep.call_count == 2
+
+
+@patch("mcp_atlassian.utils.decorators.time.sleep")
+def test_handle_atlassian_api_errors_does_not_retry_client_errors(mock_sleep):
+    calls = []
+
+    class Client:
+        @handle_atlassian_api_errors("Test API")
+        def fetch(self):
+            calls.append(1)
+            raise _http_error(404)
+
+    with pytest.raises(HTTPError):
+        Client().fetch()
+    assert len(calls) == 1
+    mock_sleep.assert_not_called()
+
+
+def test_backoff_delay_honours_retry_after():
+    assert _backoff_delay("7") == 7.0
+    assert _backoff_delay("3600") == API_RETRY_MAX_DELAY
+
+
+def test_backoff_delay_decorrelated_jitter_bounds():
+    for previous in (0.0, 1.0, 4.0, 100.0):
+        delay = _backoff_delay(None, previous)
+        upper = max(API_RETRY_BASE_DELAY, previous) * 3
+        assert API_RETRY_BASE_DELAY <= delay <= min(API_RETRY_MAX_DELAY, upper)
+
+
+def test_backoff_delay_spans_base_to_three_times_previous():
+    with patch("mcp_atlassian.utils.decorators._random", return_value=0.0):
+        assert _backoff_delay(None, 2.0) == API_RETRY_BASE_DELAY
+    with patch("mcp_atlassian.utils.decorators._random", return_value=1.0):
+        assert _backoff_delay(None, 2.0) == 6.0
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from fastmcp import Context
 
 import pytest
+from requests import Response
 from requests.exceptions import HTTPError
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
@@ -220,7 +221,9 @@ class TestHandleToolErrorsDecorator:
     async def test_custom_return_key(self, mock_context):
         """Test that custom return key is used in error responses."""
 
-        @handle_tool_errors(default_return_key="custom_data", service_name="TestService")
+        @handle_tool_errors(
+            default_return_key="custom_data", service_name="TestService"
+        )
         async def test_function(ctx: Context):
             raise ValueError("Test error")
 
@@ -255,7 +258,7 @@ class TestHandleToolErrorsDecorator:
         assert result["tool"] == "custom_function_name"
 
     @pytest.mark.asyncio
-    @patch('mcp_atlassian.utils.decorators.logger')
+    @patch("mcp_atlassian.utils.decorators.logger")
     async def test_logging_with_correlation_id(self, mock_logger, mock_context):
         """Test that errors are logged with correlation ID."""
 
@@ -273,6 +276,35 @@ class TestHandleToolErrorsDecorator:
         assert call_args[1]["extra"]["tool"] == "test_function"
         assert call_args[1]["extra"]["service"] == "TestService"
 
+    @pytest.mark.asyncio
+    async def test_http_error_with_real_response(self, mock_context):
+        """Test status handling with a real (falsy) requests.Response."""
+
+        @handle_tool_errors(default_return_key="test", service_name="TestService")
+        async def test_function(ctx: Context):
+            response = Response()
+            response.status_code = 503
+            raise HTTPError("503 Service Unavailable", response=response)
+
+        result = json.loads(await test_function(mock_context))
+
+        assert result["status_code"] == 503
+        assert result["error"] == "HTTP_503"
+        assert result["message"] == "TestService server error. Please try again later."
+
+    @pytest.mark.asyncio
+    async def test_error_response_is_compact(self, mock_context):
+        """Test error envelopes are serialised without indentation by default."""
+
+        @handle_tool_errors(default_return_key="test", service_name="TestService")
+        async def test_function(ctx: Context):
+            raise RuntimeError("boom")
+
+        result = await test_function(mock_context)
+
+        assert "\n" not in result
+        assert json.loads(result)["error_type"] == "internal"
+
     @pytest.mark.asyncio
     async def test_http_error_detection_with_rate_limit_headers(self, mock_context):
         """Test that rate limiting is detected via headers even without 429 status."""
@@ -288,4 +320,4 @@ class TestHandleToolErrorsDecorator:
         result = json.loads(await test_function(mock_context))
 
         assert result["error_type"] == "rate_limit"
-        assert result["rate_limit_remaining"] == "0"
\ No newline at end of file
+        assert result["rate_limit_remaining"] == "0"
@@ -3,7 +3,7 @@
 import logging
 from unittest.mock import patch
 
-from mcp_atlassian.utils.logging import log_config_param, mask_sensitive
+from mcp_atlassian.utils.logging import LazyMask, log_config_param, mask_sensitive
 
 
 class TestMaskSensitive:
@@ -28,6 +28,12 @@ class TestMaskSensitive:
             == "abcde****************vwxyz"
         )
 
+    def test_long_value(self):
+        """Test masking values longer than the precomputed mask runs."""
+        value = "a" * 150 + "b" * 150 + "cdef"
+        masked = mask_sensitive(value)
+        assert masked == "aaaa" + "*" * 296 + "cdef"
+
 
 class TestLogConfigParam:
     """Test the _log_config_param function."""
@@ -65,3 +71,31 @@ class TestLogConfigParam:
             and "user:pass" not in rec.message
             for rec in caplog.records
         )
+
+    @patch("mcp_atlassian.utils.logging.mask_sensitive")
+    def test_disabled_level_skips_masking(self, mock_mask):
+        """Test that nothing is masked or logged when INFO is disabled."""
+        logger = logging.getLogger("test-disabled-config-logger")
+        logger.setLevel(logging.WARNING)
+        with patch.object(logger, "info") as mock_info:
+            log_config_param(logger, "Jira", "API Token", "secret", sensitive=True)
+        mock_mask.assert_not_called()
+        mock_info.assert_not_called()
+
+
+class TestLazyMask:
+    """Test the LazyMask log argument wrapper."""
+
+    def test_renders_masked_value(self):
+        """Test that str() yields the masked value."""
+        assert str(LazyMask("abcdefghijklmnop")) == "abcd********mnop"
+        assert str(LazyMask("abcdefghijklmnopqrst", 8)) == "abcdefgh****mnopqrst"
+        assert str(LazyMask(None)) == "Not Provided"
+
+    @patch("mcp_atlassian.utils.logging.mask_sensitive")
+    def test_not_masked_when_level_disabled(self, mock_mask):
+        """Test that masking is deferred until the record is rendered."""
+        logger = logging.getLogger("test-lazy-mask-logger")
+        logger.setLevel(logging.INFO)
+        logger.debug("token %s", LazyMask("abcdefghijklmnop"))
+        mock_mask.assert_not_called()
@@ -10,6 +10,8 @@ import pytest
 from mcp_atlassian.utils.metrics import (
     ErrorMetrics,
     HealthChecker,
+    _SystemStats,
+    metrics_endpoint,
     record_error,
     track_errors,
 )
@@ -102,6 +104,17 @@ class TestHealthChecker:
         checker.register_health_check("test", test_check)
         assert "test" in checker._health_checks
         assert checker._health_checks["test"] == test_check
+        assert checker._check_is_async["test"] is False
+
+    def test_register_async_health_check(self):
+        """Test that coroutine checks are recognised at registration."""
+        checker = HealthChecker()
+
+        async def test_check():
+            return {"status": "ok"}
+
+        checker.register_health_check("test", test_check)
+        assert checker._check_is_async["test"] is True
 
     @pytest.mark.asyncio
     async def test_run_health_checks_all_healthy(self):
@@ -163,10 +176,145 @@ class TestHealthChecker:
         assert result["checks"]["async_check"]["status"] == "healthy"
         assert result["checks"]["async_check"]["result"]["async"] is True
 
+    @pytest.mark.asyncio
+    async def test_run_health_checks_concurrently(self):
+        """Test that slow checks overlap and results keep registration order."""
+        checker = HealthChecker(cache_ttl=0)
+        both_started = asyncio.Event()
+        started = []
+
+        async def make_check(name):
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            # Only completes if the other check was started meanwhile
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return {"name": name}
+
+        async def slow_a():
+            return await make_check("slow_a")
+
+        async def slow_b():
+            return await make_check("slow_b")
+
+        checker.register_health_check("first", lambda: {"status": "ok"})
+        checker.register_health_check("slow_a", slow_a)
+        checker.register_health_check("slow_b", slow_b)
+
+        result = await checker.run_health_checks()
+
+        assert list(result["checks"]) == ["first", "slow_a", "slow_b"]
+        assert result["checks"]["slow_a"]["status"] == "healthy"
+        assert result["checks"]["slow_b"]["status"] == "healthy"
+
+    @pytest.mark.asyncio
+    async def test_run_health_checks_reuses_recent_result(self):
+        """Test that probes within the TTL share one run of the checks."""
+        checker = HealthChecker(cache_ttl=60)
+        check = MagicMock(return_value={"status": "ok"})
+        checker.register_health_check("check", check)
+
+        first, second = await asyncio.gather(
+            checker.run_health_checks(), checker.run_health_checks()
+        )
+        third = await checker.run_health_checks()
+
+        assert check.call_count == 1
+        assert first is second is third
+
+    @pytest.mark.asyncio
+    async def test_run_health_checks_refreshes_after_registration(self):
+        """Test that registering a check invalidates the cached result."""
+        checker = HealthChecker(cache_ttl=60)
+        checker.register_health_check("check1", lambda: {"status": "ok"})
+        await checker.run_health_checks()
+
+        checker.register_health_check("check2", lambda: {"status": "ok"})
+        result = await checker.run_health_checks()
+
+        assert set(result["checks"]) == {"check1", "check2"}
+
+    @pytest.mark.asyncio
+    async def test_run_health_checks_without_cache(self):
+        """Test that a zero TTL runs the checks on every call."""
+        checker = HealthChecker(cache_ttl=0)
+        check = MagicMock(return_value={"status": "ok"})
+        checker.register_health_check("check", check)
+
+        await checker.run_health_checks()
+        await checker.run_health_checks()
+
+        assert check.call_count == 2
+
+    def test_get_error_summary_reuses_recent_result(self):
+        """Test that the metrics summary is cached for the TTL."""
+        checker = HealthChecker(cache_ttl=60)
+        first = checker.get_error_summary()
+        checker.metrics.record_error("validation", "Service1")
+
+        assert checker.get_error_summary() is first
+        assert first["total_errors"] == 0
+
+
+class TestSystemStats:
+    """Tests for the sampled psutil system statistics."""
+
+    @pytest.fixture
+    def fake_psutil(self):
+        psutil = MagicMock()
+        psutil.virtual_memory.return_value = MagicMock(
+            total=8 * 1024**3, available=2 * 1024**3, percent=75.0
+        )
+        psutil.disk_usage.return_value = MagicMock(
+            total=100 * 1024**3, free=40 * 1024**3, used=60 * 1024**3
+        )
+        with patch.dict("sys.modules", {"psutil": psutil}):
+            yield psutil
+
+    def test_samples_once_within_ttl(self, fake_psutil):
+        """Test that memory and disk probes share one sample within the TTL."""
+        stats = _SystemStats(ttl=60)
+
+        memory = stats.get_memory()
+        disk = stats.get_disk()
+        stats.get_memory()
+
+        assert memory == {"total_gb": 8.0, "available_gb": 2.0, "percent_used": 75.0}
+        assert disk == {"total_gb": 100.0, "free_gb": 40.0, "percent_used": 60.0}
+        fake_psutil.virtual_memory.assert_called_once()
+        fake_psutil.disk_usage.assert_called_once_with("/")
+
+    def test_resamples_after_ttl(self, fake_psutil):
+        """Test that a zero TTL samples on every probe."""
+        stats = _SystemStats(ttl=0)
+
+        stats.get_memory()
+        stats.get_memory()
+
+        assert fake_psutil.virtual_memory.call_count == 2
+
 
 class TestGlobalFunctions:
     """Tests for global utility functions."""
 
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint_renders_json(self):
+        """Test that the metrics endpoint emits compact JSON of the summary."""
+        summary = {"total_errors": 1, "message": "caf\u00e9", "rate": float("nan")}
+        with patch(
+            "mcp_atlassian.utils.metrics.health_checker.get_error_summary",
+            return_value=summary,
+        ):
+            response = await metrics_endpoint()
+
+        assert response.status_code == 200
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {
+            "total_errors": 1,
+            "message": "caf\u00e9",
+            "rate": None,
+        }
+
     def test_record_error_function(self):
         """Test the global record_error function."""
         with patch('mcp_atlassian.utils.metrics.health_checker') as mock_checker:
@@ -237,7 +385,7 @@ class TestErrorMetricsIntegration:
         metrics = ErrorMetrics()
 
         # Record errors at different times
-        start_time = datetime.now()
+        start_time = datetime.now().astimezone()
         metrics.record_error("validation", "Service1", "tool1", "cor1")
 
         # Wait a bit and record another error
@@ -254,7 +402,88 @@ class TestErrorMetricsIntegration:
             assert "timestamp" in error
             # Should be able to parse the timestamp
             parsed_time = datetime.fromisoformat(error["timestamp"])
-            assert start_time <= parsed_time <= datetime.now()
+            assert parsed_time.tzinfo is not None
+            assert start_time <= parsed_time <= datetime.now().astimezone()
+
+    def test_error_summary_excludes_expired_errors(self):
+        """Test that errors older than max_age drop out of the summary."""
+        metrics = ErrorMetrics(max_age_hours=1)
+
+        with patch("mcp_atlassian.utils.metrics.time.time", return_value=1_000_000.0):
+            metrics.record_error("validation", "Service1", "tool1", "old")
+        with patch("mcp_atlassian.utils.metrics.time.time", return_value=1_003_000.0):
+            metrics.record_error("validation", "Service1", "tool1", "new")
+            summary = metrics.get_error_summary()
+
+        assert summary["total_errors"] == 2
+
+        with patch("mcp_atlassian.utils.metrics.time.time", return_value=1_004_000.0):
+            summary = metrics.get_error_summary()
+
+        assert summary["total_errors"] == 1
+        assert [e["correlation_id"] for e in summary["recent_errors"]] == ["new"]
+
+    def test_error_summary_keeps_last_ten_recent_errors(self):
+        """Test that the summary samples the ten most recent errors in order."""
+        metrics = ErrorMetrics(max_history=15)
+
+        for i in range(20):
+            metrics.record_error("validation", "Service1", f"tool{i}", f"cor{i}")
+
+        summary = metrics.get_error_summary()
+
+        assert summary["total_errors"] == 15
+        assert [e["correlation_id"] for e in summary["recent_errors"]] == [
+            f"cor{i}" for i in range(10, 20)
+        ]
+
+    def test_identical_errors_in_a_burst_are_coalesced(self):
+        """Test that a burst of identical errors shares one record with a count."""
+        metrics = ErrorMetrics()
+
+        with patch("mcp_atlassian.utils.metrics.time.time", return_value=1_000_000.0):
+            for _ in range(5):
+                metrics.record_error("server_error", "Jira", "jira_get_issue", "c1")
+            metrics.record_error("server_error", "Jira", "jira_search", "c2")
+        with patch("mcp_atlassian.utils.metrics.time.time", return_value=1_000_005.0):
+            metrics.record_error("server_error", "Jira", "jira_search", "c3")
+            summary = metrics.get_error_summary()
+
+        assert summary["total_errors"] == 7
+        assert summary["tool_errors"]["jira_get_issue"] == 5
+        assert [(e["correlation_id"], e["count"]) for e in summary["recent_errors"]] == [
+            ("c1", 5),
+            ("c2", 1),
+            ("c3", 1),
+        ]
+
+    def test_evicted_coalesced_record_updates_total(self):
+        """Test that evicting a coalesced record removes all of its errors."""
+        metrics = ErrorMetrics(max_history=2)
+
+        for _ in range(3):
+            metrics.record_error("validation", "Service1", "tool1")
+        metrics.record_error("validation", "Service1", "tool2")
+        metrics.record_error("validation", "Service1", "tool3")
+
+        summary = metrics.get_error_summary()
+
+        assert summary["total_errors"] == 2
+        assert [e["tool"] for e in summary["recent_errors"]] == ["tool2", "tool3"]
+
+    def test_eviction_keeps_columns_aligned(self):
+        """Test that evicting at max_history keeps every column the same length."""
+        metrics = ErrorMetrics(max_history=3)
+
+        for i in range(5):
+            for _ in range(i + 1):
+                metrics.record_error("validation", "Service1", f"tool{i}", f"cor{i}")
+
+        assert {len(column) for column in metrics._columns} == {3}
+        assert list(metrics._tools) == ["tool2", "tool3", "tool4"]
+        assert list(metrics._correlation_ids) == ["cor2", "cor3", "cor4"]
+        assert list(metrics._counts) == [3, 4, 5]
+        assert metrics._recent_total == sum(metrics._counts) == 12
 
     def test_error_metrics_uptime_calculation(self):
         """Test uptime calculation in error metrics."""
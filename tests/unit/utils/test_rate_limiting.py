@@ -3,7 +3,9 @@
 from unittest.mock import MagicMock
 
 import pytest
+from requests import Response
 from requests.exceptions import HTTPError
+from requests.structures import CaseInsensitiveDict
 
 from mcp_atlassian.utils.decorators import is_rate_limit_error
 from mcp_atlassian.utils.retry import is_retryable_error, RetryConfig
@@ -116,7 +118,7 @@ class TestRateLimitingDetection:
         """Test rate limit detection with lowercase headers."""
         response = MagicMock()
         response.status_code = 200
-        response.headers = {"x-ratelimit-remaining": "0"}  # lowercase
+        response.headers = CaseInsensitiveDict({"x-ratelimit-remaining": "0"})
         error = HTTPError("OK", response=response)
 
         assert is_rate_limit_error(error) is True
@@ -139,6 +141,15 @@ class TestRateLimitingDetection:
 
         assert is_rate_limit_error(error) is True
 
+    def test_is_rate_limit_error_with_padded_header_values(self):
+        """Test rate limit detection with whitespace around the header value."""
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {"X-RateLimit-Remaining": " 00 "}
+        error = HTTPError("OK", response=response)
+
+        assert is_rate_limit_error(error) is True
+
     def test_is_rate_limit_error_with_invalid_header_values(self):
         """Test rate limit detection with invalid header values."""
         response = MagicMock()
@@ -157,6 +168,16 @@ class TestRateLimitingDetection:
 
         assert is_rate_limit_error(error) is True
 
+    def test_is_rate_limit_error_with_real_response(self):
+        """Test detection with a real (falsy) requests.Response."""
+        response = Response()
+        response.status_code = 403
+        response.headers["x-ratelimit-remaining"] = "0"
+        error = HTTPError("Forbidden", response=response)
+
+        assert not response  # 4xx responses are falsy
+        assert is_rate_limit_error(error) is True
+
     def test_is_rate_limit_error_with_different_rate_limit_header_names(self):
         """Test detection with various rate limit header names."""
         test_headers = [
@@ -313,6 +334,7 @@ class TestRateLimitingInEnhancedErrorHandling:
 
         assert error_data["error_type"] == "rate_limit"
         assert error_data["retry_after"] == "60"
+        assert error_data["retry_after_suggested"] == 30.0
         assert error_data["rate_limit_remaining"] == "0"
 
     @pytest.mark.asyncio
@@ -338,6 +360,7 @@ class TestRateLimitingInEnhancedErrorHandling:
 
         assert error_data["error_type"] == "rate_limit"
         assert "retry_after" not in error_data
+        assert 0 < error_data["retry_after_suggested"] <= 30.0
         assert error_data["rate_limit_remaining"] == "0"
 
     @pytest.mark.asyncio
@@ -19,6 +19,7 @@ from mcp_atlassian.utils.retry import (
     CONSERVATIVE_RETRY_CONFIG,
     RATE_LIMIT_RETRY_CONFIG,
 )
+from mcp_atlassian.utils.logging import reset_correlation_id, set_correlation_id
 
 
 class TestRetryConfig:
@@ -64,6 +65,15 @@ class TestRetryConfig:
         assert 502 in config.retryable_status_codes
         assert 500 not in config.retryable_status_codes  # Not in custom set
 
+    def test_retry_config_status_codes_are_frozen(self):
+        """Test that the caller's status code set is copied into a frozenset."""
+        custom_codes = {408}
+        config = RetryConfig(retryable_status_codes=custom_codes)
+        custom_codes.add(500)
+
+        assert isinstance(config.retryable_status_codes, frozenset)
+        assert 500 not in config.retryable_status_codes
+
     def test_retry_config_with_custom_retryable_exceptions(self):
         """Test retry config with custom retryable exceptions."""
         custom_exceptions = (TimeoutError, OSError)
@@ -78,6 +88,27 @@ class TestRetryConfig:
 class TestIsRetryableError:
     """Tests for is_retryable_error function."""
 
+    def test_http_error_without_response_not_retryable(self):
+        """Test that an HTTPError is judged by its response, not its base class."""
+        config = RetryConfig()
+
+        assert is_retryable_error(HTTPError("no response"), config) is False
+        assert config.is_retryable(HTTPError("no response")) is False
+
+    def test_config_predicate_matches_function(self):
+        """Test that the config's bound predicate agrees with is_retryable_error."""
+        config = RetryConfig(retryable_status_codes={503})
+        response = MagicMock()
+        response.status_code = 503
+        errors = [
+            HTTPError(response=response),
+            ConnectionError("Connection failed"),
+            ValueError("bad input"),
+        ]
+
+        for error in errors:
+            assert config.is_retryable(error) is is_retryable_error(error, config)
+
     def test_retryable_request_exception(self):
         """Test that RequestException is retryable."""
         error = RequestException("Connection failed")
@@ -179,6 +210,14 @@ class TestCalculateDelay:
         delay = calculate_delay(2, config, "test123")
         assert delay == 50.0
 
+    def test_calculate_delay_beyond_configured_attempts(self):
+        """Test delays for attempts past max_attempts still follow the formula."""
+        config = RetryConfig(max_attempts=2, base_delay=1.0, max_delay=5.0, jitter=False)
+
+        assert calculate_delay(1, config) == 2.0
+        assert calculate_delay(2, config) == 4.0
+        assert calculate_delay(3, config) == 5.0
+
     def test_calculate_delay_with_jitter(self):
         """Test delay calculation with jitter enabled."""
         config = RetryConfig(jitter=True, base_delay=1.0)
@@ -190,6 +229,22 @@ class TestCalculateDelay:
         for delay in delays:
             assert 0.8 <= delay <= 2.2  # Allow 20% jitter
 
+    def test_calculate_delay_jitter_bounds(self):
+        """Test that jitter spans exactly +/-10% of the base delay."""
+        config = RetryConfig(jitter=True, base_delay=1.0)
+
+        with patch("mcp_atlassian.utils.retry._random", return_value=0.0):
+            assert calculate_delay(1, config) == pytest.approx(1.8)
+        with patch("mcp_atlassian.utils.retry._random", return_value=0.5):
+            assert calculate_delay(1, config) == pytest.approx(2.0)
+
+    def test_calculate_delay_negative_base_clamped(self):
+        """Test that a negative base delay never yields a negative delay."""
+        config = RetryConfig(jitter=True, base_delay=-1.0)
+
+        assert calculate_delay(1, config) == 0.0
+        assert calculate_delay(10, config) == 0.0
+
     def test_calculate_delay_negative_delay_handling(self):
         """Test that calculated delay is never negative."""
         config = RetryConfig(jitter=True)
@@ -290,6 +345,22 @@ class TestAsyncRetryWithBackoff:
         assert mock_sleep.call_count == 1
         assert mock_sleep.call_args[0][0] == 0.2  # base_delay * exponential_base^1
 
+    @pytest.mark.asyncio
+    @patch('asyncio.sleep')
+    async def test_tiny_retry_delay_only_yields(self, mock_sleep):
+        """Test that sub-10ms delays yield to the loop rather than arming a timer."""
+        failing_function = AsyncMock(
+            side_effect=[ConnectionError("Connection failed"), "success"]
+        )
+        config = RetryConfig(max_attempts=2, base_delay=0.001, jitter=False)
+
+        result = await async_retry_with_backoff(
+            failing_function, config, correlation_id="test123"
+        )
+
+        assert result == "success"
+        mock_sleep.assert_called_once_with(0)
+
 
 class TestRetryWithBackoffDecorator:
     """Tests for retry_with_backoff decorator."""
@@ -326,6 +397,46 @@ class TestRetryWithBackoffDecorator:
         assert result == "success"
         assert call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_decorator_single_attempt_does_not_retry(self):
+        """Test that a retryable failure is raised when only one attempt is allowed."""
+        failing_function = AsyncMock(side_effect=ConnectionError("Connection failed"))
+
+        @retry_with_backoff(config=RetryConfig(max_attempts=1))
+        async def test_function():
+            return await failing_function()
+
+        with patch("asyncio.sleep") as mock_sleep:
+            with pytest.raises(ConnectionError, match="Connection failed"):
+                await test_function()
+
+        failing_function.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_decorator_uses_bound_correlation_id(self, caplog):
+        """Test that retry logs carry the correlation ID bound to the context."""
+        call_count = 0
+
+        @retry_with_backoff(config=RetryConfig(max_attempts=2, base_delay=0.0))
+        async def test_function():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise ConnectionError("Connection failed")
+            return "success"
+
+        token = set_correlation_id("corr-42")
+        try:
+            with caplog.at_level(logging.INFO, logger="mcp_atlassian.utils.retry"):
+                result = await test_function()
+        finally:
+            reset_correlation_id(token)
+
+        assert result == "success"
+        assert call_count == 2
+        assert any("[corr-42] Retry successful" in r.getMessage() for r in caplog.records)
+
     def test_decorator_sync_function(self):
         """Test decorator on synchronous function."""
         call_count = 0
@@ -3,10 +3,41 @@
 import ssl
 from unittest.mock import MagicMock, patch
 
+import pytest
+from requests import Request
 from requests.adapters import HTTPAdapter
 from requests.sessions import Session
 
-from mcp_atlassian.utils.ssl import SSLIgnoreAdapter, configure_ssl_verification
+from mcp_atlassian.utils.ssl import (
+    SSLIgnoreAdapter,
+    _client_cert_ignore_adapters,
+    _ClientCertAdapter,
+    _get_ignore_adapter,
+    _get_verifying_context,
+    _log_client_cert,
+    _mount_prefixes,
+    _VerifyingAdapter,
+    _warn_ssl_disabled,
+    configure_ssl_verification,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_ssl_caches():
+    """Ensure each test builds its own shared adapter and logs afresh."""
+    caches = (
+        _get_ignore_adapter,
+        _get_verifying_context,
+        _log_client_cert,
+        _warn_ssl_disabled,
+    )
+    for cached in caches:
+        cached.cache_clear()
+    _client_cert_ignore_adapters.clear()
+    yield
+    for cached in caches:
+        cached.cache_clear()
+    _client_cert_ignore_adapters.clear()
 
 
 def test_ssl_ignore_adapter_cert_verify():
@@ -38,8 +69,11 @@ def test_ssl_ignore_adapter_init_poolmanager():
     # Create a mock for PoolManager that will be returned by constructor
     mock_pool_manager = MagicMock()
 
-    # Mock ssl.create_default_context
-    with patch("ssl.create_default_context") as mock_create_context:
+    # Mock ssl.create_default_context, starting without a shared context
+    with (
+        patch("mcp_atlassian.utils.ssl._insecure_ssl_context", None),
+        patch("ssl.create_default_context") as mock_create_context,
+    ):
         mock_context = MagicMock()
         mock_create_context.return_value = mock_context
 
@@ -64,6 +98,19 @@ def test_ssl_ignore_adapter_init_poolmanager():
             assert kwargs["ssl_context"] == mock_context
 
 
+def test_ssl_ignore_adapters_share_one_context():
+    """Test that every SSLIgnoreAdapter reuses the same non-verifying context."""
+    first = SSLIgnoreAdapter()
+    second = SSLIgnoreAdapter()
+
+    first_context = first.poolmanager.connection_pool_kw["ssl_context"]
+    second_context = second.poolmanager.connection_pool_kw["ssl_context"]
+
+    assert first_context is second_context
+    assert first_context.verify_mode == ssl.CERT_NONE
+    assert first_context.check_hostname is False
+
+
 def test_configure_ssl_verification_disabled():
     """Test configure_ssl_verification when SSL verification is disabled."""
     # Arrange
@@ -83,10 +130,10 @@ def test_configure_ssl_verification_disabled():
 
             # Assert
             mock_adapter_class.assert_called_once()
-            # Verify the adapter is mounted for both http and https
-            assert session.mount.call_count == 2
-            session.mount.assert_any_call("https://test.example.com", mock_adapter)
-            session.mount.assert_any_call("http://test.example.com", mock_adapter)
+            # Verify the adapter is mounted for the URL's https scheme only
+            session.mount.assert_called_once_with(
+                "https://test.example.com", mock_adapter
+            )
 
 
 def test_configure_ssl_verification_enabled():
@@ -103,7 +150,8 @@ def test_configure_ssl_verification_enabled():
 
         # Assert
         mock_adapter_class.assert_not_called()
-        assert session.mount.call_count == 0
+        session.mount.assert_called_once()
+        assert isinstance(session.mount.call_args.args[1], _VerifyingAdapter)
 
 
 def test_configure_ssl_verification_enabled_with_real_session():
@@ -119,8 +167,11 @@ def test_configure_ssl_verification_enabled_with_real_session():
         ssl_verify=True,
     )
 
-    # No adapters should be added when SSL verification is enabled
-    assert len(session.adapters) == original_adapters_count
+    # The shared verifying adapter serves the service's domain
+    assert len(session.adapters) == original_adapters_count + 1
+    adapter = session.adapters["https://example.com"]
+    assert isinstance(adapter, _VerifyingAdapter)
+    assert not isinstance(adapter, SSLIgnoreAdapter)
 
 
 def test_configure_ssl_verification_disabled_with_real_session():
@@ -138,12 +189,80 @@ def test_configure_ssl_verification_disabled_with_real_session():
             ssl_verify=False,
         )
 
-        # Should add custom adapters for http and https protocols
-        assert len(session.adapters) == original_adapters_count + 2
+        # Should add a custom adapter for the https scheme only
+        assert len(session.adapters) == original_adapters_count + 1
         assert "https://example.com" in session.adapters
-        assert "http://example.com" in session.adapters
+        assert "http://example.com" not in session.adapters
         assert isinstance(session.adapters["https://example.com"], SSLIgnoreAdapter)
-        assert isinstance(session.adapters["http://example.com"], SSLIgnoreAdapter)
+
+
+def test_configure_ssl_verification_disabled_http_url_mounts_both_schemes():
+    """Test that a plain HTTP service URL also covers redirects to HTTPS."""
+    session = Session()
+
+    with patch("mcp_atlassian.utils.ssl.logger"):
+        configure_ssl_verification(
+            "Test", "http://example.com", session, ssl_verify=False
+        )
+
+    assert isinstance(session.adapters["https://example.com"], SSLIgnoreAdapter)
+    assert isinstance(session.adapters["http://example.com"], SSLIgnoreAdapter)
+
+
+def test_configure_ssl_verification_disabled_reuses_adapter():
+    """Test that sessions share one adapter and reconfiguring does not remount."""
+    first = Session()
+    second = Session()
+
+    with patch("mcp_atlassian.utils.ssl.logger"):
+        configure_ssl_verification(
+            "Test", "https://example.com", first, ssl_verify=False
+        )
+        configure_ssl_verification(
+            "Test", "https://example.com", second, ssl_verify=False
+        )
+
+        adapter = first.adapters["https://example.com"]
+        assert second.adapters["https://example.com"] is adapter
+
+        with patch.object(first, "mount") as mock_mount:
+            configure_ssl_verification(
+                "Test", "https://example.com", first, ssl_verify=False
+            )
+        mock_mount.assert_not_called()
+
+
+def test_configure_ssl_verification_logs_once_per_service():
+    """Test that repeat configuration does not repeat the insecure/mTLS logs."""
+    with patch("mcp_atlassian.utils.ssl.logger") as mock_logger:
+        for _ in range(3):
+            configure_ssl_verification(
+                "Jira",
+                "https://example.com/jira",
+                Session(),
+                ssl_verify=False,
+                client_cert="/path/to/cert.pem",
+                client_key="/path/to/key.pem",
+            )
+        configure_ssl_verification(
+            "Confluence", "https://example.com", Session(), ssl_verify=False
+        )
+
+    assert mock_logger.info.call_count == 1
+    assert [c.args[1:] for c in mock_logger.warning.call_args_list] == [
+        ("Jira", "example.com"),
+        ("Confluence", "example.com"),
+    ]
+
+
+def test_mount_prefixes():
+    """Test that mount prefixes are derived from the URL's network location."""
+    assert _mount_prefixes("https://example.com/wiki?x=1") == ("https://example.com",)
+    assert _mount_prefixes("HTTPS://example.com") == ("https://example.com",)
+    assert _mount_prefixes("http://localhost:8080") == (
+        "https://localhost:8080",
+        "http://localhost:8080",
+    )
 
 
 def test_ssl_ignore_adapter():
@@ -185,7 +304,9 @@ def test_configure_ssl_with_client_cert():
         # Assert
         assert session.cert == ("/path/to/cert.pem", "/path/to/key.pem")
         logger_mock.info.assert_called_once_with(
-            "TestService client certificate authentication configured with cert: /path/to/cert.pem"
+            "%s client certificate authentication configured with cert: %s",
+            "TestService",
+            "/path/to/cert.pem",
         )
 
 
@@ -258,4 +379,206 @@ def test_configure_ssl_disabled_with_client_cert():
             # Assert - Both client cert and SSL adapter should be configured
             assert session.cert == ("/path/to/cert.pem", "/path/to/key.pem")
             mock_adapter_class.assert_called_once()
-            assert session.mount.call_count == 2
+            session.mount.assert_called_once_with("https://example.com", mock_adapter)
+
+
+def test_configure_ssl_preloads_client_cert(tmp_path):
+    """Test that a readable client certificate is loaded once into an adapter."""
+    cert = tmp_path / "cert.pem"
+    key = tmp_path / "key.pem"
+    cert.write_text("cert")
+    key.write_text("key")
+    first = Session()
+    second = Session()
+
+    with (
+        patch("mcp_atlassian.utils.ssl.logger"),
+        patch("mcp_atlassian.utils.ssl.create_urllib3_context") as mock_create,
+    ):
+        for session in (first, second):
+            configure_ssl_verification(
+                "Test",
+                "https://example.com",
+                session,
+                ssl_verify=False,
+                client_cert=str(cert),
+                client_key=str(key),
+            )
+
+    mock_context = mock_create.return_value
+    mock_context.load_cert_chain.assert_called_once_with(
+        certfile=str(cert), keyfile=str(key), password=None
+    )
+    assert mock_context.verify_mode == ssl.CERT_NONE
+    adapter = first.adapters["https://example.com"]
+    assert isinstance(adapter, SSLIgnoreAdapter)
+    assert second.adapters["https://example.com"] is adapter
+    assert adapter.poolmanager.connection_pool_kw["ssl_context"] is mock_context
+    assert first.cert is None
+
+
+def test_configure_ssl_preloads_client_cert_per_verifying_session(tmp_path):
+    """Test that verifying client certificate contexts are not shared."""
+    cert = tmp_path / "cert.pem"
+    key = tmp_path / "key.pem"
+    cert.write_text("cert")
+    key.write_text("key")
+    first = Session()
+    second = Session()
+
+    with (
+        patch("mcp_atlassian.utils.ssl.logger"),
+        patch("mcp_atlassian.utils.ssl.create_urllib3_context") as mock_create,
+    ):
+        for session in (first, second):
+            configure_ssl_verification(
+                "Test",
+                "https://example.com",
+                session,
+                ssl_verify=True,
+                client_cert=str(cert),
+                client_key=str(key),
+            )
+
+    assert mock_create.call_count == 2
+    adapter = first.adapters["https://example.com"]
+    assert isinstance(adapter, _ClientCertAdapter)
+    assert not isinstance(adapter, SSLIgnoreAdapter)
+    assert second.adapters["https://example.com"] is not adapter
+    assert first.cert is None
+
+
+def test_configure_ssl_client_cert_load_failure_falls_back(tmp_path):
+    """Test that an unloadable client certificate is left on the session."""
+    cert = tmp_path / "cert.pem"
+    key = tmp_path / "key.pem"
+    cert.write_text("not a certificate")
+    key.write_text("not a key")
+    session = Session()
+
+    with patch("mcp_atlassian.utils.ssl.logger"):
+        configure_ssl_verification(
+            "Test",
+            "https://example.com",
+            session,
+            ssl_verify=True,
+            client_cert=str(cert),
+            client_key=str(key),
+        )
+
+    assert session.cert == (str(cert), str(key))
+    assert not isinstance(session.adapters["https://example.com"], _ClientCertAdapter)
+
+
+def test_configure_ssl_loads_encrypted_client_key(tmp_path):
+    """Test that the key password is used to load an encrypted client key."""
+    cert = tmp_path / "cert.pem"
+    key = tmp_path / "key.pem"
+    cert.write_text("cert")
+    key.write_text("key")
+    session = Session()
+
+    with (
+        patch("mcp_atlassian.utils.ssl.logger") as mock_logger,
+        patch("mcp_atlassian.utils.ssl.create_urllib3_context") as mock_create,
+    ):
+        configure_ssl_verification(
+            "Test",
+            "https://example.com",
+            session,
+            ssl_verify=True,
+            client_cert=str(cert),
+            client_key=str(key),
+            client_key_password="secret",
+        )
+
+    mock_create.return_value.load_cert_chain.assert_called_once_with(
+        certfile=str(cert), keyfile=str(key), password="secret"
+    )
+    mock_logger.warning.assert_not_called()
+    assert isinstance(session.adapters["https://example.com"], _ClientCertAdapter)
+    assert session.cert is None
+
+
+def test_configure_ssl_client_cert_cache_does_not_keep_password(tmp_path):
+    """Test that the shared client certificate adapter is keyed without the password."""
+    cert = tmp_path / "cert.pem"
+    key = tmp_path / "key.pem"
+    cert.write_text("cert")
+    key.write_text("key")
+    first, second = Session(), Session()
+
+    with patch("mcp_atlassian.utils.ssl.create_urllib3_context") as mock_create:
+        for session in (first, second):
+            configure_ssl_verification(
+                "Test",
+                "https://example.com",
+                session,
+                ssl_verify=False,
+                client_cert=str(cert),
+                client_key=str(key),
+                client_key_password="secret",
+            )
+
+    mock_create.return_value.load_cert_chain.assert_called_once()
+    assert (
+        first.adapters["https://example.com"] is second.adapters["https://example.com"]
+    )
+    assert all("secret" not in cache_key for cache_key in _client_cert_ignore_adapters)
+
+
+def test_verifying_adapter_shares_preloaded_context():
+    """Test that verified HTTPS pools share one context with the CAs loaded."""
+    adapter = _VerifyingAdapter()
+    request = Request("GET", "https://example.com/rest").prepare()
+
+    with patch("mcp_atlassian.utils.ssl.create_urllib3_context") as mock_create:
+        _, first = adapter.build_connection_pool_key_attributes(request, verify=True)
+        _, second = adapter.build_connection_pool_key_attributes(request, verify=True)
+
+    mock_create.assert_called_once()
+    assert first["ssl_context"] is second["ssl_context"] is mock_create.return_value
+    assert "ca_certs" not in first
+
+    conn = MagicMock(conn_kw={"ssl_context": first["ssl_context"]})
+    adapter.cert_verify(conn, "https://example.com/rest", verify=True, cert=None)
+    assert conn.cert_reqs == "CERT_REQUIRED"
+    assert conn.ca_certs is None
+
+
+def test_verifying_adapter_keeps_default_for_client_cert_or_no_verify():
+    """Test that client certificates and verify=False bypass the shared context."""
+    adapter = _VerifyingAdapter()
+    request = Request("GET", "https://example.com/rest").prepare()
+
+    _, with_cert = adapter.build_connection_pool_key_attributes(
+        request, verify=True, cert=("/path/to/cert.pem", "/path/to/key.pem")
+    )
+    _, unverified = adapter.build_connection_pool_key_attributes(request, verify=False)
+
+    assert "ssl_context" not in with_cert
+    assert with_cert["cert_file"] == "/path/to/cert.pem"
+    assert "ssl_context" not in unverified
+    assert unverified["cert_reqs"] == "CERT_NONE"
+
+
+def test_configure_ssl_verification_enabled_keeps_existing_adapter():
+    """Test that an adapter already mounted for the domain is not displaced."""
+    session = Session()
+    existing = HTTPAdapter(max_retries=3)
+    session.mount("https://example.com", existing)
+
+    configure_ssl_verification("Test", "http://example.com", session, ssl_verify=True)
+
+    assert session.adapters["https://example.com"] is existing
+    assert isinstance(session.adapters["http://example.com"], _VerifyingAdapter)
+
+
+def test_configure_ssl_verification_enabled_without_url_is_noop():
+    """Test that verification without a usable URL leaves the session alone."""
+    session = MagicMock()
+
+    configure_ssl_verification("Test", MagicMock(), session, ssl_verify=True)
+    configure_ssl_verification("Test", "", session, ssl_verify=True)
+
+    session.mount.assert_not_called()